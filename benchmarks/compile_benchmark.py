@@ -0,0 +1,44 @@
+# Compares walking an expression tree, as Expression.at() does the first time it evaluates
+# an expression, against evaluating a CompiledExpression. Repeated calls to Expression.at()
+# reuse a cached CompiledExpression, so timing them would time the compiled form twice.
+
+import timeit
+from smoothmath import Point
+from smoothmath.expression import Variable, Constant, Sine, Exponential, Logarithm
+
+
+def build_expression(
+    term_count: int
+):
+    x = Variable("x")
+    y = Variable("y")
+    z = Constant(0)
+    for i in range(term_count):
+        z = z + Constant(i) * Sine(x * y) + Exponential(x) / Logarithm(y + Constant(i + 2))
+    return z
+
+
+def main() -> None:
+    point = Point(x = 0.5, y = 1.5)
+    repetitions = 2000
+    print(f"{'terms':>8} {'tree walk us':>13} {'compile us':>11} {'compiled us':>12} {'speedup':>8}")
+    for term_count in [1, 10, 100]:
+        expression = build_expression(term_count)
+        walk_seconds = timeit.timeit(lambda: expression._walk_at(point), number = repetitions)
+        compile_seconds = timeit.timeit(lambda: expression.compile(), number = repetitions // 10)
+        compiled = expression.compile()
+        compiled_seconds = timeit.timeit(lambda: compiled.at(point), number = repetitions)
+        walk_us = 1e6 * walk_seconds / repetitions
+        compile_us = 1e6 * compile_seconds / (repetitions // 10)
+        compiled_us = 1e6 * compiled_seconds / repetitions
+        print(
+            f"{term_count:>8} {walk_us:>13.1f} {compile_us:>11.1f} {compiled_us:>12.1f} "
+            f"{walk_us / compiled_us:>7.2f}x"
+        )
+    print()
+    print("speedup: of each evaluation by a reused compiled expression over walking the tree.")
+    print("Compiling pays for itself once an expression is evaluated about compile / (walk - compiled) times.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+# Compares calling Expression.at() once per point against Expression.evaluate_batch().
+
+import timeit
+import numpy as np
+from smoothmath import Point
+from smoothmath.expression import Variable, Constant, Sine, Exponential, Logarithm
+
+
+def main() -> None:
+    x = Variable("x")
+    y = Variable("y")
+    expression = Sine(x * y) + Exponential(x) / Logarithm(y + Constant(2))
+    print(f"{'points':>10} {'at() s':>10} {'batch s':>10} {'speedup':>10}")
+    for row_count in [100, 10_000, 100_000]:
+        xs = np.linspace(-1, 1, row_count)
+        ys = np.linspace(0, 3, row_count)
+        points = [Point(x = x, y = y) for x, y in zip(xs, ys)]
+        at_seconds = timeit.timeit(lambda: [expression.at(point) for point in points], number = 1)
+        batch_seconds = timeit.timeit(lambda: expression.evaluate_batch({"x": xs, "y": ys}), number = 1)
+        print(f"{row_count:>10} {at_seconds:>10.4f} {batch_seconds:>10.4f} {at_seconds / batch_seconds:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+# Compares the memory held by an expression and its unnormalized synthetic partials
+# with and without interning. The expression repeats the same subexpressions, built
+# separately each time, as happens when expressions are assembled in a loop.
+
+import gc
+import tracemalloc
+from smoothmath import interning
+from smoothmath.expression import Variable, Constant, Add, Sine, Exponential
+
+
+def build_expression(
+    term_count: int
+):
+    return Add(*(
+        Sine(Variable("x") * Variable("y")) * Exponential(Variable("x") + Constant(i % 3))
+        for i in range(term_count)
+    ))
+
+
+def measure(
+    term_count: int,
+    interned: bool
+) -> int:
+    gc.collect()
+    tracemalloc.start()
+    if interned:
+        with interning():
+            expression = build_expression(term_count)
+            partials = expression._synthetic_partials()
+    else:
+        expression = build_expression(term_count)
+        partials = expression._synthetic_partials()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del expression, partials
+    return current
+
+
+def main() -> None:
+    print(f"{'terms':>8} {'plain KiB':>12} {'interned KiB':>14} {'ratio':>8}")
+    for term_count in [10, 100, 1000]:
+        plain = measure(term_count, interned = False)
+        interned = measure(term_count, interned = True)
+        print(f"{term_count:>8} {plain / 1024:>12.0f} {interned / 1024:>14.0f} {plain / interned:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+# Reports the memory used per expression node, measured with tracemalloc, and compares
+# the nodes with a baseline of nodes keeping the same fields in a __dict__, as they did
+# before they had slots. The baseline nodes are rebuilt from the same expression, so the
+# comparison is reproducible without checking out an older version.
+
+import gc
+import struct
+import sys
+import tracemalloc
+from smoothmath.expression import Variable, Constant, Add, Multiply, Sine, Exponential, NthPower
+from smoothmath._private.base_expression.expression import Expression, _slot_names
+
+
+# These slots serve interning and hashing rather than holding the expression itself.
+BOOKKEEPING_SLOTS = ("_is_interned", "_hash", "__weakref__")
+# Each slot is one pointer in the node, whether or not the slot holds a value.
+POINTER_BYTES = struct.calcsize("P")
+
+
+class DictNode:
+    # A baseline node, holding the fields of an expression node in its __dict__.
+
+    def __init__(
+        self,
+        fields
+    ) -> None:
+        self.__dict__.update(fields)
+
+
+def build_expression(
+    term_count: int
+):
+    # Each term adds 6 nodes.
+    x = Variable("x")
+    y = Variable("y")
+    terms = [
+        Sine(Multiply(x, Constant(i))) + NthPower(Exponential(y), n = 2)
+        for i in range(term_count)
+    ]
+    return Add(*terms)
+
+
+def unique_nodes(
+    expression
+) -> list:
+    seen = set()
+    nodes = []
+    stack = [expression]
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        nodes.append(node)
+        stack.extend(node._subexpressions())
+    return nodes
+
+
+def build_baseline(
+    expression,
+    mirrors: dict
+) -> DictNode:
+    # Mirrors each node with a DictNode sharing the same field values, except that
+    # references to inner expressions point at their mirrors.
+    mirror = mirrors.get(id(expression), None)
+    if mirror is not None:
+        return mirror
+    fields = {}
+    for name in _slot_names(type(expression)):
+        value = getattr(expression, name)
+        if isinstance(value, Expression):
+            value = build_baseline(value, mirrors)
+        elif isinstance(value, list):
+            value = [build_baseline(inner, mirrors) for inner in value]
+        fields[name] = value
+    mirror = DictNode(fields)
+    mirrors[id(expression)] = mirror
+    return mirror
+
+
+def slotted_node_bytes(
+    node
+) -> int:
+    return sys.getsizeof(node)
+
+
+def baseline_node_bytes(
+    mirror
+) -> int:
+    # The __dict__ belongs to the node, but a list of inner expressions is counted
+    # separately, as it is for the slotted nodes.
+    return sys.getsizeof(mirror) + sys.getsizeof(mirror.__dict__)
+
+
+def report_slots() -> None:
+    print(f"{'node class':>12} {'slots':>6} {'node bytes':>11} {'bookkeeping bytes':>18}")
+    x = Variable("x")
+    for node in [x, Constant(2), Sine(x), NthPower(x, n = 2), Multiply(x, x), Add(x, x, x)]:
+        cls = type(node)
+        slot_count = len(_slot_names(cls)) + 1 # __weakref__ is a slot too
+        bookkeeping_bytes = POINTER_BYTES * len(BOOKKEEPING_SLOTS)
+        print(f"{cls.__name__:>12} {slot_count:>6} {sys.getsizeof(node):>11} {bookkeeping_bytes:>18}")
+    print()
+
+
+def measure_baseline(
+    expression
+) -> tuple[int, int]:
+    # Only the baseline nodes are alive when measuring, held by the baseline root.
+    gc.collect()
+    tracemalloc.start()
+    mirrors = {}
+    baseline = build_baseline(expression, mirrors)
+    baseline_bytes = sum(baseline_node_bytes(mirror) for mirror in mirrors.values())
+    del mirrors
+    gc.collect()
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del baseline
+    return (allocated, baseline_bytes)
+
+
+def main() -> None:
+    report_slots()
+    print(
+        f"{'terms':>8} {'nodes':>9} {'bytes per node':>15} {'slotted node':>13} "
+        f"{'baseline node':>14} {'baseline bytes per node':>24}"
+    )
+    for term_count in [1000, 10000, 100000]:
+        gc.collect()
+        tracemalloc.start()
+        expression = build_expression(term_count)
+        allocated, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        nodes = unique_nodes(expression)
+        node_count = len(nodes)
+        slotted_bytes = sum(slotted_node_bytes(node) for node in nodes)
+        baseline_allocated, baseline_bytes = measure_baseline(expression)
+        print(
+            f"{term_count:>8} {node_count:>9} {allocated / node_count:>15.1f} "
+            f"{slotted_bytes / node_count:>13.1f} {baseline_bytes / node_count:>14.1f} "
+            f"{baseline_allocated / node_count:>24.1f}"
+        )
+    print()
+    print("bytes per node: everything allocated while building the expression, divided by the number of nodes")
+    print("slotted node, baseline node: the node objects themselves, counting every slot including the")
+    print("  bookkeeping slots above, and a baseline node's __dict__")
+    print("baseline bytes per node: everything allocated for the baseline nodes, which share the")
+    print("  expression's field values, so it counts only what storing the fields costs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+# Shows how computing the local partials of a product scales with its number of factors,
+# comparing prefix and suffix products against multiplying the other factors for each one.
+
+import timeit
+import smoothmath._private.math_functions as mf
+import smoothmath._private.utilities as util
+from smoothmath.expression import Variable, Multiply
+
+
+def products_of_others(
+    values: list[float]
+) -> list[float]:
+    # The straightforward O(n^2) approach.
+    return [
+        mf.multiply(*util.list_without_entry_at(values, i))
+        for i in range(len(values))
+    ]
+
+
+def main() -> None:
+    print(f"{'factors':>8} {'prefix/suffix us':>17} {'us per factor':>14} {'quadratic us':>13}")
+    for factor_count in [10, 100, 1000, 3000]:
+        product = Multiply(*(Variable(f"x{i}") for i in range(factor_count)))
+        values = [1.0 + 1e-4 * i for i in range(factor_count)]
+        repetitions = max(1, 20000 // factor_count)
+        seconds = timeit.timeit(lambda: product._local_partials(0, values), number = repetitions)
+        quadratic_seconds = timeit.timeit(lambda: products_of_others(values), number = repetitions)
+        us = 1e6 * seconds / repetitions
+        quadratic_us = 1e6 * quadratic_seconds / repetitions
+        print(f"{factor_count:>8} {us:>17.1f} {us / factor_count:>14.3f} {quadratic_us:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
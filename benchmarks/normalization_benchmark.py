@@ -0,0 +1,48 @@
+# Reports the time and reduction work needed to normalize synthetic partials, both
+# with an empty normalization cache and again once the cache holds the results.
+
+import time
+from smoothmath.expression import Variable, Constant, Sine, Exponential, Logarithm
+from smoothmath import clear_normalization_cache, normalization_cache_info
+from smoothmath._private.reduction import ReductionStatistics
+
+
+def build_expression(
+    term_count: int
+):
+    x = Variable("x")
+    y = Variable("y")
+    z = Constant(0)
+    for i in range(term_count):
+        z = z + Constant(i) * Sine(x * y) + Exponential(x) / Logarithm(y + Constant(i + 2))
+    return z
+
+
+def main() -> None:
+    print(
+        f"{'terms':>8} {'ms':>10} {'steps':>8} {'rebuilds':>9} {'visits':>8} " +
+        f"{'cached ms':>10} {'hits':>8}"
+    )
+    for term_count in [1, 10, 100, 300]:
+        clear_normalization_cache()
+        partial = build_expression(term_count)._synthetic_partial("x")
+        statistics = ReductionStatistics()
+        start = time.perf_counter()
+        partial._normalize(statistics)
+        milliseconds = 1e3 * (time.perf_counter() - start)
+        # A structurally equal partial built from scratch finds its results cached.
+        partial = build_expression(term_count)._synthetic_partial("x")
+        hits_before = normalization_cache_info().hits
+        start = time.perf_counter()
+        partial._normalize()
+        cached_milliseconds = 1e3 * (time.perf_counter() - start)
+        hits = normalization_cache_info().hits - hits_before
+        print(
+            f"{term_count:>8} {milliseconds:>10.1f} {statistics.steps:>8} " +
+            f"{statistics.rebuilds:>9} {statistics.visits:>8} " +
+            f"{cached_milliseconds:>10.1f} {hits:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+# Compares evaluating a compiled expression at points with coordinates looked up by name
+# against packed points, whose coordinates are read by slot index.
+
+import timeit
+from smoothmath import Point, VariableLayout
+from smoothmath.expression import Variable, Add, Multiply
+
+
+def main() -> None:
+    print(f"{'variables':>10} {'Point us':>9} {'PackedPoint us':>15}")
+    for variable_count in [2, 10, 100, 1000]:
+        variables = [Variable(f"x{i}") for i in range(variable_count)]
+        expression = Add(*(Multiply(variable, variable) for variable in variables))
+        compiled = expression.compile()
+        point = Point(**{variable.name: 1.0 + i for i, variable in enumerate(variables)})
+        layout = VariableLayout(variable.name for variable in variables)
+        packed_point = layout.pack(point)
+        compiled.at(packed_point)
+        repetitions = max(1, 100000 // variable_count)
+        seconds = timeit.timeit(lambda: compiled.at(point), number = repetitions)
+        packed_seconds = timeit.timeit(lambda: compiled.at(packed_point), number = repetitions)
+        us = 1e6 * seconds / repetitions
+        packed_us = 1e6 * packed_seconds / repetitions
+        print(f"{variable_count:>10} {us:>9.1f} {packed_us:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,28 @@
+# Compares evaluating a differential at a list of points, including building the points,
+# against evaluating it once at a PointBatch wrapping the same numpy columns.
+
+import timeit
+import numpy as np
+from smoothmath import Point, PointBatch, Differential
+from smoothmath.expression import Variable, Constant, Sine, Exponential, Logarithm
+
+
+def main() -> None:
+    x = Variable("x")
+    y = Variable("y")
+    differential = Differential(Sine(x * y) + Exponential(x) / Logarithm(y + Constant(2)))
+    differential.at(PointBatch(x = [0.0], y = [1.0]))
+    print(f"{'points':>10} {'Points s':>10} {'PointBatch s':>13} {'speedup':>10}")
+    for row_count in [100, 10_000, 100_000]:
+        xs = np.linspace(-1, 1, row_count)
+        ys = np.linspace(0, 3, row_count)
+        points_seconds = timeit.timeit(
+            lambda: [differential.at(Point(x = x, y = y)) for x, y in zip(xs, ys)],
+            number = 1
+        )
+        batch_seconds = timeit.timeit(lambda: differential.at(PointBatch(x = xs, y = ys)), number = 1)
+        print(f"{row_count:>10} {points_seconds:>10.4f} {batch_seconds:>13.4f} {points_seconds / batch_seconds:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# Shows that streaming evaluation holds a fixed amount of memory however many points
+# there are, comparing its peak memory with building every Point and calling at().
+
+import time
+import tracemalloc
+from smoothmath import Point
+from smoothmath.expression import Variable, Constant, Sine, Exponential, Logarithm
+
+
+def generate_points(
+    count: int
+):
+    for n in range(count):
+        yield Point(x = n / count, y = 1 + n / count)
+
+
+def measure(
+    evaluate
+) -> tuple[float, float]:
+    tracemalloc.start()
+    start = time.perf_counter()
+    evaluate()
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (seconds, peak / 1e6)
+
+
+def main() -> None:
+    x = Variable("x")
+    y = Variable("y")
+    expression = Sine(x * y) + Exponential(x) / Logarithm(y + Constant(2))
+    expression.at(Point(x = 0, y = 1))
+    print(f"{'points':>10} {'at() s':>8} {'at() peak MB':>13} {'stream s':>9} {'stream peak MB':>15}")
+    for count in [10_000, 100_000, 400_000]:
+        def evaluate_each() -> None:
+            points = list(generate_points(count))
+            total = 0.0
+            for point in points:
+                total += expression.at(point)
+        def evaluate_stream() -> None:
+            total = 0.0
+            for values in expression.stream(generate_points(count), chunk_size = 4096):
+                total += float(values.sum())
+        at_seconds, at_peak = measure(evaluate_each)
+        stream_seconds, stream_peak = measure(evaluate_stream)
+        print(f"{count:>10} {at_seconds:>8.2f} {at_peak:>13.1f} {stream_seconds:>9.2f} {stream_peak:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,20 +4,42 @@ import smoothmath.expression
 
 from smoothmath._private.errors import DomainError, CoordinateMissing
 from smoothmath._private.point import Point
+from smoothmath._private.packed_point import VariableLayout, PackedPoint, PackedPoints
+from smoothmath._private.point_batch import PointBatch
 from smoothmath._private.base_expression.expression import Expression
 from smoothmath._private.derivative import Derivative
 from smoothmath._private.differential import Differential
 from smoothmath._private.partial import Partial
 from smoothmath._private.located_differential import LocatedDifferential
+from smoothmath._private.jacobian import Jacobian
+from smoothmath._private.hessian import Hessian
+from smoothmath._private.compiled_expression import CompiledExpression
+from smoothmath._private.interning import interning
+from smoothmath._private.normalization_cache import (
+    normalization_cache_info,
+    set_normalization_cache_size,
+    clear_normalization_cache
+)
 
 
 __all__ = [
     "DomainError",
     "CoordinateMissing",
     "Point",
+    "VariableLayout",
+    "PackedPoint",
+    "PackedPoints",
+    "PointBatch",
     "Expression",
     "Derivative",
     "Differential",
     "Partial",
     "LocatedDifferential",
+    "Jacobian",
+    "Hessian",
+    "CompiledExpression",
+    "interning",
+    "normalization_cache_info",
+    "set_normalization_cache_size",
+    "clear_normalization_cache",
 ]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 from typing import TYPE_CHECKING, Iterable
+from array import array
 import smoothmath._private.expression.variable as va
 import smoothmath._private.expression as ex
 if TYPE_CHECKING:
@@ -7,39 +8,83 @@ if TYPE_CHECKING:
     from smoothmath.expression import Variable
 
 
-class NumericPartialsAccumulator:
+class VariableIndex:
+    """
+    Numbers variable names 0, 1, 2, ... in sorted order.
+    """
+
     def __init__(
-        self: NumericPartialsAccumulator
+        self: VariableIndex,
+        variable_names: Iterable[str]
     ) -> None:
-        self._numeric_partials: dict[str, float]
-        self._numeric_partials = {}
+        self.names: list[str]
+        self.names = sorted(set(variable_names))
+        self._index_by_name: dict[str, int]
+        self._index_by_name = { name: i for i, name in enumerate(self.names) }
 
-    def add_to(
-        self: NumericPartialsAccumulator,
-        variable: Variable | str,
+    def index_of(
+        self: VariableIndex,
+        variable: Variable | str
+    ) -> int:
+        return self._index_by_name[va.get_variable_name(variable)]
+
+    def __len__(
+        self: VariableIndex
+    ) -> int:
+        return len(self.names)
+
+
+class IndexedPartialsAccumulator:
+    """
+    Accumulates numeric partials into a preallocated buffer, addressed by the indices
+    of a VariableIndex rather than by variable name.
+    """
+
+    def __init__(
+        self: IndexedPartialsAccumulator,
+        variable_index: VariableIndex
+    ) -> None:
+        self._variable_index: VariableIndex
+        self._variable_index = variable_index
+        self.buffer: array[float]
+        self.buffer = array("d", bytes(8 * len(variable_index)))
+
+    def add_at(
+        self: IndexedPartialsAccumulator,
+        index: int,
         contribution: float
     ) -> None:
-        variable_name = va.get_variable_name(variable)
-        existing = self._numeric_partials.get(variable_name, 0)
-        self._numeric_partials[variable_name] = existing + contribution
+        self.buffer[index] += contribution
 
     def numeric_partials_for(
-        self: NumericPartialsAccumulator,
+        self: IndexedPartialsAccumulator,
         variable_names: Iterable[str]
     ) -> dict[str, float]:
-        results: dict[str, float]
-        results = {}
-        for variable_name in variable_names:
-            results[variable_name] = self._numeric_partials.get(variable_name, 0)
-        return results
+        buffer = self.buffer
+        index_of = self._variable_index.index_of
+        return { variable_name: buffer[index_of(variable_name)] for variable_name in variable_names }
+
+    def sparse(
+        self: IndexedPartialsAccumulator
+    ) -> tuple[array[int], array[float]]:
+        # The indices and values of the nonzero partials.
+        indices = array("q")
+        values = array("d")
+        for index, value in enumerate(self.buffer):
+            if value != 0:
+                indices.append(index)
+                values.append(value)
+        return (indices, values)
 
 
 class SyntheticPartialsAccumulator:
     def __init__(
         self: SyntheticPartialsAccumulator,
     ) -> None:
-        self._synthetic_partials: dict[str, Expression]
-        self._synthetic_partials = {}
+        # Contributions are summed once at the end, rather than each new contribution
+        # wrapping the running sum in another Add.
+        self._contributions: dict[str, list[Expression]]
+        self._contributions = {}
 
     def add_to(
         self: SyntheticPartialsAccumulator,
@@ -47,9 +92,7 @@ class SyntheticPartialsAccumulator:
         contribution: Expression
     ) -> None:
         variable_name = va.get_variable_name(variable)
-        existing = self._synthetic_partials.get(variable_name, None)
-        next = existing + contribution if existing is not None else contribution
-        self._synthetic_partials[variable_name] = next
+        self._contributions.setdefault(variable_name, []).append(contribution)
 
     def synthetic_partials_for(
         self: SyntheticPartialsAccumulator,
@@ -58,9 +101,11 @@ class SyntheticPartialsAccumulator:
         results: dict[str, Expression]
         results = {}
         for variable_name in variable_names:
-            optional = self._synthetic_partials.get(variable_name, None)
-            if optional is None:
+            contributions = self._contributions.get(variable_name, [])
+            if len(contributions) == 0:
                 results[variable_name] = ex.Constant(0)
+            elif len(contributions) == 1:
+                (results[variable_name],) = contributions
             else:
-                results[variable_name] = optional
+                results[variable_name] = ex.Add(*contributions)
         return results
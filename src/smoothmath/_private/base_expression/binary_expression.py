@@ -1,13 +1,22 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any, Callable, Optional
+from typing import TYPE_CHECKING, Any
 from abc import abstractmethod
 import smoothmath._private.base_expression as base
+import smoothmath._private.base_expression.expression as be
 import smoothmath._private.utilities as util
+import smoothmath._private.vectorized_math_functions as vmf
+import smoothmath._private.math_functions as mf
 if TYPE_CHECKING:
     from smoothmath import Point, Expression
+    from smoothmath._private.compiled_expression import Step, VectorizedStep, MaskedVectorizedStep
+    from smoothmath._private.columns import Columns
+    from smoothmath._private.batch_masks import BatchMasks
+    from smoothmath._private.vectorized_math_functions import Array
 
 
 class BinaryExpression(base.Expression):
+    __slots__ = ("_left", "_right")
+
     def __init__(
         self: BinaryExpression,
         left: Expression,
@@ -17,14 +26,12 @@ class BinaryExpression(base.Expression):
             raise Exception(f"Expressions must be composed of Expressions, found: {left}")
         if not isinstance(right, base.Expression):
             raise Exception(f"Expressions must be composed of Expressions, found: {right}")
-        variable_names = left._variable_names.union(right._variable_names)
+        variable_names = be.union_of_variable_names(left._variable_names, right._variable_names)
         super().__init__(variable_names)
         self._left: Expression
         self._left = left
         self._right: Expression
         self._right = right
-        self._value: Optional[float]
-        self._value = None
 
     def _rebuild(
         self: BinaryExpression,
@@ -33,26 +40,17 @@ class BinaryExpression(base.Expression):
     ) -> BinaryExpression:
         return self.__class__(left, right)
 
-    ## Evaluation ##
+    def _interning_key(
+        self: BinaryExpression
+    ) -> tuple[Any, ...]:
+        return (self.__class__, id(self._left), id(self._right))
 
-    def _reset_evaluation_cache(
+    def _subexpressions(
         self: BinaryExpression
-    ) -> None:
-        self._value = None
-        self._left._reset_evaluation_cache()
-        self._right._reset_evaluation_cache()
+    ) -> list[Expression]:
+        return [self._left, self._right]
 
-    def _evaluate(
-        self: BinaryExpression,
-        point: Point
-    ) -> float:
-        if self._value is not None:
-            return self._value
-        left_value = self._left._evaluate(point)
-        right_value = self._right._evaluate(point)
-        self._verify_domain_constraints(left_value, right_value)
-        self._value = self._value_formula(left_value, right_value)
-        return self._value
+    ## Evaluation ##
 
     @abstractmethod
     def _verify_domain_constraints(
@@ -70,66 +68,157 @@ class BinaryExpression(base.Expression):
     ) -> float:
         raise Exception("Concrete classes derived from BinaryExpression must implement _value_formula()")
 
-    ## Normalization and Reduction ##
+    def _value_from_inners(
+        self: BinaryExpression,
+        inner_values: list[float],
+        point: Point
+    ) -> float:
+        (left_value, right_value) = inner_values
+        self._verify_domain_constraints(left_value, right_value)
+        return self._value_formula(left_value, right_value)
+
+    def _compile_step(
+        self: BinaryExpression,
+        inner_indices: tuple[int, ...]
+    ) -> Step:
+        (left_index, right_index) = inner_indices
+        verify_domain_constraints = self._verify_domain_constraints
+        value_formula = self._value_formula
+        def step(
+            values: list[float],
+            point: Point
+        ) -> float:
+            left_value = values[left_index]
+            right_value = values[right_index]
+            verify_domain_constraints(left_value, right_value)
+            return value_formula(left_value, right_value)
+        return step
+
+    def _vectorized_step(
+        self: BinaryExpression,
+        inner_indices: tuple[int, ...]
+    ) -> VectorizedStep:
+        (left_index, right_index) = inner_indices
+        domain_violations = self._vectorized_domain_violations
+        value_formula = self._vectorized_value_formula
+        def step(
+            values: list[Array],
+            columns: Columns
+        ) -> Array:
+            left_values = values[left_index]
+            right_values = values[right_index]
+            vmf.verify_no_violations(domain_violations(left_values, right_values))
+            return value_formula(left_values, right_values)
+        return step
+
+    def _masked_vectorized_step(
+        self: BinaryExpression,
+        inner_indices: tuple[int, ...]
+    ) -> MaskedVectorizedStep:
+        (left_index, right_index) = inner_indices
+        domain_violations = self._vectorized_domain_violations
+        value_formula = self._vectorized_value_formula
+        def step(
+            values: list[Array],
+            columns: Columns,
+            masks: BatchMasks
+        ) -> Array:
+            (left_values, right_values) = masks.checked_inner_values(
+                self, domain_violations, [values[left_index], values[right_index]]
+            )
+            return value_formula(left_values, right_values)
+        return step
 
-    def _take_reduction_step(
-        self: BinaryExpression
-    ) -> Expression:
-        if self._is_fully_reduced:
-            return self
-        consolidated = self._consolidate_expression_lacking_variables()
-        if consolidated is not None:
-            return consolidated
-        if not self._left._is_fully_reduced:
-            reduced_left = self._left._take_reduction_step()
-            return self._rebuild(reduced_left, self._right)
-        if not self._right._is_fully_reduced:
-            reduced_right = self._right._take_reduction_step()
-            return self._rebuild(self._left, reduced_right)
-        for reducer in self._reducers:
-            reduced = reducer()
-            if reduced is not None:
-                return reduced
-        self._is_fully_reduced = True
-        return self
-
-    @property
     @abstractmethod
-    def _reducers(
-        self: BinaryExpression
-    ) -> list[Callable[[], Optional[Expression]]]:
-        raise Exception("Concrete classes derived from BinaryExpression must implement _reducers()")
+    def _vectorized_domain_violations(
+        self: BinaryExpression,
+        left_values: Array,
+        right_values: Array
+    ) -> list[tuple[str, Array]]:
+        # Returns a message and a mask of the rows breaking it, for each domain rule.
+        raise Exception("Concrete classes derived from BinaryExpression must implement _vectorized_domain_violations()")
+
+    @abstractmethod
+    def _vectorized_value_formula(
+        self: BinaryExpression,
+        left_values: Array,
+        right_values: Array
+    ) -> Array:
+        raise Exception("Concrete classes derived from BinaryExpression must implement _vectorized_value_formula()")
+
+    ## Partials ##
+
+    def _local_partials(
+        self: BinaryExpression,
+        value: float,
+        inner_values: list[float]
+    ) -> list[float]:
+        (left_value, right_value) = inner_values
+        return [
+            self._local_partial_formula_left(left_value, right_value, value),
+            self._local_partial_formula_right(left_value, right_value, value)
+        ]
+
+    def _local_partial_tangents(
+        self: BinaryExpression,
+        value: float,
+        inner_values: list[float],
+        inner_tangents: list[float]
+    ) -> list[float]:
+        (left_value, right_value) = inner_values
+        (left_tangent, right_tangent) = inner_tangents
+        if left_tangent == 0 and right_tangent == 0:
+            return [0.0, 0.0]
+        (left_left, left_right, right_right) = self._local_second_partial_formulas(left_value, right_value, value)
+        return [
+            mf.add(mf.multiply(left_left, left_tangent), mf.multiply(left_right, right_tangent)),
+            mf.add(mf.multiply(left_right, left_tangent), mf.multiply(right_right, right_tangent))
+        ]
+
+    @abstractmethod
+    def _local_partial_formula_left(
+        self: BinaryExpression,
+        left_value: float,
+        right_value: float,
+        value: float
+    ) -> float:
+        raise Exception("Concrete classes derived from BinaryExpression must implement _local_partial_formula_left()")
+
+    @abstractmethod
+    def _local_partial_formula_right(
+        self: BinaryExpression,
+        left_value: float,
+        right_value: float,
+        value: float
+    ) -> float:
+        raise Exception("Concrete classes derived from BinaryExpression must implement _local_partial_formula_right()")
+
+    @abstractmethod
+    def _local_second_partial_formulas(
+        self: BinaryExpression,
+        left_value: float,
+        right_value: float,
+        value: float
+    ) -> tuple[float, float, float]:
+        # The second partials with respect to (left, left), (left, right) and (right, right).
+        raise Exception("Concrete classes derived from BinaryExpression must implement _local_second_partial_formulas()")
+
+    ## Normalization and Reduction ##
 
     def _normalize_fully_reduced(
-        self: BinaryExpression
+        self: BinaryExpression,
+        normalized_inners: list[Expression]
     ) -> Expression:
-        normalized_left = self._left._normalize_fully_reduced()
-        normalized_right = self._right._normalize_fully_reduced()
-        return self._rebuild(normalized_left, normalized_right)
+        return self._rebuild(*normalized_inners)
 
     ## Operations ##
 
-    def __eq__(
-        self: BinaryExpression,
-        other: Any
-    ) -> bool:
-        return (
-            (other.__class__ == self.__class__) and
-            (other._left == self._left) and
-            (other._right == self._right)
-        )
+    def _string_pieces(
+        self: BinaryExpression
+    ) -> list[str]:
+        return [f"{util.get_class_name(self)}(", ", ", ")"]
 
-    def __hash__(
+    def _structural_hash(
         self: BinaryExpression
     ) -> int:
         return hash((util.get_class_name(self), self._left, self._right))
-
-    def __str__(
-        self: BinaryExpression
-    ) -> str:
-        return f"{util.get_class_name(self)}({self._left}, {self._right})"
-
-    def __repr__(
-        self: BinaryExpression
-    ) -> str:
-        return f"{util.get_class_name(self)}({self._left}, {self._right})"
@@ -1,41 +1,82 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any, Optional
-from abc import ABC, abstractmethod
-import logging
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Mapping, Optional
+from abc import ABC, ABCMeta, abstractmethod
+import functools
 import smoothmath._private.errors as er
 import smoothmath._private.point as pt
+import smoothmath._private.point_batch as pb
 import smoothmath._private.expression as ex
 import smoothmath._private.accumulators as acc
 import smoothmath._private.utilities as util
+import smoothmath._private.compiled_expression as ce
+import smoothmath._private.evaluation_cache as ec
+import smoothmath._private.parallel as pl
+import smoothmath._private.vectorized_math_functions as vmf
+import smoothmath._private.interning as it
+import smoothmath._private.traversal as tr
+import smoothmath._private.reduction as rd
+import smoothmath._private.normalization_cache as nc
+import smoothmath._private.located_differential as ld
+import smoothmath._private.linearization as li
+import smoothmath._private.streaming as st
 if TYPE_CHECKING:
-    from smoothmath import Point
+    from smoothmath import Point, PointBatch, CompiledExpression, LocatedDifferential
     from smoothmath.expression import (
         Add, Minus, Negation, Multiply, Divide, Power, NthPower
     )
-    from smoothmath._private.accumulators import (
-        NumericPartialsAccumulator, SyntheticPartialsAccumulator
-    )
-
-
-REDUCTION_STEPS_BOUND = 1000
+    from smoothmath._private.compiled_expression import Step, VectorizedStep, MaskedVectorizedStep
+    from smoothmath._private.columns import Columns
+    from smoothmath._private.batch_masks import BatchMasks, MaskedValues
+    from smoothmath._private.vectorized_math_functions import Array
+    from smoothmath._private.tape import Tape
+    from smoothmath._private.reduction import ReductionStatistics
+
+
+class ExpressionMeta(ABCMeta):
+    # Finishes constructing an expression once its __init__() has set all of its fields.
+    def __call__(
+        cls,
+        *args: Any,
+        **kwargs: Any
+    ) -> Any:
+        expression = super().__call__(*args, **kwargs)
+        expression._hash = expression._structural_hash()
+        if it.is_interning():
+            return it.intern(expression)
+        return expression
 
 
-class Expression(ABC):
+class Expression(ABC, metaclass = ExpressionMeta):
     """
     An abstract base class for all expresssions.
     See the :mod:`smoothmath.expression` module for concrete expression classes.
     """
 
+    # Expressions are numerous, so they keep their fields in slots rather than a __dict__.
+    # Slots also make room for the weak references used by interning.
+    __slots__ = (
+        "_variable_names",
+        "_is_fully_reduced",
+        "_evaluation_failed",
+        "_is_interned",
+        "_hash",
+        "__weakref__"
+    )
+
     def __init__(
         self: Expression,
-        variable_names: set[str]
+        variable_names: frozenset[str]
     ) -> None:
-        self._variable_names: set[str]
+        self._variable_names: frozenset[str]
         self._variable_names = variable_names
         self._is_fully_reduced: bool
         self._is_fully_reduced = False
         self._evaluation_failed: bool
         self._evaluation_failed = False
+        self._is_interned: bool
+        self._is_interned = False
+        self._hash: int
+        self._hash = 0 # the actual hash is set once construction finishes
 
     @abstractmethod
     def _rebuild(
@@ -43,122 +84,409 @@ class Expression(ABC):
     ) -> Expression:
         raise Exception("Concrete classes derived from Expression must implement _rebuild()")
 
+    @abstractmethod
+    def _interning_key(
+        self: Expression
+    ) -> tuple[Any, ...]:
+        raise Exception("Concrete classes derived from Expression must implement _interning_key()")
+
+    @abstractmethod
+    def _structural_hash(
+        self: Expression
+    ) -> int:
+        # Inner expressions have already computed their hashes, so this doesn't recurse.
+        raise Exception("Concrete classes derived from Expression must implement _structural_hash()")
+
+    def __reduce__(
+        self: Expression
+    ) -> tuple[Any, ...]:
+        # Pickles the expression as a flat list of its nodes, so that pickling a deep
+        # expression doesn't exhaust the Python call stack.
+        return (_from_flattened, (_flattened(self),))
+
+    @abstractmethod
+    def _subexpressions(
+        self: Expression
+    ) -> list[Expression]:
+        raise Exception("Concrete classes derived from Expression must implement _subexpressions()")
+
     ## Evaluation ##
 
     def at(
         self: Expression,
-        point: Point | float
-    ) -> float:
+        point: Point | PointBatch | float
+    ) -> float | Array:
         """
         Evaluates the expression at a point.
 
         Will raise an exception if the point parameter is a float and the expression has more
         than one variable.
 
+        At a :class:`PointBatch`, evaluates at all of its points at once, giving a numpy array
+        of values. See :meth:`evaluate_batch`.
+
+        An expression may be evaluated from several threads at once.
+
+        The first evaluation at a point walks the expression. Evaluating it, or an equal
+        expression, again compiles it and keeps the compiled form in a bounded cache of
+        recently used expressions, so repeated evaluation is faster while building an
+        expression to evaluate it once stays cheap. Use :meth:`compile` to keep a compiled
+        form regardless of the cache.
+
         :param point: where to evaluate
         """
-        if isinstance(point, pt.Point):
-            self._reset_evaluation_cache()
-            return self._evaluate(point)
-        else: # point is a float
+        if not isinstance(point, pb.PointBatch):
+            compiled = ec.compiled_expression_if_reused(self)
+            if compiled is None:
+                return self._walk_at(point)
+        return self._compiled_expression().at(point)
+
+    def _walk_at(
+        self: Expression,
+        point: Point | float
+    ) -> float:
+        # Evaluates by walking the expression once, which is cheaper than compiling it.
+        # The nodes are evaluated in the compiled order, so the same DomainError is raised.
+        if not isinstance(point, pt.Point):
             exception_message = "Can only evaluate using a number for an expression with one variable. Consider passing a Point() instead."
             variable_name = get_the_single_variable_name(self, exception_message)
             point = pt.point_on_number_line(variable_name, point)
-            self._reset_evaluation_cache()
-            return self._evaluate(point)
+        return tr.fold(self, lambda node, inner_values: node._value_from_inners(inner_values, point))
 
     @abstractmethod
-    def _reset_evaluation_cache(
+    def _value_from_inners(
+        self: Expression,
+        inner_values: list[float],
+        point: Point
+    ) -> float:
+        # Returns the value of this expression, given the values of its inner expressions.
+        raise Exception("Concrete classes derived from Expression must implement _value_from_inners()")
+
+    def value_and_gradient(
+        self: Expression,
+        point: Point | float
+    ) -> tuple[float, LocatedDifferential]:
+        """
+        Evaluates the expression and its differential at a point, in a single pass
+        forward and back through the expression.
+
+        >>> from smoothmath import Point
+        >>> from smoothmath.expression import Variable
+        >>> x = Variable("x")
+        >>> y = Variable("y")
+        >>> value, gradient = (x * y).value_and_gradient(Point(x=2, y=3))
+        >>> value
+        6.0
+        >>> gradient.component(x), gradient.component(y)
+        (3.0, 2.0)
+
+        Will raise an exception if the point parameter is a float and the expression has more
+        than one variable.
+
+        :param point: where to evaluate
+        """
+        if not isinstance(point, pt.Point):
+            exception_message = "Can only evaluate using a number for an expression with one variable. Consider passing a Point() instead."
+            variable_name = get_the_single_variable_name(self, exception_message)
+            point = pt.point_on_number_line(variable_name, point)
+        value, numeric_partials = self._partials_tape().value_and_numeric_partials(point)
+        _private = { "numeric_partials": numeric_partials }
+        return (value, ld.LocatedDifferential(self, point, _private = _private))
+
+    def at_many(
+        self: Expression,
+        points: Iterable[Point],
+        workers: Optional[int] = None,
+        columnar: bool = False
+    ) -> list[float] | Array:
+        """
+        Evaluates the expression at many points, spreading the work over a pool of processes.
+
+        >>> from smoothmath import Point
+        >>> from smoothmath.expression import Variable
+        >>> x = Variable("x")
+        >>> y = Variable("y")
+        >>> (x * y).at_many([Point(x=1, y=2), Point(x=3, y=4)], workers=1)
+        [2.0, 12.0]
+
+        Each worker process receives the expression once. The values come back in the
+        same order as the points.
+
+        :param points: where to evaluate
+        :param workers: how many processes to use; defaults to the number of CPUs, and 1 evaluates in this process
+        :param columnar: whether to return the values as a numpy array rather than a list
+        """
+        values = pl.evaluate_many(self.at, points, workers)
+        return vmf.as_column(values) if columnar else values
+
+    def stream(
+        self: Expression,
+        points: Iterable[Point],
+        chunk_size: int = st.DEFAULT_CHUNK_SIZE
+    ) -> Iterator[Array]:
+        """
+        Evaluates the expression at a stream of points, a chunk at a time.
+
+        >>> from smoothmath import Point
+        >>> from smoothmath.expression import Variable
+        >>> x = Variable("x")
+        >>> points = (Point(x=n) for n in range(5))
+        >>> [values.tolist() for values in (x * x).stream(points, chunk_size=2)]
+        [[0.0, 1.0], [4.0, 9.0], [16.0]]
+
+        Points are taken from the iterable only as they are needed, and each chunk is
+        evaluated at once, as a :class:`PointBatch`. This yields a numpy array of values for
+        each chunk, so memory use does not grow with the number of points. Requires numpy.
+
+        :param points: where to evaluate; the points should all have the same coordinate names
+        :param chunk_size: how many points to evaluate at once
+        """
+        for batch in st.batches_of(points, chunk_size):
+            yield self.at(batch) # type: ignore
+
+    def _compiled_expression(
         self: Expression
-    ) -> None:
-        raise Exception("Concrete classes derived from Expression must implement _reset_evaluation_cache()")
+    ) -> CompiledExpression:
+        return ec.compiled_expression_for(self)
+
+    def compile(
+        self: Expression
+    ) -> CompiledExpression:
+        """
+        Compiles the expression for fast repeated evaluation.
+
+        >>> from smoothmath.expression import Variable, Constant
+        >>> compiled = (Constant(2) * Variable("x") + Constant(4)).compile()
+        >>> compiled.at(3)
+        10.0
+        """
+        return ce.CompiledExpression(self)
 
     @abstractmethod
-    def _evaluate(
+    def _compile_step(
         self: Expression,
-        point: Point
-    ) -> float:
-        raise Exception("Concrete classes derived from Expression must implement _evaluate()")
+        inner_indices: tuple[int, ...]
+    ) -> Step:
+        raise Exception("Concrete classes derived from Expression must implement _compile_step()")
 
-    ## Partials ##
+    def evaluate_batch(
+        self: Expression,
+        columns: Mapping[str, Any] | PointBatch,
+        masked: bool = False
+    ) -> Array | MaskedValues:
+        """
+        Evaluates the expression at many points at once.
+
+        Each node of the expression is evaluated once over whole arrays, so this is much
+        faster than calling :meth:`at` for each point. Requires numpy.
+
+        >>> from smoothmath.expression import Variable
+        >>> x = Variable("x")
+        >>> y = Variable("y")
+        >>> (x * y).evaluate_batch({"x": [1, 2, 3], "y": [4, 5, 6]})
+        array([ 4., 10., 18.])
+
+        Raises :exc:`~smoothmath.DomainError` if the expression is undefined at any of the points.
+        Alternatively, with ``masked=True``, no DomainError is raised. The result is then a
+        named tuple of four fields: ``values``, which is nan wherever the expression is undefined;
+        a boolean ``valid`` mask; ``error_codes``, which are 0 for valid rows; and ``errors``,
+        where code ``k`` refers to ``errors[k - 1]``, a pair of the subexpression and the
+        message for the domain rule which failed.
+
+        >>> from smoothmath.expression import Logarithm
+        >>> result = Logarithm(x).evaluate_batch({"x": [1, 0, -1]}, masked=True)
+        >>> result.values
+        array([ 0., nan, nan])
+        >>> result.valid
+        array([ True, False, False])
+        >>> result.error_codes
+        array([0, 1, 2], dtype=int32)
+        >>> expression, message = result.errors[1]
+        >>> message
+        'Logarithm(x) is undefined for x < 0'
+
+        :param columns: for each variable name, an array of coordinates, or a :class:`PointBatch`
+        :param masked: whether to mark rows where the expression is undefined rather than raising
+        """
+        return self._compiled_expression().evaluate_batch(columns, masked = masked)
 
     @abstractmethod
+    def _vectorized_step(
+        self: Expression,
+        inner_indices: tuple[int, ...]
+    ) -> VectorizedStep:
+        raise Exception("Concrete classes derived from Expression must implement _vectorized_step()")
+
+    def _masked_vectorized_step(
+        self: Expression,
+        inner_indices: tuple[int, ...]
+    ) -> MaskedVectorizedStep:
+        # Expressions with inner expressions override this to record domain violations
+        # in the masks. Other expressions have no domain rules, so they need no masks.
+        vectorized_step = self._vectorized_step(inner_indices)
+        def step(
+            values: list[Array],
+            columns: Columns,
+            masks: BatchMasks
+        ) -> Array:
+            return vectorized_step(values, columns)
+        return step
+
+    ## Partials ##
+
     def _numeric_partial(
         self: Expression,
         variable_name: str,
         point: Point
     ) -> float:
-        raise Exception("Concrete classes derived from Expression must implement _numeric_partial()")
+        # One forward sweep along the variable gives just this partial, which is cheaper
+        # than a backward sweep giving every partial.
+        if variable_name not in self._variable_names:
+            # The forward sweep would also check for DomainErrors.
+            self.at(point)
+            return 0
+        _, numeric_partial = self._partials_tape().value_and_partial(point, variable_name)
+        return numeric_partial
 
-    @abstractmethod
     def _synthetic_partial(
         self: Expression,
         variable_name: str
     ) -> Expression:
-        raise Exception("Concrete classes derived from Expression must implement _synthetic_partial()")
+        return tr.fold(
+            self,
+            lambda node, inner_partials: node._synthetic_partial_from_inners(variable_name, inner_partials)
+        )
+
+    @abstractmethod
+    def _synthetic_partial_from_inners(
+        self: Expression,
+        variable_name: str,
+        inner_partials: list[Expression]
+    ) -> Expression:
+        # Returns the synthetic partial of this expression, given the synthetic partials
+        # of its inner expressions.
+        raise Exception("Concrete classes derived from Expression must implement _synthetic_partial_from_inners()")
 
     def _numeric_partials(
         self: Expression,
         point: Point
     ) -> dict[str, float]:
-        accumulator = acc.NumericPartialsAccumulator()
-        self._reset_evaluation_cache()
-        self._compute_numeric_partials(accumulator, 1, point)
-        return accumulator.numeric_partials_for(self._variable_names)
+        _, numeric_partials = self._partials_tape().value_and_numeric_partials(point)
+        return numeric_partials
+
+    def _directional_derivative(
+        self: Expression,
+        point: Point,
+        direction: Point
+    ) -> float:
+        _, directional_derivative = self._partials_tape().value_and_directional_derivative(point, direction)
+        return directional_derivative
+
+    def _partials_tape(
+        self: Expression
+    ) -> Tape:
+        return ec.tape_for(self)
 
     @abstractmethod
-    def _compute_numeric_partials(
+    def _local_partials(
         self: Expression,
-        accumulator: NumericPartialsAccumulator,
-        multiplier: float,
-        point: Point
-    ) -> None: # instead of returning a value, we mutate the accumulator argument
-        raise Exception("Concrete classes derived from Expression must implement _compute_numeric_partials()")
+        value: float,
+        inner_values: list[float]
+    ) -> list[float]:
+        # Returns the partial of this expression with respect to each of its inner
+        # expressions, given the values of the inner expressions and of this expression.
+        raise Exception("Concrete classes derived from Expression must implement _local_partials()")
+
+    @abstractmethod
+    def _local_partial_tangents(
+        self: Expression,
+        value: float,
+        inner_values: list[float],
+        inner_tangents: list[float]
+    ) -> list[float]:
+        # Returns the rate of change of each of the local partials along a direction,
+        # given the rate of change (the tangent) of each inner expression.
+        raise Exception("Concrete classes derived from Expression must implement _local_partial_tangents()")
+
+    @abstractmethod
+    def _taylor_coefficients(
+        self: Expression,
+        value: float,
+        inner_coefficients: list[list[float]],
+        order: int
+    ) -> list[float]:
+        # Returns the Taylor coefficients of this expression up to the given order, given
+        # those of its inner expressions and the value of this expression.
+        raise Exception("Concrete classes derived from Expression must implement _taylor_coefficients()")
 
     def _synthetic_partials(
         self: Expression
     ) -> dict[str, Expression]:
         accumulator = acc.SyntheticPartialsAccumulator()
-        self._compute_synthetic_partials(accumulator, ex.Constant(1))
+        # We pass multipliers through the linearized expression in reverse, so each
+        # node's contributions are combined once before being passed on. Every inner
+        # expression's multiplier then refers to that combined multiplier rather than
+        # copying it, and the synthetic partials share their common subexpressions.
+        linearization = li.linearize(self)
+        contributions: list[list[Expression]]
+        contributions = [[] for _ in linearization.nodes]
+        (output_index,) = linearization.output_indices
+        contributions[output_index].append(ex.Constant(1))
+        for i in range(output_index, -1, -1):
+            node_contributions = contributions[i]
+            if not node_contributions:
+                continue
+            if len(node_contributions) == 1:
+                (multiplier,) = node_contributions
+            else:
+                multiplier = ex.Add(*node_contributions)
+            node = linearization.nodes[i]
+            if isinstance(node, ex.Variable):
+                accumulator.add_to(node, multiplier)
+                continue
+            next_multipliers = node._synthetic_multipliers(multiplier)
+            for inner_index, next_multiplier in zip(linearization.inner_indices[i], next_multipliers):
+                contributions[inner_index].append(next_multiplier)
         return accumulator.synthetic_partials_for(self._variable_names)
 
     @abstractmethod
-    def _compute_synthetic_partials(
+    def _synthetic_multipliers(
         self: Expression,
-        accumulator: SyntheticPartialsAccumulator,
         multiplier: Expression
-    ) -> None: # instead of returning a value, we mutate the accumulator argument
-        raise Exception("Concrete classes derived from Expression must implement _compute_synthetic_partials()")
+    ) -> list[Expression]:
+        # Given what the partial of this expression gets multiplied by, returns what the
+        # partial of each of its inner expressions gets multiplied by.
+        raise Exception("Concrete classes derived from Expression must implement _synthetic_multipliers()")
 
     ## Normalization and Reduction ##
 
     def _normalize(
-        self: Expression
+        self: Expression,
+        statistics: Optional[ReductionStatistics] = None
     ) -> Expression:
         """
         Reduces and normalizes an expression.
         """
-        fully_reduced = self._fully_reduce()
-        normalized = fully_reduced._normalize_fully_reduced()
+        fully_reduced = self._fully_reduce(statistics)
+        normalized = tr.fold(
+            fully_reduced,
+            _normalize_node,
+            lambda node: nc.lookup(nc.NORMALIZED, node)
+        )
         return normalized
 
     def _fully_reduce(
-        self: Expression
+        self: Expression,
+        statistics: Optional[ReductionStatistics] = None
     ) -> Expression:
-        expression = self
-        for _ in range(0, REDUCTION_STEPS_BOUND):
-            if expression._is_fully_reduced:
-                return expression
-            expression = expression._take_reduction_step()
-        logging.warning(f"Unable to fully reduce within {REDUCTION_STEPS_BOUND} steps")
-        expression._is_fully_reduced = True
-        return expression
+        return rd.fully_reduce(self, statistics)
 
+    @property
     @abstractmethod
-    def _take_reduction_step(
+    def _reducers(
         self: Expression
-    ) -> Expression:
-        raise Exception("Concrete classes derived from Expression must implement _take_reduction_step()")
+    ) -> list[Callable[[], Optional[Expression]]]:
+        raise Exception("Concrete classes derived from Expression must implement _reducers()")
 
     def _consolidate_expression_lacking_variables(
         self: Expression
@@ -170,7 +498,9 @@ class Expression(ABC):
         if self._evaluation_failed:
             return None
         try:
-            value = self.at(pt.Point())
+            # This expression is often a temporary one built during reduction, so we
+            # compile it without caching the compiled expression.
+            value = ce.CompiledExpression(self).at(pt.Point())
             return ex.Constant(value)
         except er.DomainError:
             self._evaluation_failed = True
@@ -178,12 +508,50 @@ class Expression(ABC):
 
     @abstractmethod
     def _normalize_fully_reduced(
-        self: Expression
+        self: Expression,
+        normalized_inners: list[Expression]
     ) -> Expression:
+        # Normalizes this fully reduced expression, given its normalized inner expressions.
         raise Exception("Concrete classes derived from Expression must implement _normalize_fully_reduced()")
 
     ## Operations ##
 
+    def __eq__(
+        self: Expression,
+        other: Any
+    ) -> bool:
+        return tr.structurally_equal(self, other)
+
+    def __hash__(
+        self: Expression
+    ) -> int:
+        return self._hash
+
+    def _same_parameters(
+        self: Expression,
+        other: Expression
+    ) -> bool:
+        # Compares whatever distinguishes two expressions of the same class, other than
+        # their inner expressions.
+        return True
+
+    def __str__(
+        self: Expression
+    ) -> str:
+        return tr.to_string(self)
+
+    def __repr__(
+        self: Expression
+    ) -> str:
+        return tr.to_string(self)
+
+    @abstractmethod
+    def _string_pieces(
+        self: Expression
+    ) -> list[str]:
+        # Returns the strings which go around the strings of the inner expressions.
+        raise Exception("Concrete classes derived from Expression must implement _string_pieces()")
+
     def __neg__(
         self: Expression
     ) -> Negation:
@@ -233,6 +601,94 @@ class Expression(ABC):
         raise Exception(f"Expected exponent to be an Expression or int, found: {exponent}")
 
 
+def _normalize_node(
+    node: Expression,
+    normalized_inners: list[Expression]
+) -> Expression:
+    normalized = node._normalize_fully_reduced(normalized_inners)
+    nc.remember(nc.NORMALIZED, node, normalized)
+    return normalized
+
+
+def union_of_variable_names(
+    *all_variable_names: frozenset[str]
+) -> frozenset[str]:
+    # Reuses one of the given sets when it contains all of the others, as is common, so
+    # that parent expressions share their variable names with an inner expression.
+    if not all_variable_names:
+        return frozenset()
+    largest = max(all_variable_names, key = len)
+    if all(variable_names <= largest for variable_names in all_variable_names):
+        return largest
+    return largest.union(*all_variable_names)
+
+
+def _flattened(
+    expression: Expression
+) -> list[tuple[type, dict[str, Any], dict[str, Any]]]:
+    # Lists each node after its inner expressions, as its class, the values of its other
+    # slots, and the positions of its inner expressions in the list.
+    entries: list[tuple[type, dict[str, Any], dict[str, Any]]]
+    entries = []
+    positions: dict[int, int]
+    positions = {}
+    def flatten_node(
+        node: Expression,
+        inner_positions: list[int]
+    ) -> int:
+        state = {}
+        inner_slots = {}
+        for name in _slot_names(node.__class__):
+            value = getattr(node, name)
+            if isinstance(value, Expression):
+                inner_slots[name] = positions[id(value)]
+            elif isinstance(value, list):
+                inner_slots[name] = [positions[id(inner)] for inner in value]
+            else:
+                state[name] = value
+        # A copy is not the canonical instance, and hashes of strings vary between
+        # processes, so the hash is recomputed.
+        state["_is_interned"] = False
+        del state["_hash"]
+        positions[id(node)] = len(entries)
+        entries.append((node.__class__, state, inner_slots))
+        return positions[id(node)]
+    tr.fold(expression, flatten_node)
+    return entries
+
+
+def _from_flattened(
+    entries: list[tuple[type, dict[str, Any], dict[str, Any]]]
+) -> Expression:
+    nodes: list[Expression]
+    nodes = []
+    for cls, state, inner_slots in entries:
+        node = cls.__new__(cls)
+        for name, value in state.items():
+            setattr(node, name, value)
+        for name, position in inner_slots.items():
+            if isinstance(position, list):
+                setattr(node, name, [nodes[i] for i in position])
+            else:
+                setattr(node, name, nodes[position])
+        # Inner expressions come first, so their hashes are already set.
+        node._hash = node._structural_hash()
+        nodes.append(node)
+    return nodes[-1]
+
+
+@functools.cache
+def _slot_names(
+    cls: type
+) -> tuple[str, ...]:
+    return tuple(
+        name
+        for klass in cls.__mro__
+        for name in getattr(klass, "__slots__", ())
+        if name != "__weakref__"
+    )
+
+
 def get_the_single_variable_name(
     expression: Expression,
     exception_message: str
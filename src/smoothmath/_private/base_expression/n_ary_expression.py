@@ -1,13 +1,21 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any, Callable, Optional
+from typing import TYPE_CHECKING, Any
 from abc import abstractmethod
 import smoothmath._private.base_expression as base
+import smoothmath._private.base_expression.expression as be
 import smoothmath._private.utilities as util
+import smoothmath._private.vectorized_math_functions as vmf
 if TYPE_CHECKING:
     from smoothmath import Point, Expression
+    from smoothmath._private.compiled_expression import Step, VectorizedStep, MaskedVectorizedStep
+    from smoothmath._private.columns import Columns
+    from smoothmath._private.batch_masks import BatchMasks
+    from smoothmath._private.vectorized_math_functions import Array
 
 
 class NAryExpression(base.Expression):
+    __slots__ = ("_inners",)
+
     def __init__(
         self: NAryExpression,
         *args: Expression
@@ -15,12 +23,10 @@ class NAryExpression(base.Expression):
         for inner in args:
             if not isinstance(inner, base.Expression):
                 raise Exception(f"Expressions must be composed of Expressions, found: {inner}")
-        variable_names = set().union(*(inner._variable_names for inner in args))
+        variable_names = be.union_of_variable_names(*(inner._variable_names for inner in args))
         super().__init__(variable_names)
         self._inners: list[Expression]
         self._inners = list(args)
-        self._value: Optional[float]
-        self._value = None
 
     def _rebuild(
         self: NAryExpression,
@@ -28,25 +34,17 @@ class NAryExpression(base.Expression):
     ) -> NAryExpression:
         return self.__class__(*args)
 
-    ## Evaluation ##
+    def _interning_key(
+        self: NAryExpression
+    ) -> tuple[Any, ...]:
+        return (self.__class__, tuple(id(inner) for inner in self._inners))
 
-    def _reset_evaluation_cache(
+    def _subexpressions(
         self: NAryExpression
-    ) -> None:
-        self._value = None
-        for inner in self._inners:
-            inner._reset_evaluation_cache()
+    ) -> list[Expression]:
+        return self._inners
 
-    def _evaluate(
-        self: NAryExpression,
-        point: Point
-    ) -> float:
-        if self._value is not None:
-            return self._value
-        inner_values = [inner._evaluate(point) for inner in self._inners]
-        self._verify_domain_constraints(*inner_values)
-        self._value = self._value_formula(*inner_values)
-        return self._value
+    ## Evaluation ##
 
     @abstractmethod
     def _verify_domain_constraints(
@@ -62,72 +60,93 @@ class NAryExpression(base.Expression):
     ) -> float:
         raise Exception("Concrete classes derived from NAryExpression must implement _value_formula()")
 
-    ## Normalization and Reduction ##
+    def _value_from_inners(
+        self: NAryExpression,
+        inner_values: list[float],
+        point: Point
+    ) -> float:
+        self._verify_domain_constraints(*inner_values)
+        return self._value_formula(*inner_values)
+
+    def _compile_step(
+        self: NAryExpression,
+        inner_indices: tuple[int, ...]
+    ) -> Step:
+        verify_domain_constraints = self._verify_domain_constraints
+        value_formula = self._value_formula
+        def step(
+            values: list[float],
+            point: Point
+        ) -> float:
+            inner_values = [values[i] for i in inner_indices]
+            verify_domain_constraints(*inner_values)
+            return value_formula(*inner_values)
+        return step
+
+    def _vectorized_step(
+        self: NAryExpression,
+        inner_indices: tuple[int, ...]
+    ) -> VectorizedStep:
+        domain_violations = self._vectorized_domain_violations
+        value_formula = self._vectorized_value_formula
+        def step(
+            values: list[Array],
+            columns: Columns
+        ) -> Array:
+            inner_values = [values[i] for i in inner_indices]
+            vmf.verify_no_violations(domain_violations(*inner_values))
+            return value_formula(*inner_values)
+        return step
+
+    def _masked_vectorized_step(
+        self: NAryExpression,
+        inner_indices: tuple[int, ...]
+    ) -> MaskedVectorizedStep:
+        domain_violations = self._vectorized_domain_violations
+        value_formula = self._vectorized_value_formula
+        def step(
+            values: list[Array],
+            columns: Columns,
+            masks: BatchMasks
+        ) -> Array:
+            inner_values = masks.checked_inner_values(self, domain_violations, [values[i] for i in inner_indices])
+            return value_formula(*inner_values)
+        return step
 
-    def _take_reduction_step(
-        self: NAryExpression
-    ) -> Expression:
-        if self._is_fully_reduced:
-            return self
-        consolidated = self._consolidate_expression_lacking_variables()
-        if consolidated is not None:
-            return consolidated
-        for (i, inner) in enumerate(self._inners):
-            if not inner._is_fully_reduced:
-                reduced_inner = inner._take_reduction_step()
-                revised = util.list_with_updated_entry_at(self._inners, i, reduced_inner)
-                return self._rebuild(*revised)
-        for reducer in self._reducers:
-            reduced = reducer()
-            if reduced is not None:
-                return reduced
-        self._is_fully_reduced = True
-        return self
-
-    @property
     @abstractmethod
-    def _reducers(
-        self: NAryExpression
-    ) -> list[Callable[[], Optional[Expression]]]:
-        raise Exception("Concrete classes derived from NAryExpression must implement _reducers()")
+    def _vectorized_domain_violations(
+        self: NAryExpression,
+        *inner_values: Array
+    ) -> list[tuple[str, Array]]:
+        # Returns a message and a mask of the rows breaking it, for each domain rule.
+        raise Exception("Concrete classes derived from NAryExpression must implement _vectorized_domain_violations()")
+
+    @abstractmethod
+    def _vectorized_value_formula(
+        self: NAryExpression,
+        *inner_values: Array
+    ) -> Array:
+        raise Exception("Concrete classes derived from NAryExpression must implement _vectorized_value_formula()")
+
+    ## Normalization and Reduction ##
 
     def _normalize_fully_reduced(
-        self: NAryExpression
+        self: NAryExpression,
+        normalized_inners: list[Expression]
     ) -> Expression:
-        normalized_inners = (inner._normalize_fully_reduced() for inner in self._inners)
         return self._rebuild(*normalized_inners)
 
     ## Operations ##
 
-    def __eq__(
-        self: NAryExpression,
-        other: Any
-    ) -> bool:
-        if other.__class__ != self.__class__:
-            return False
-        if len(other._inners) != len(self._inners):
-            return False
-        if any(a != b for (a, b) in zip(other._inners, self._inners)):
-            return False
-        return True
-
-    def __hash__(
-        self: NAryExpression
-    ) -> int:
-        return hash((
-            util.get_class_name(self),
-            len(self._inners),
-            tuple(self._inners)
-        ))
-
-    def __str__(
+    def _string_pieces(
         self: NAryExpression
-    ) -> str:
-        inner_strings = ", ".join(str(inner) for inner in self._inners)
-        return f"{util.get_class_name(self)}({inner_strings})"
+    ) -> list[str]:
+        if not self._inners:
+            return [f"{util.get_class_name(self)}()"]
+        separators = [", "] * (len(self._inners) - 1)
+        return [f"{util.get_class_name(self)}(", *separators, ")"]
 
-    def __repr__(
+    def _structural_hash(
         self: NAryExpression
-    ) -> str:
-        inner_strings = ", ".join(str(inner) for inner in self._inners)
-        return f"{util.get_class_name(self)}({inner_strings})"
+    ) -> int:
+        return hash((util.get_class_name(self), len(self._inners), tuple(self._inners)))
@@ -8,6 +8,8 @@ if TYPE_CHECKING:
 
 
 class ParameterizedUnaryExpression(base.UnaryExpression):
+    __slots__ = ("_parameter",)
+
     def __init__(
         self: ParameterizedUnaryExpression,
         inner: Expression,
@@ -23,31 +25,26 @@ class ParameterizedUnaryExpression(base.UnaryExpression):
     ) -> ParameterizedUnaryExpression:
         return self.__class__(inner, self._parameter)
 
+    def _interning_key(
+        self: ParameterizedUnaryExpression
+    ) -> tuple[Any, ...]:
+        return (self.__class__, self._parameter.__class__, self._parameter, id(self._inner))
+
     ## Operations ##
 
-    def __eq__(
+    def _same_parameters(
         self: ParameterizedUnaryExpression,
-        other: Any
+        other: ParameterizedUnaryExpression
     ) -> bool:
-        return super().__eq__(other) and (other._parameter == self._parameter)
+        return other._parameter == self._parameter
 
-    def __hash__(
+    def _structural_hash(
         self: ParameterizedUnaryExpression
     ) -> int:
         return hash((util.get_class_name(self), self._inner, self._parameter))
 
-    def __str__(
-        self: ParameterizedUnaryExpression
-    ) -> str:
-        return self._to_string()
-
-    def __repr__(
-        self: ParameterizedUnaryExpression
-    ) -> str:
-        return self._to_string()
-
     @abstractmethod
-    def _to_string(
+    def _string_pieces(
         self: ParameterizedUnaryExpression
-    ) -> str:
-        raise Exception("Concrete classes derived from ParameterizedUnaryExpression must implement _to_string()")
+    ) -> list[str]:
+        raise Exception("Concrete classes derived from ParameterizedUnaryExpression must implement _string_pieces()")
@@ -1,16 +1,21 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any, Callable, Optional
+from typing import TYPE_CHECKING, Any
 from abc import abstractmethod
 import smoothmath._private.base_expression as base
 import smoothmath._private.utilities as util
+import smoothmath._private.vectorized_math_functions as vmf
+import smoothmath._private.math_functions as mf
 if TYPE_CHECKING:
     from smoothmath import Point, Expression
-    from smoothmath._private.accumulators import (
-        NumericPartialsAccumulator, SyntheticPartialsAccumulator
-    )
+    from smoothmath._private.compiled_expression import Step, VectorizedStep, MaskedVectorizedStep
+    from smoothmath._private.columns import Columns
+    from smoothmath._private.batch_masks import BatchMasks
+    from smoothmath._private.vectorized_math_functions import Array
 
 
 class UnaryExpression(base.Expression):
+    __slots__ = ("_inner",)
+
     def __init__(
         self: UnaryExpression,
         inner: Expression
@@ -20,8 +25,6 @@ class UnaryExpression(base.Expression):
         super().__init__(inner._variable_names)
         self._inner: Expression
         self._inner = inner
-        self._value: Optional[float]
-        self._value = None
 
     def _rebuild(
         self: UnaryExpression,
@@ -29,24 +32,17 @@ class UnaryExpression(base.Expression):
     ) -> UnaryExpression:
         return self.__class__(inner)
 
-    ## Evaluation ##
+    def _interning_key(
+        self: UnaryExpression
+    ) -> tuple[Any, ...]:
+        return (self.__class__, id(self._inner))
 
-    def _reset_evaluation_cache(
+    def _subexpressions(
         self: UnaryExpression
-    ) -> None:
-        self._value = None
-        self._inner._reset_evaluation_cache()
+    ) -> list[Expression]:
+        return [self._inner]
 
-    def _evaluate(
-        self: UnaryExpression,
-        point: Point
-    ) -> float:
-        if self._value is not None:
-            return self._value
-        inner_value = self._inner._evaluate(point)
-        self._verify_domain_constraints(inner_value)
-        self._value = self._value_formula(inner_value)
-        return self._value
+    ## Evaluation ##
 
     @abstractmethod
     def _verify_domain_constraints(
@@ -62,51 +58,129 @@ class UnaryExpression(base.Expression):
     ) -> float:
         raise Exception("Concrete classes derived from UnaryExpression must implement _value_formula()")
 
-    ## Partials ##
-
-    def _numeric_partial(
+    def _value_from_inners(
         self: UnaryExpression,
-        variable_name: str,
+        inner_values: list[float],
         point: Point
     ) -> float:
-        inner_value = self._inner._evaluate(point)
+        (inner_value,) = inner_values
         self._verify_domain_constraints(inner_value)
-        inner_partial = self._inner._numeric_partial(variable_name, point)
-        return self._numeric_partial_formula(point, inner_partial)
+        return self._value_formula(inner_value)
+
+    def _compile_step(
+        self: UnaryExpression,
+        inner_indices: tuple[int, ...]
+    ) -> Step:
+        (inner_index,) = inner_indices
+        verify_domain_constraints = self._verify_domain_constraints
+        value_formula = self._value_formula
+        def step(
+            values: list[float],
+            point: Point
+        ) -> float:
+            inner_value = values[inner_index]
+            verify_domain_constraints(inner_value)
+            return value_formula(inner_value)
+        return step
+
+    def _vectorized_step(
+        self: UnaryExpression,
+        inner_indices: tuple[int, ...]
+    ) -> VectorizedStep:
+        (inner_index,) = inner_indices
+        domain_violations = self._vectorized_domain_violations
+        value_formula = self._vectorized_value_formula
+        def step(
+            values: list[Array],
+            columns: Columns
+        ) -> Array:
+            inner_values = values[inner_index]
+            vmf.verify_no_violations(domain_violations(inner_values))
+            return value_formula(inner_values)
+        return step
+
+    def _masked_vectorized_step(
+        self: UnaryExpression,
+        inner_indices: tuple[int, ...]
+    ) -> MaskedVectorizedStep:
+        (inner_index,) = inner_indices
+        domain_violations = self._vectorized_domain_violations
+        value_formula = self._vectorized_value_formula
+        def step(
+            values: list[Array],
+            columns: Columns,
+            masks: BatchMasks
+        ) -> Array:
+            (inner_values,) = masks.checked_inner_values(self, domain_violations, [values[inner_index]])
+            return value_formula(inner_values)
+        return step
+
+    @abstractmethod
+    def _vectorized_domain_violations(
+        self: UnaryExpression,
+        inner_values: Array
+    ) -> list[tuple[str, Array]]:
+        # Returns a message and a mask of the rows breaking it, for each domain rule.
+        raise Exception("Concrete classes derived from UnaryExpression must implement _vectorized_domain_violations()")
+
+    @abstractmethod
+    def _vectorized_value_formula(
+        self: UnaryExpression,
+        inner_values: Array
+    ) -> Array:
+        raise Exception("Concrete classes derived from UnaryExpression must implement _vectorized_value_formula()")
+
+    ## Partials ##
 
-    def _synthetic_partial(
+    def _synthetic_partial_from_inners(
         self: UnaryExpression,
-        variable_name: str
+        variable_name: str,
+        inner_partials: list[Expression]
     ) -> Expression:
-        inner_partial = self._inner._synthetic_partial(variable_name)
+        (inner_partial,) = inner_partials
         return self._synthetic_partial_formula(inner_partial)
 
-    def _compute_numeric_partials(
+    def _local_partials(
         self: UnaryExpression,
-        accumulator: NumericPartialsAccumulator,
-        multiplier: float,
-        point: Point
-    ) -> None:
-        inner_value = self._inner._evaluate(point)
-        self._verify_domain_constraints(inner_value)
-        next_multiplier = self._numeric_partial_formula(point, multiplier)
-        self._inner._compute_numeric_partials(accumulator, next_multiplier, point)
+        value: float,
+        inner_values: list[float]
+    ) -> list[float]:
+        (inner_value,) = inner_values
+        return [self._local_partial_formula(inner_value, value)]
 
-    def _compute_synthetic_partials(
+    def _local_partial_tangents(
+        self: UnaryExpression,
+        value: float,
+        inner_values: list[float],
+        inner_tangents: list[float]
+    ) -> list[float]:
+        (inner_value,) = inner_values
+        (inner_tangent,) = inner_tangents
+        if inner_tangent == 0:
+            return [0.0]
+        return [mf.multiply(self._local_second_partial_formula(inner_value, value), inner_tangent)]
+
+    def _synthetic_multipliers(
         self: UnaryExpression,
-        accumulator: SyntheticPartialsAccumulator,
         multiplier: Expression
-    ) -> None:
-        next_multiplier = self._synthetic_partial_formula(multiplier)
-        self._inner._compute_synthetic_partials(accumulator, next_multiplier)
+    ) -> list[Expression]:
+        return [self._synthetic_partial_formula(multiplier)]
 
     @abstractmethod
-    def _numeric_partial_formula(
+    def _local_partial_formula(
         self: UnaryExpression,
-        point: Point,
-        multiplier: float
+        inner_value: float,
+        value: float
     ) -> float:
-        raise Exception("Concrete classes derived from UnaryExpression must implement _numeric_partial_formula()")
+        raise Exception("Concrete classes derived from UnaryExpression must implement _local_partial_formula()")
+
+    @abstractmethod
+    def _local_second_partial_formula(
+        self: UnaryExpression,
+        inner_value: float,
+        value: float
+    ) -> float:
+        raise Exception("Concrete classes derived from UnaryExpression must implement _local_second_partial_formula()")
 
     @abstractmethod
     def _synthetic_partial_formula(
@@ -117,56 +191,20 @@ class UnaryExpression(base.Expression):
 
     ## Normalization and Reduction ##
 
-    def _take_reduction_step(
-        self: UnaryExpression
-    ) -> Expression:
-        if self._is_fully_reduced:
-            return self
-        consolidated = self._consolidate_expression_lacking_variables()
-        if consolidated is not None:
-            return consolidated
-        if not self._inner._is_fully_reduced:
-            reduced_inner = self._inner._take_reduction_step()
-            return self._rebuild(reduced_inner)
-        for reducer in self._reducers:
-            reduced = reducer()
-            if reduced is not None:
-                return reduced
-        self._is_fully_reduced = True
-        return self
-
-    @property
-    @abstractmethod
-    def _reducers(
-        self: UnaryExpression
-    ) -> list[Callable[[], Optional[Expression]]]:
-        raise Exception("Concrete classes derived from UnaryExpression must implement _reducers()")
-
     def _normalize_fully_reduced(
-        self: UnaryExpression
+        self: UnaryExpression,
+        normalized_inners: list[Expression]
     ) -> Expression:
-        normalized_inner = self._inner._normalize_fully_reduced()
-        return self._rebuild(normalized_inner)
+        return self._rebuild(*normalized_inners)
 
     ## Operations ##
 
-    def __eq__(
-        self: UnaryExpression,
-        other: Any
-    ) -> bool:
-        return (other.__class__ == self.__class__) and (other._inner == self._inner)
+    def _string_pieces(
+        self: UnaryExpression
+    ) -> list[str]:
+        return [f"{util.get_class_name(self)}(", ")"]
 
-    def __hash__(
+    def _structural_hash(
         self: UnaryExpression
     ) -> int:
         return hash((util.get_class_name(self), self._inner))
-
-    def __str__(
-        self: UnaryExpression
-    ) -> str:
-        return f"{util.get_class_name(self)}({self._inner})"
-
-    def __repr__(
-        self: UnaryExpression
-    ) -> str:
-        return f"{util.get_class_name(self)}({self._inner})"
@@ -0,0 +1,86 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Callable, NamedTuple
+import smoothmath._private.vectorized_math_functions as vmf
+if TYPE_CHECKING:
+    from smoothmath import Expression
+    from smoothmath._private.vectorized_math_functions import Array
+
+
+class MaskedValues(NamedTuple):
+    """
+    The results of a masked batch evaluation.
+
+    ``values`` holds a value for each row, and is nan wherever the row is invalid.
+    ``valid`` is true wherever the expression is defined at the row. ``error_codes`` is
+    zero for valid rows; otherwise, code ``k`` means the domain rule described by
+    ``errors[k - 1]`` failed at the row, as an (expression, message) pair naming the
+    subexpression and the rule.
+    """
+
+    values: Array
+    valid: Array
+    error_codes: Array
+    errors: list[tuple[Expression, str]]
+
+
+class BatchMasks:
+    """
+    Tracks which rows of a batch evaluation are invalid and why.
+
+    A row is invalid once any subexpression breaks a domain rule there. Its error code
+    refers to the first rule it broke, in the order the nodes are evaluated, which
+    is the rule whose DomainError evaluating at that row alone would raise.
+    """
+
+    def __init__(
+        self: BatchMasks,
+        row_count: int
+    ) -> None:
+        self.valid: Array
+        self.valid = vmf.all_valid(row_count)
+        self.error_codes: Array
+        self.error_codes = vmf.no_error_codes(row_count)
+        self.errors: list[tuple[Expression, str]]
+        self.errors = []
+
+    def checked_inner_values(
+        self: BatchMasks,
+        expression: Expression,
+        domain_violations: Callable[..., list[tuple[str, Array]]],
+        inner_values: list[Array]
+    ) -> list[Array]:
+        # Returns inner values which are safe to pass to the expression's value formula,
+        # after recording the rows where the expression breaks a domain rule. Every rule
+        # holds at 1, so invalid rows get inner values of 1. The vectorized value formulas
+        # don't check their domains, so they rely on this to never see an invalid row.
+        inner_values = self._with_invalid_rows_replaced(inner_values)
+        recorded = False
+        for message, mask in domain_violations(*inner_values):
+            newly_invalid = mask & self.valid
+            if newly_invalid.any():
+                self.errors.append((expression, message))
+                self.error_codes[newly_invalid] = len(self.errors)
+                self.valid &= ~newly_invalid
+                recorded = True
+        if recorded:
+            inner_values = self._with_invalid_rows_replaced(inner_values)
+        return inner_values
+
+    def masked_values(
+        self: BatchMasks,
+        values: Array
+    ) -> MaskedValues:
+        return MaskedValues(
+            vmf.where_valid(self.valid, values, float("nan")),
+            self.valid,
+            self.error_codes,
+            self.errors
+        )
+
+    def _with_invalid_rows_replaced(
+        self: BatchMasks,
+        inner_values: list[Array]
+    ) -> list[Array]:
+        if not self.errors:
+            return inner_values
+        return [vmf.where_valid(self.valid, values, 1.0) for values in inner_values]
@@ -0,0 +1,226 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, NoReturn
+import smoothmath._private.tape as tp
+import smoothmath._private.accumulators as acc
+if TYPE_CHECKING:
+    from array import array
+    from smoothmath import Point, Expression
+
+
+class CheckpointedTape(tp.Tape):
+    """
+    A tape which computes an expression's value and partials while holding only a
+    bounded number of node values at once.
+
+    The linearized nodes are split into consecutive segments. The forward sweep keeps
+    only the checkpoints: the values of nodes used by a later segment. The backward
+    sweep then handles one segment at a time, from the last to the first, recomputing
+    the segment's values from the checkpoints before passing partials back through it.
+    Each node's value is computed at most twice.
+
+    The budget covers both the node values and the multipliers the backward sweep
+    has yet to pass on. Only the value and partials of the expression are available;
+    the tape's other sweeps would hold every node's value, so they raise instead.
+    """
+
+    def __init__(
+        self: CheckpointedTape,
+        expression: Expression,
+        memory_budget: int
+    ) -> None:
+        super().__init__(expression)
+        self.memory_budget: int
+        self.memory_budget = memory_budget
+        self._segment_length: int
+        self._is_checkpoint: list[bool]
+        self._segment_length, self._is_checkpoint = self._choose_segments(memory_budget)
+
+    def value_and_numeric_partials(
+        self: CheckpointedTape,
+        point: Point
+    ) -> tuple[float, dict[str, float]]:
+        value, accumulator = self.value_and_indexed_partials(point)
+        numeric_partials = accumulator.numeric_partials_for(self._original_expressions[0]._variable_names)
+        return (value, numeric_partials)
+
+    def value_and_indexed_partials(
+        self: CheckpointedTape,
+        point: Point
+    ) -> tuple[float, acc.IndexedPartialsAccumulator]:
+        (output_index,) = self._output_indices
+        segment_starts = range(0, output_index + 1, self._segment_length)
+        # Steps only read the values of inner expressions, so a dictionary holding the
+        # values we still need can stand in for the list of all values.
+        values: dict[int, float]
+        values = {}
+        for start in segment_starts[:-1]:
+            self._evaluate_segment(values, point, start)
+            self._forget_segment(values, start, keep_checkpoints = True)
+        self._evaluate_segment(values, point, segment_starts[-1])
+        value = values[output_index]
+        accumulator = acc.IndexedPartialsAccumulator(self.variable_index)
+        # Like the values, we only hold multipliers until their nodes are handled.
+        multipliers: dict[int, float]
+        multipliers = { output_index: 1.0 }
+        for start in reversed(segment_starts):
+            if start != segment_starts[-1]:
+                self._evaluate_segment(values, point, start)
+            self._backward_sweep_through_segment(values, multipliers, accumulator, start)
+            self._forget_segment(values, start, keep_checkpoints = False)
+        return (value, accumulator)
+
+    def values(
+        self: CheckpointedTape,
+        point: Point
+    ) -> list[float]:
+        _raise_unbudgeted("values")
+
+    def values_and_numeric_partials(
+        self: CheckpointedTape,
+        point: Point
+    ) -> tuple[list[float], list[dict[str, float]]]:
+        _raise_unbudgeted("values_and_numeric_partials")
+
+    def value_and_directional_derivative(
+        self: CheckpointedTape,
+        point: Point,
+        direction: Point
+    ) -> tuple[float, float]:
+        _raise_unbudgeted("value_and_directional_derivative")
+
+    def value_and_partial(
+        self: CheckpointedTape,
+        point: Point,
+        variable_name: str
+    ) -> tuple[float, float]:
+        _raise_unbudgeted("value_and_partial")
+
+    def compressed_jacobian(
+        self: CheckpointedTape,
+        point: Point,
+        all_seeds: list[array[float]]
+    ) -> list[list[float]]:
+        _raise_unbudgeted("compressed_jacobian")
+
+    def taylor_coefficients(
+        self: CheckpointedTape,
+        point: Point,
+        variable_name: str,
+        order: int
+    ) -> list[float]:
+        _raise_unbudgeted("taylor_coefficients")
+
+    def hessian_vector_products(
+        self: CheckpointedTape,
+        point: Point,
+        vectors: list[Point]
+    ) -> list[dict[str, float]]:
+        _raise_unbudgeted("hessian_vector_products")
+
+    def _evaluate_segment(
+        self: CheckpointedTape,
+        values: dict[int, float],
+        point: Point,
+        start: int
+    ) -> None:
+        end = min(start + self._segment_length, len(self._nodes))
+        for i in range(start, end):
+            values[i] = self._steps[i](values, point) # type: ignore
+
+    def _forget_segment(
+        self: CheckpointedTape,
+        values: dict[int, float],
+        start: int,
+        keep_checkpoints: bool
+    ) -> None:
+        end = min(start + self._segment_length, len(self._nodes))
+        for i in range(start, end):
+            if not (keep_checkpoints and self._is_checkpoint[i]):
+                del values[i]
+
+    def _backward_sweep_through_segment(
+        self: CheckpointedTape,
+        values: dict[int, float],
+        multipliers: dict[int, float],
+        accumulator: acc.IndexedPartialsAccumulator,
+        start: int
+    ) -> None:
+        end = min(start + self._segment_length, len(self._nodes))
+        for i in range(end - 1, start - 1, -1):
+            multiplier = multipliers.pop(i, 0.0)
+            if multiplier == 0:
+                continue
+            variable_index = self._node_variable_indices[i]
+            if variable_index >= 0:
+                accumulator.add_at(variable_index, multiplier)
+                continue
+            inner_indices = self._inner_indices[i]
+            if not inner_indices:
+                continue
+            inner_values = [values[j] for j in inner_indices]
+            local_partials = self._nodes[i]._local_partials(values[i], inner_values)
+            for inner_index, local_partial in zip(inner_indices, local_partials):
+                multipliers[inner_index] = multipliers.get(inner_index, 0.0) + multiplier * local_partial
+
+    def _choose_segments(
+        self: CheckpointedTape,
+        memory_budget: int
+    ) -> tuple[int, list[bool]]:
+        # Longer segments mean fewer checkpoints, so we try the longest segments first.
+        segment_length = max(memory_budget, 1)
+        while True:
+            is_checkpoint = self._checkpoints_for(segment_length)
+            if self._most_held_for(segment_length, is_checkpoint) <= memory_budget:
+                return (segment_length, is_checkpoint)
+            if segment_length == 1:
+                raise Exception(f"Cannot compute partials within a memory budget of {memory_budget} values")
+            segment_length //= 2
+
+    def _most_held_for(
+        self: CheckpointedTape,
+        segment_length: int,
+        is_checkpoint: list[bool]
+    ) -> int:
+        # While handling a segment, we hold the checkpoints of earlier segments, the
+        # segment's own values and the multipliers not yet passed on to inner nodes.
+        # Node j's multiplier is pending from when its last consumer is handled until j
+        # itself is handled, so we count it at every node between the two.
+        node_count = len(self._nodes)
+        last_consumers = list(range(node_count))
+        for i, inner_indices in enumerate(self._inner_indices):
+            for j in inner_indices:
+                last_consumers[j] = i
+        pending_changes = [0] * (node_count + 1)
+        for j, last_consumer in enumerate(last_consumers):
+            pending_changes[j] += 1
+            pending_changes[last_consumer + 1] -= 1
+        most_held = 0
+        checkpoints_before = 0
+        pending = 0
+        for start in range(0, node_count, segment_length):
+            end = min(start + segment_length, node_count)
+            most_pending = 0
+            for i in range(start, end):
+                pending += pending_changes[i]
+                most_pending = max(most_pending, pending)
+            most_held = max(most_held, checkpoints_before + (end - start) + most_pending)
+            checkpoints_before += sum(is_checkpoint[start:end])
+        return most_held
+
+    def _checkpoints_for(
+        self: CheckpointedTape,
+        segment_length: int
+    ) -> list[bool]:
+        is_checkpoint = [False] * len(self._nodes)
+        for i, inner_indices in enumerate(self._inner_indices):
+            for j in inner_indices:
+                if j // segment_length != i // segment_length:
+                    is_checkpoint[j] = True
+        return is_checkpoint
+
+
+def _raise_unbudgeted(
+    method_name: str
+) -> NoReturn:
+    # These sweeps of the plain tape hold a value for every node, so they would break the budget.
+    raise Exception(f"CheckpointedTape does not support {method_name}(), which would hold every node's value at once")
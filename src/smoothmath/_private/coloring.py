@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+
+def color_columns(
+    row_patterns: list[list[int]],
+    column_count: int
+) -> list[int]:
+    # Colors the columns of a sparse matrix so that no two columns with a nonzero entry
+    # in the same row get the same color. Each row pattern lists the columns of that
+    # row's nonzero entries. Columns in the most rows are colored first, each getting
+    # the smallest color not already used by a column it shares a row with.
+    rows_by_column: list[list[int]]
+    rows_by_column = [[] for _ in range(column_count)]
+    for row, columns in enumerate(row_patterns):
+        for column in columns:
+            rows_by_column[column].append(row)
+    order = sorted(range(column_count), key = lambda column: -len(rows_by_column[column]))
+    colors = [-1] * column_count
+    for column in order:
+        forbidden = {
+            colors[other]
+            for row in rows_by_column[column]
+            for other in row_patterns[row]
+        }
+        color = 0
+        while color in forbidden:
+            color += 1
+        colors[column] = color
+    return colors
@@ -0,0 +1,41 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Mapping
+import smoothmath._private.errors as er
+import smoothmath._private.vectorized_math_functions as vmf
+if TYPE_CHECKING:
+    from smoothmath._private.vectorized_math_functions import Array
+
+
+class Columns:
+    """
+    Coordinates for many points, stored as one array per variable name.
+    """
+
+    def __init__(
+        self: Columns,
+        columns: Mapping[str, Any]
+    ) -> None:
+        self._columns: dict[str, Array]
+        self._columns = {
+            variable_name: vmf.as_column(values)
+            for variable_name, values in columns.items()
+        }
+        row_counts = set(len(column) for column in self._columns.values())
+        if len(row_counts) > 1:
+            raise Exception(f"Expected columns to all have the same length, found lengths: {sorted(row_counts)}")
+        self.row_count: int
+        self.row_count = row_counts.pop() if row_counts else 0
+
+    def column(
+        self: Columns,
+        variable_name: str
+    ) -> Array:
+        column = self._columns.get(variable_name, None)
+        if column is None:
+            raise er.CoordinateMissing(f"Columns have no entry for variable: {variable_name}")
+        return column
+
+    def variable_names(
+        self: Columns
+    ) -> list[str]:
+        return list(self._columns.keys())
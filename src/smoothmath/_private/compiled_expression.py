@@ -0,0 +1,217 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Callable, Mapping, Optional, Sequence
+import smoothmath._private.point as pt
+import smoothmath._private.packed_point as pp
+import smoothmath._private.point_batch as pb
+import smoothmath._private.linearization as li
+import smoothmath._private.columns as co
+import smoothmath._private.batch_masks as bm
+import smoothmath._private.vectorized_math_functions as vmf
+import smoothmath._private.base_expression.expression as be
+import smoothmath._private.expression as ex
+if TYPE_CHECKING:
+    from smoothmath import Point, PointBatch, Expression
+    from smoothmath._private.columns import Columns
+    from smoothmath._private.batch_masks import BatchMasks, MaskedValues
+    from smoothmath._private.packed_point import VariableLayout
+    from smoothmath._private.vectorized_math_functions import Array
+
+
+# A step computes the value of one node from the values of the nodes before it.
+Step = Callable[[list[float], "Point"], float]
+
+# An indexed step reads coordinates by slot index, from the coordinates of a packed point.
+IndexedStep = Callable[[list[float], Sequence[float]], float]
+
+# A vectorized step does the same, but for many points at once.
+VectorizedStep = Callable[[list["Array"], "Columns"], "Array"]
+
+# A masked vectorized step records the rows where a domain rule fails, rather than raising.
+MaskedVectorizedStep = Callable[[list["Array"], "Columns", "BatchMasks"], "Array"]
+
+
+class CompiledExpression:
+    """
+    An expression compiled for repeated evaluation.
+
+    >>> from smoothmath import Point
+    >>> from smoothmath.expression import Variable
+    >>> x = Variable("x")
+    >>> y = Variable("y")
+    >>> compiled = (x ** 2 + x * y).compile()
+    >>> compiled.at(Point(x=3, y=2))
+    15.0
+
+    Evaluation gives the same results (and raises the same exceptions) as
+    :meth:`Expression.at`, but without walking the expression tree each time.
+
+    :param expression: the expression to compile
+    """
+
+    def __init__(
+        self: CompiledExpression,
+        expression: Expression
+    ) -> None:
+        linearization = li.linearize(expression)
+        self._original_expression: Expression
+        self._original_expression = expression
+        self._steps: list[Step]
+        self._steps = [
+            node._compile_step(inner_indices)
+            for node, inner_indices in zip(linearization.nodes, linearization.inner_indices)
+        ]
+        self._output_index: int
+        (self._output_index,) = linearization.output_indices
+        self._linearization: li.Linearization
+        self._linearization = linearization
+        self._vectorized_steps: Optional[list[VectorizedStep]]
+        self._vectorized_steps = None
+        self._masked_vectorized_steps: Optional[list[MaskedVectorizedStep]]
+        self._masked_vectorized_steps = None
+        self._indexed_steps_by_layout: dict[VariableLayout, list[IndexedStep]]
+        self._indexed_steps_by_layout = {}
+
+    def at(
+        self: CompiledExpression,
+        point: Point | PointBatch | float
+    ) -> float | Array:
+        """
+        Evaluates the compiled expression at a point.
+
+        Will raise an exception if the point parameter is a float and the expression has more
+        than one variable.
+
+        Coordinates of a :class:`PackedPoint` are read by slot index. At a :class:`PointBatch`,
+        gives a numpy array of values, as :meth:`evaluate_batch` does.
+
+        :param point: where to evaluate
+        """
+        if isinstance(point, pp.PackedPoint):
+            return self._at_packed_point(point)
+        if isinstance(point, pb.PointBatch):
+            return self._evaluate_columns(point._columns)
+        if not isinstance(point, pt.Point):
+            exception_message = "Can only evaluate using a number for an expression with one variable. Consider passing a Point() instead."
+            variable_name = be.get_the_single_variable_name(self._original_expression, exception_message)
+            point = pt.point_on_number_line(variable_name, point)
+        values: list[float]
+        values = []
+        append = values.append
+        for step in self._steps:
+            append(step(values, point))
+        return values[self._output_index]
+
+    def _at_packed_point(
+        self: CompiledExpression,
+        point: pp.PackedPoint
+    ) -> float:
+        coordinates = point._values
+        values: list[float]
+        values = []
+        append = values.append
+        for step in self._indexed_steps(point.layout):
+            append(step(values, coordinates))
+        return values[self._output_index]
+
+    def _indexed_steps(
+        self: CompiledExpression,
+        layout: VariableLayout
+    ) -> list[IndexedStep]:
+        # Only variables read coordinates, so the other steps are reused as they are.
+        # If two threads race here, each builds an equivalent list of steps.
+        indexed_steps = self._indexed_steps_by_layout.get(layout, None)
+        if indexed_steps is None:
+            indexed_steps = [
+                node._compile_indexed_step(layout.index_of(node.name)) if isinstance(node, ex.Variable) else step
+                for node, step in zip(self._linearization.nodes, self._steps)
+            ] # type: ignore
+            self._indexed_steps_by_layout[layout] = indexed_steps
+        return indexed_steps
+
+    def evaluate_batch(
+        self: CompiledExpression,
+        columns: Mapping[str, Any] | PointBatch,
+        masked: bool = False
+    ) -> Array | MaskedValues:
+        """
+        Evaluates the compiled expression at many points at once. Requires numpy.
+
+        See :meth:`Expression.evaluate_batch`.
+
+        :param columns: for each variable name, an array of coordinates, or a :class:`PointBatch`
+        :param masked: whether to mark rows where the expression is undefined rather than raising
+        """
+        coordinates = columns._columns if isinstance(columns, pb.PointBatch) else co.Columns(columns)
+        if masked:
+            return self._evaluate_columns_masked(coordinates)
+        return self._evaluate_columns(coordinates)
+
+    def _evaluate_columns(
+        self: CompiledExpression,
+        coordinates: Columns
+    ) -> Array:
+        if self._vectorized_steps is None:
+            linearization = self._linearization
+            self._vectorized_steps = [
+                node._vectorized_step(inner_indices)
+                for node, inner_indices in zip(linearization.nodes, linearization.inner_indices)
+            ]
+        values: list[Array]
+        values = []
+        append = values.append
+        for step in self._vectorized_steps:
+            append(step(values, coordinates))
+        return vmf.broadcast(values[self._output_index], coordinates.row_count)
+
+    def _evaluate_columns_masked(
+        self: CompiledExpression,
+        coordinates: Columns
+    ) -> MaskedValues:
+        if self._masked_vectorized_steps is None:
+            linearization = self._linearization
+            self._masked_vectorized_steps = [
+                node._masked_vectorized_step(inner_indices)
+                for node, inner_indices in zip(linearization.nodes, linearization.inner_indices)
+            ]
+        masks = bm.BatchMasks(coordinates.row_count)
+        values: list[Array]
+        values = []
+        append = values.append
+        for step in self._masked_vectorized_steps:
+            append(step(values, coordinates, masks))
+        return masks.masked_values(vmf.broadcast(values[self._output_index], coordinates.row_count))
+
+    def __call__(
+        self: CompiledExpression,
+        point: Point | PointBatch | float
+    ) -> float | Array:
+        return self.at(point)
+
+    def __eq__(
+        self: CompiledExpression,
+        other: Any
+    ) -> bool:
+        return (
+            (other.__class__ == self.__class__) and
+            (self._original_expression == other._original_expression)
+        )
+
+    def __hash__(
+        self: CompiledExpression
+    ) -> int:
+        return hash(("CompiledExpression", self._original_expression))
+
+    def __str__(
+        self: CompiledExpression
+    ) -> str:
+        return self._to_string()
+
+    def __repr__(
+        self: CompiledExpression
+    ) -> str:
+        return self._to_string()
+
+    def _to_string(
+        self: CompiledExpression
+    ) -> str:
+        return f"CompiledExpression({self._original_expression})"
@@ -2,9 +2,12 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 import smoothmath._private.partial as pa
 import smoothmath._private.point as pt
+import smoothmath._private.point_batch as pb
 import smoothmath._private.base_expression.expression as be
+import smoothmath._private.utilities as util
 if TYPE_CHECKING:
-    from smoothmath import Point, Expression, Partial
+    from smoothmath import Point, PointBatch, Expression, Partial
+    from smoothmath._private.vectorized_math_functions import Array
 
 
 class Derivative:
@@ -43,17 +46,49 @@ class Derivative:
 
     def at(
         self: Derivative,
-        point: Point | float
-    ) -> float:
+        point: Point | PointBatch | float
+    ) -> float | Array:
         """
         Evaluates the derivative.
 
+        At a :class:`PointBatch`, evaluates at all of its points at once, giving a numpy array
+        of values.
+
         :param point: where to evaluate the derivative
         """
-        if not isinstance(point, pt.Point):
+        if not isinstance(point, (pt.Point, pb.PointBatch)):
             point = pt.point_on_number_line(self._variable_name, point)
         return self._partial.at(point)
 
+    def taylor_coefficients(
+        self: Derivative,
+        point: Point | float,
+        order: int
+    ) -> list[float]:
+        """
+        Computes the Taylor coefficients of the original expression at a point, up to the
+        given order. The kth coefficient is the kth derivative divided by k factorial.
+
+        >>> from smoothmath import Derivative
+        >>> from smoothmath.expression import Variable, NthPower
+        >>> Derivative(NthPower(Variable("x"), n=3)).taylor_coefficients(2, order=4)
+        [8.0, 12.0, 6.0, 1.0, 0.0]
+
+        The coefficients are found in one pass through the expression, without building
+        expressions for the higher derivatives.
+
+        :param point: where to evaluate
+        :param order: the highest order of derivative to include
+        """
+        integer_order = util.integer_from_integral_float(order)
+        if integer_order is None or integer_order < 0:
+            raise Exception(f"Taylor coefficients require a nonnegative integer order, found: {order}")
+        if not isinstance(point, pt.Point):
+            point = pt.point_on_number_line(self._variable_name, point)
+        tape = self._original_expression._partials_tape()
+        coefficients = tape.taylor_coefficients(point, self._variable_name, integer_order)
+        return [float(coefficient) for coefficient in coefficients]
+
     def as_expression(
         self: Derivative
     ) -> Expression:
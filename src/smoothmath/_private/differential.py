@@ -1,12 +1,23 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional
 import smoothmath._private.partial as pa
 import smoothmath._private.located_differential as ld
 import smoothmath._private.expression.variable as va
 import smoothmath._private.utilities as util
+import smoothmath._private.accumulators as acc
+import smoothmath._private.checkpointed_tape as ct
+import smoothmath._private.tape as tp
+import smoothmath._private.parallel as pl
+import smoothmath._private.vectorized_math_functions as vmf
+import smoothmath._private.point_batch as pb
+import smoothmath._private.streaming as st
 if TYPE_CHECKING:
-    from smoothmath import Point, Expression, Partial, LocatedDifferential
+    from array import array
+    from smoothmath import Point, PointBatch, Expression, Partial, LocatedDifferential
     from smoothmath.expression import Variable
+    from smoothmath._private.vectorized_math_functions import Array
+    from smoothmath._private.tape import Tape
+    from smoothmath._private.checkpointed_tape import CheckpointedTape
 
 
 class Differential:
@@ -18,19 +29,37 @@ class Differential:
     >>> Differential(Multiply(Variable("x"), Variable("y")))
     Differential(Multiply(Variable("x"), Variable("y")))
 
+    With a memory budget, evaluating the differential holds at most that many
+    intermediate values at once, recomputing values as needed. A memory budget can't
+    be combined with computing early, and the components can't be retrieved with
+    :meth:`component`, since a :class:`Partial` is evaluated without the budget.
+
     :param expression: an expression
     :param compute_early: whether to do extra work on initialization to have faster evaluation afterwards
+    :param memory_budget: the most intermediate values to hold at once while evaluating
     """
 
     def __init__(
         self: Differential,
         expression: Expression,
-        compute_early: bool = False
+        compute_early: bool = False,
+        memory_budget: Optional[int] = None
     ) -> None:
+        if compute_early and memory_budget is not None:
+            raise Exception("A memory budget can't be combined with computing early")
         self._original_expression: Expression
         self._original_expression = expression
         self._synthetic_partials: Optional[dict[str, Expression]]
         self._synthetic_partials = _initial_synthetic_partials(expression, compute_early)
+        self._memory_budget: Optional[int]
+        self._memory_budget = memory_budget
+        self._checkpointed_tape: Optional[CheckpointedTape]
+        self._checkpointed_tape = None
+        self._synthetic_partials_tape: Optional[Tape]
+        self._synthetic_partials_tape = None
+        # Synthetic partials built for evaluating at a PointBatch, when not computed early.
+        self._lazy_synthetic_partials: Optional[dict[str, Expression]]
+        self._lazy_synthetic_partials = None
 
     def component(
         self: Differential,
@@ -43,6 +72,8 @@ class Differential:
 
         :param variable: selects which component
         """
+        if self._memory_budget is not None:
+            raise Exception("A differential with a memory budget can't give its components as partials; use component_at()")
         if self._synthetic_partials is None:
             return pa.Partial(self._original_expression, variable)
         variable_name = va.get_variable_name(variable)
@@ -54,23 +85,291 @@ class Differential:
 
     def at(
         self: Differential,
-        point: Point
-    ) -> LocatedDifferential:
+        point: Point | PointBatch
+    ) -> LocatedDifferential | dict[str, Array]:
         """
         Evaluates the differential at a point.
 
+        >>> from smoothmath import PointBatch, Differential
+        >>> from smoothmath.expression import Variable
+        >>> x = Variable("x")
+        >>> y = Variable("y")
+        >>> Differential(x * y).at(PointBatch(x=[1, 3], y=[2, 4]))
+        {'x': array([2., 4.]), 'y': array([1., 3.])}
+
+        At a :class:`PointBatch`, evaluates at all of its points at once. The result maps each
+        variable name to a numpy array of that component's values. This writes the components
+        as expressions and evaluates them over whole columns.
+
         :param point: where to evaluate
         """
-        self._original_expression.at(point)
-        if self._synthetic_partials is None:
-            return ld.LocatedDifferential(self._original_expression, point)
-        numeric_partials = util.map_dictionary_values(
-            self._synthetic_partials,
-            lambda _, synthetic_partial: synthetic_partial.at(point)
-        )
+        if isinstance(point, pb.PointBatch):
+            return self._at_batch(point)
+        _, numeric_partials = self._value_and_numeric_partials_at(point)
         _private = { "numeric_partials": numeric_partials }
         return ld.LocatedDifferential(self._original_expression, point, _private = _private)
 
+    def variable_names(
+        self: Differential
+    ) -> list[str]:
+        """
+        The variable names of the original expression, in the order used by :meth:`gradient_at`.
+        """
+        return sorted(self._original_expression._variable_names)
+
+    def gradient_at(
+        self: Differential,
+        point: Point,
+        sparse: bool = False
+    ) -> array[float] | tuple[array[int], array[float]]:
+        """
+        Evaluates the differential at a point, giving its components as an array.
+
+        >>> from smoothmath import Point, Differential
+        >>> from smoothmath.expression import Variable
+        >>> x = Variable("x")
+        >>> y = Variable("y")
+        >>> differential = Differential(x * y)
+        >>> differential.variable_names()
+        ['x', 'y']
+        >>> differential.gradient_at(Point(x=2, y=0))
+        array('d', [0.0, 2.0])
+        >>> differential.gradient_at(Point(x=2, y=0), sparse=True)
+        (array('q', [1]), array('d', [2.0]))
+
+        The entries follow the order of :meth:`variable_names`. With ``sparse=True``, the result
+        is instead a pair of arrays: the indices of the nonzero components and their values.
+        Arrays support the buffer protocol, so ``numpy.frombuffer()`` can wrap them without copying.
+
+        :param point: where to evaluate
+        :param sparse: whether to return only the nonzero components
+        """
+        accumulator = self._indexed_partials_at(point)
+        return accumulator.sparse() if sparse else accumulator.buffer
+
+    def value_and_gradient(
+        self: Differential,
+        point: Point
+    ) -> tuple[float, LocatedDifferential]:
+        """
+        Evaluates the original expression and the differential at a point.
+
+        >>> from smoothmath import Point, Differential
+        >>> from smoothmath.expression import Variable
+        >>> x = Variable("x")
+        >>> y = Variable("y")
+        >>> value, gradient = Differential(x * y).value_and_gradient(Point(x=2, y=3))
+        >>> value, gradient.component(x), gradient.component(y)
+        (6.0, 3.0, 2.0)
+
+        Without computing early, the value comes from the forward sweep that computing
+        the partials takes anyway. When computing early, the original expression and the
+        written-out components are evaluated together, in one pass through their shared
+        nodes, which costs about as much as evaluating the components alone.
+
+        :param point: where to evaluate
+        """
+        value, numeric_partials = self._value_and_numeric_partials_at(point)
+        _private = { "numeric_partials": numeric_partials }
+        return (value, ld.LocatedDifferential(self._original_expression, point, _private = _private))
+
+    def at_many(
+        self: Differential,
+        points: Iterable[Point],
+        workers: Optional[int] = None,
+        columnar: bool = False
+    ) -> list[LocatedDifferential] | dict[str, Array]:
+        """
+        Evaluates the differential at many points, spreading the work over a pool of processes.
+
+        >>> from smoothmath import Point, Differential
+        >>> from smoothmath.expression import Variable
+        >>> x = Variable("x")
+        >>> y = Variable("y")
+        >>> points = [Point(x=1, y=2), Point(x=3, y=4)]
+        >>> [located.component(x) for located in Differential(x * y).at_many(points, workers=1)]
+        [2.0, 4.0]
+
+        Each worker process receives the differential once. The located differentials come
+        back in the same order as the points. Alternatively, with ``columnar=True``, the
+        result maps each variable name to a numpy array of that component's values.
+
+        :param points: where to evaluate
+        :param workers: how many processes to use; defaults to the number of CPUs, and 1 evaluates in this process
+        :param columnar: whether to return a numpy array for each component rather than a list
+        """
+        points = list(points)
+        all_numeric_partials = pl.evaluate_many(self._numeric_partials_at, points, workers)
+        if columnar:
+            return {
+                variable_name: vmf.as_column([
+                    numeric_partials[variable_name] for numeric_partials in all_numeric_partials
+                ])
+                for variable_name in sorted(self._original_expression._variable_names)
+            }
+        return [
+            ld.LocatedDifferential(
+                self._original_expression,
+                point,
+                _private = { "numeric_partials": numeric_partials }
+            )
+            for point, numeric_partials in zip(points, all_numeric_partials)
+        ]
+
+    def stream(
+        self: Differential,
+        points: Iterable[Point],
+        chunk_size: int = st.DEFAULT_CHUNK_SIZE
+    ) -> Iterator[dict[str, Array]]:
+        """
+        Evaluates the differential at a stream of points, a chunk at a time.
+
+        >>> from smoothmath import Point, Differential
+        >>> from smoothmath.expression import Variable
+        >>> x = Variable("x")
+        >>> y = Variable("y")
+        >>> points = (Point(x=n, y=1) for n in range(3))
+        >>> for components in Differential(x * y).stream(points, chunk_size=2):
+        ...     print(components["x"].tolist(), components["y"].tolist())
+        [1.0, 1.0] [0.0, 1.0]
+        [1.0] [2.0]
+
+        For each chunk, this yields a dictionary mapping each variable name to a numpy array
+        of that component's values, as :meth:`at` does for a :class:`PointBatch`.
+        See :meth:`Expression.stream`.
+
+        :param points: where to evaluate
+        :param chunk_size: how many points to evaluate at once
+        """
+        for batch in st.batches_of(points, chunk_size):
+            yield self._at_batch(batch)
+
+    def _at_batch(
+        self: Differential,
+        batch: PointBatch
+    ) -> dict[str, Array]:
+        if self._memory_budget is not None:
+            return self._at_batch_within_budget(batch)
+        # We evaluate the original expression to check for DomainErrors.
+        self._original_expression.at(batch)
+        return {
+            variable_name: synthetic_partial.at(batch)
+            for variable_name, synthetic_partial in sorted(self._batch_synthetic_partials().items())
+        }
+
+    def _at_batch_within_budget(
+        self: Differential,
+        batch: PointBatch
+    ) -> dict[str, Array]:
+        # The synthetic partials would be evaluated over whole columns without the budget,
+        # so instead each point gets its own checkpointed sweep.
+        all_numeric_partials = [self._numeric_partials_at(batch.point(i)) for i in range(len(batch))]
+        return {
+            variable_name: vmf.as_column([
+                numeric_partials[variable_name] for numeric_partials in all_numeric_partials
+            ])
+            for variable_name in sorted(self._original_expression._variable_names)
+        }
+
+    def _batch_synthetic_partials(
+        self: Differential
+    ) -> dict[str, Expression]:
+        if self._synthetic_partials is not None:
+            return self._synthetic_partials
+        # If two threads race here, each builds equivalent synthetic partials.
+        synthetic_partials = self._lazy_synthetic_partials
+        if synthetic_partials is None:
+            synthetic_partials = _initial_synthetic_partials(self._original_expression, True)
+            self._lazy_synthetic_partials = synthetic_partials
+        return synthetic_partials # type: ignore
+
+    def _numeric_partials_at(
+        self: Differential,
+        point: Point
+    ) -> dict[str, float]:
+        _, numeric_partials = self._value_and_numeric_partials_at(point)
+        return numeric_partials
+
+    def _indexed_partials_at(
+        self: Differential,
+        point: Point
+    ) -> acc.IndexedPartialsAccumulator:
+        if self._synthetic_partials is None:
+            _, accumulator = self._reverse_mode_tape().value_and_indexed_partials(point)
+            return accumulator
+        _, numeric_partials = self._value_and_numeric_partials_at(point)
+        variable_index = acc.VariableIndex(self._original_expression._variable_names)
+        accumulator = acc.IndexedPartialsAccumulator(variable_index)
+        for variable_name, numeric_partial in numeric_partials.items():
+            accumulator.add_at(variable_index.index_of(variable_name), numeric_partial)
+        return accumulator
+
+    def _value_and_numeric_partials_at(
+        self: Differential,
+        point: Point
+    ) -> tuple[float, dict[str, float]]:
+        if self._synthetic_partials is None:
+            # The tape's forward sweep also checks for DomainErrors.
+            return self._reverse_mode_tape().value_and_numeric_partials(point)
+        # The original expression and its synthetic partials share one forward sweep.
+        # Evaluating the original expression also checks for DomainErrors.
+        value, *partial_values = self._synthetic_tape().values(point)
+        return (value, dict(zip(self._synthetic_partials.keys(), partial_values)))
+
+    def _synthetic_tape(
+        self: Differential
+    ) -> Tape:
+        # If two threads race here, each builds an equivalent tape.
+        tape = self._synthetic_partials_tape
+        if tape is None:
+            assert self._synthetic_partials is not None
+            tape = tp.Tape(self._original_expression, *self._synthetic_partials.values())
+            self._synthetic_partials_tape = tape
+        return tape
+
+    def directional_at(
+        self: Differential,
+        point: Point,
+        direction: Point
+    ) -> float:
+        """
+        Evaluates the differential at a point and applies it to a direction, giving the
+        directional derivative.
+
+        >>> from smoothmath import Point, Differential
+        >>> from smoothmath.expression import Variable
+        >>> x = Variable("x")
+        >>> y = Variable("y")
+        >>> Differential(x * y).directional_at(Point(x=1, y=2), Point(x=3, y=4))
+        10.0
+
+        This takes a single pass through the expression, however many variables it has.
+        The direction needs a coordinate for each variable of the expression. With a memory
+        budget, this instead takes the budgeted sweeps for the partials.
+
+        :param point: where to evaluate
+        :param direction: the direction, given as a point
+        """
+        if self._memory_budget is not None:
+            numeric_partials = self._numeric_partials_at(point)
+            return sum((
+                numeric_partial * direction.coordinate(variable_name)
+                for variable_name, numeric_partial in numeric_partials.items()
+            ), 0.0)
+        return self._original_expression._directional_derivative(point, direction)
+
+    def _reverse_mode_tape(
+        self: Differential
+    ) -> Tape:
+        if self._memory_budget is None:
+            return self._original_expression._partials_tape()
+        # If two threads race here, each builds an equivalent tape.
+        tape = self._checkpointed_tape
+        if tape is None:
+            tape = ct.CheckpointedTape(self._original_expression, self._memory_budget)
+            self._checkpointed_tape = tape
+        return tape
+
     def component_at(
         self: Differential,
         variable: Variable | str,
@@ -82,8 +381,19 @@ class Differential:
         :param variable: selects which component
         :param point: where to evaluate
         """
+        if self._memory_budget is not None:
+            return self._numeric_partials_at(point).get(va.get_variable_name(variable), 0)
         return self.component(variable).at(point)
 
+    def __getstate__(
+        self: Differential
+    ) -> dict[str, Any]:
+        # The tapes are rebuilt on demand after unpickling.
+        state = self.__dict__.copy()
+        state["_checkpointed_tape"] = None
+        state["_synthetic_partials_tape"] = None
+        return state
+
     def __eq__(
         self: Differential,
         other: Any
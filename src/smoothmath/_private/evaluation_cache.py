@@ -0,0 +1,75 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Optional
+import smoothmath._private.normalization_cache as nc
+import smoothmath._private.compiled_expression as ce
+import smoothmath._private.tape as tp
+if TYPE_CHECKING:
+    from smoothmath import Expression, CompiledExpression
+    from smoothmath._private.tape import Tape
+
+
+# Evaluating an expression with Expression.at() compiles it, and computing its partials
+# builds a tape. Both hold a linearization of the whole expression, so rather than keeping
+# them on every expression that was ever evaluated, we keep the most recently used ones here.
+# Entries are keyed by expression, so structurally equal expressions share them. Expressions
+# without inner expressions are cheap to compile and are never cached.
+DEFAULT_MAXSIZE = 128
+
+_compiled_expressions = nc.LRUCache(DEFAULT_MAXSIZE)
+_tapes = nc.LRUCache(DEFAULT_MAXSIZE)
+# Compiling costs more than walking an expression once, so Expression.at() only compiles an
+# expression the second time it is evaluated. Until then, we only remember its hash, which
+# pins no expression; a collision merely compiles an expression one evaluation early.
+_evaluated_once = nc.LRUCache(DEFAULT_MAXSIZE)
+
+
+def compiled_expression_for(
+    expression: Expression
+) -> CompiledExpression:
+    # If two threads race here, each builds an equivalent compiled expression.
+    if not nc.is_cacheable(expression):
+        return ce.CompiledExpression(expression)
+    compiled = _compiled_expressions.get(expression)
+    if compiled is None:
+        compiled = ce.CompiledExpression(expression)
+        _compiled_expressions.put(expression, compiled)
+    return compiled
+
+
+def compiled_expression_if_reused(
+    expression: Expression
+) -> Optional[CompiledExpression]:
+    # Gives None the first time an expression is evaluated, when walking it is cheaper.
+    if not nc.is_cacheable(expression):
+        return None
+    compiled = _compiled_expressions.get(expression)
+    if compiled is not None:
+        return compiled
+    key = hash(expression)
+    if _evaluated_once.get(key) is None:
+        _evaluated_once.put(key, True)
+        return None
+    return compiled_expression_for(expression)
+
+
+def tape_for(
+    expression: Expression
+) -> Tape:
+    # If two threads race here, each builds an equivalent tape.
+    if not nc.is_cacheable(expression):
+        return tp.Tape(expression)
+    tape = _tapes.get(expression)
+    if tape is None:
+        tape = tp.Tape(expression)
+        _tapes.put(expression, tape)
+    return tape
+
+
+def cached_counts() -> tuple[int, int]:
+    return (_compiled_expressions.info().currsize, _tapes.info().currsize)
+
+
+def clear() -> None:
+    _compiled_expressions.clear()
+    _tapes.clear()
+    _evaluated_once.clear()
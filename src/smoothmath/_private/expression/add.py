@@ -4,13 +4,13 @@ import smoothmath._private.base_expression as base
 import smoothmath._private.base_expression.expression as be
 import smoothmath._private.expression as ex
 import smoothmath._private.math_functions as mf
+import smoothmath._private.vectorized_math_functions as vmf
 import smoothmath._private.utilities as util
+import smoothmath._private.taylor_series as ts
 if TYPE_CHECKING:
-    from smoothmath import Point, Expression
-    from smoothmath.expression import Constant, Negation, Logarithm
-    from smoothmath._private.accumulators import (
-        NumericPartialsAccumulator, SyntheticPartialsAccumulator
-    )
+    from smoothmath import Expression
+    from smoothmath.expression import Constant, Logarithm
+    from smoothmath._private.vectorized_math_functions import Array
 
 
 class Add(base.NAryExpression):
@@ -26,6 +26,8 @@ class Add(base.NAryExpression):
     :param \\*args: the expressions being added together
     """
 
+    __slots__ = ()
+
     ## Evaluation ##
 
     def _verify_domain_constraints(
@@ -40,43 +42,57 @@ class Add(base.NAryExpression):
     ) -> float:
         return mf.add(*inner_values)
 
+    def _vectorized_domain_violations(
+        self: Add,
+        *inner_values: Array
+    ) -> list[tuple[str, Array]]:
+        return []
+
+    def _vectorized_value_formula(
+        self: Add,
+        *inner_values: Array
+    ) -> Array:
+        return vmf.add(*inner_values)
+
     ## Partials ##
 
-    def _numeric_partial(
+    def _synthetic_partial_from_inners(
         self: Add,
         variable_name: str,
-        point: Point
-    ) -> float:
-        return mf.add(*(
-            inner._numeric_partial(variable_name, point)
-            for inner in self._inners
-        ))
+        inner_partials: list[Expression]
+    ) -> Expression:
+        return Add(*inner_partials)
 
-    def _synthetic_partial(
+    def _local_partials(
         self: Add,
-        variable_name: str
-    ) -> Expression:
-        return Add(*(
-            inner._synthetic_partial(variable_name)
-            for inner in self._inners
-        ))
+        value: float,
+        inner_values: list[float]
+    ) -> list[float]:
+        return [1.0] * len(inner_values)
 
-    def _compute_numeric_partials(
+    def _local_partial_tangents(
         self: Add,
-        accumulator: NumericPartialsAccumulator,
-        multiplier: float,
-        point: Point
-    ) -> None:
-        for inner in self._inners:
-            inner._compute_numeric_partials(accumulator, multiplier, point)
+        value: float,
+        inner_values: list[float],
+        inner_tangents: list[float]
+    ) -> list[float]:
+        return [0.0] * len(inner_values)
 
-    def _compute_synthetic_partials(
+    def _taylor_coefficients(
+        self: Add,
+        value: float,
+        inner_coefficients: list[list[float]],
+        order: int
+    ) -> list[float]:
+        if not inner_coefficients:
+            return ts.constant(value, order)
+        return ts.add(*inner_coefficients)
+
+    def _synthetic_multipliers(
         self: Add,
-        accumulator: SyntheticPartialsAccumulator,
         multiplier: Expression
-    ) -> None:
-        for inner in self._inners:
-            inner._compute_synthetic_partials(accumulator, multiplier)
+    ) -> list[Expression]:
+        return [multiplier] * len(self._inners)
 
     ## Normalization and Reduction ##
 
@@ -147,12 +163,17 @@ class Add(base.NAryExpression):
         return Add(*non_constants, ex.Constant(summed))
 
     def _normalize_fully_reduced(
-        self: Add
+        self: Add,
+        normalized_inners: list[Expression]
     ) -> Expression:
-        negations: list[Negation]; non_negations: list[Expression]
-        negations, non_negations = be.partition_by_given_type(self._inners, ex.Negation)
-        type_i_terms = [term._normalize() for term in non_negations]
-        type_ii_terms = [negation._inner._normalize() for negation in negations]
+        # A normalized Negation is a Negation of the normalized inner expression.
+        type_i_terms: list[Expression]; type_ii_terms: list[Expression]
+        type_i_terms = []; type_ii_terms = []
+        for inner, normalized_inner in zip(self._inners, normalized_inners):
+            if isinstance(inner, ex.Negation):
+                type_ii_terms.append(normalized_inner._inner)
+            else:
+                type_i_terms.append(normalized_inner)
         type_i_count = len(type_i_terms)
         type_ii_count = len(type_ii_terms)
         if type_i_count >= 1 and type_ii_count >= 1:
@@ -1,12 +1,14 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable, Optional
 import smoothmath._private.base_expression as base
 import smoothmath._private.expression as ex
+import smoothmath._private.vectorized_math_functions as vmf
+import smoothmath._private.taylor_series as ts
 if TYPE_CHECKING:
     from smoothmath import Point, Expression
-    from smoothmath._private.accumulators import (
-        NumericPartialsAccumulator, SyntheticPartialsAccumulator
-    )
+    from smoothmath._private.compiled_expression import Step, VectorizedStep
+    from smoothmath._private.columns import Columns
+    from smoothmath._private.vectorized_math_functions import Array
 
 
 class Constant(base.Expression):
@@ -19,11 +21,14 @@ class Constant(base.Expression):
 
     :param value: the real number value of the constant
     """
+
+    __slots__ = ("value",)
+
     def __init__(
         self: Constant,
         value: float
     ) -> None:
-        super().__init__(variable_names = set())
+        super().__init__(variable_names = frozenset())
         self.value: float
         self.value = value
 
@@ -32,81 +37,116 @@ class Constant(base.Expression):
     ) -> Expression:
         return Constant(self.value)
 
-    ## Evaluation ##
+    def _interning_key(
+        self: Constant
+    ) -> tuple[Any, ...]:
+        # Keep Constant(1) and Constant(1.0) apart so each keeps its own representation.
+        return (Constant, self.value.__class__, self.value)
 
-    def _reset_evaluation_cache(
+    def _subexpressions(
         self: Constant
-    ) -> None:
-        pass
+    ) -> list[Expression]:
+        return []
+
+    ## Evaluation ##
 
-    def _evaluate(
+    def _value_from_inners(
         self: Constant,
+        inner_values: list[float],
         point: Point
     ) -> float:
         return self.value
 
+    def _compile_step(
+        self: Constant,
+        inner_indices: tuple[int, ...]
+    ) -> Step:
+        value = self.value
+        def step(
+            values: list[float],
+            point: Point
+        ) -> float:
+            return value
+        return step
+
+    def _vectorized_step(
+        self: Constant,
+        inner_indices: tuple[int, ...]
+    ) -> VectorizedStep:
+        value = self.value
+        def step(
+            values: list[Array],
+            columns: Columns
+        ) -> Array:
+            return vmf.full(columns.row_count, value)
+        return step
+
     ## Partials ##
 
-    def _numeric_partial(
+    def _synthetic_partial_from_inners(
         self: Constant,
         variable_name: str,
-        point: Point
-    ) -> float:
-        return 0
-
-    def _synthetic_partial(
-        self: Constant,
-        variable_name: str
+        inner_partials: list[Expression]
     ) -> Expression:
         return ex.Constant(0)
 
-    def _compute_numeric_partials(
+    def _local_partials(
         self: Constant,
-        accumulator: NumericPartialsAccumulator,
-        multiplier: float,
-        point: Point
-    ) -> None:
-        pass
+        value: float,
+        inner_values: list[float]
+    ) -> list[float]:
+        return []
+
+    def _local_partial_tangents(
+        self: Constant,
+        value: float,
+        inner_values: list[float],
+        inner_tangents: list[float]
+    ) -> list[float]:
+        return []
+
+    def _taylor_coefficients(
+        self: Constant,
+        value: float,
+        inner_coefficients: list[list[float]],
+        order: int
+    ) -> list[float]:
+        return ts.constant(value, order)
 
-    def _compute_synthetic_partials(
+    def _synthetic_multipliers(
         self: Constant,
-        accumulator: SyntheticPartialsAccumulator,
         multiplier: Expression
-    ) -> None:
-        pass
+    ) -> list[Expression]:
+        return []
 
     ## Normalization and Reduction ##
 
-    def _take_reduction_step(
+    @property
+    def _reducers(
         self: Constant
-    ) -> Constant:
-        self._is_fully_reduced = True
-        return self
+    ) -> list[Callable[[], Optional[Expression]]]:
+        return []
 
     def _normalize_fully_reduced(
-        self: Constant
+        self: Constant,
+        normalized_inners: list[Expression]
     ) -> Expression:
         return self._rebuild()
 
     ## Operations ##
 
-    def __eq__(
+    def _same_parameters(
         self: Constant,
-        other: Any
+        other: Constant
     ) -> bool:
-        return (other.__class__ == self.__class__) and (other.value == self.value)
+        return other.value == self.value
 
-    def __hash__(
+    def _structural_hash(
         self: Constant
     ) -> int:
         return hash(("Constant", self.value))
 
-    def __str__(
-        self: Constant
-    ) -> str:
-        return f"Constant({self.value})"
-
-    def __repr__(
+    def _string_pieces(
         self: Constant
-    ) -> str:
-        return f"Constant({self.value})"
+    ) -> list[str]:
+        return [f"Constant({self.value})"]
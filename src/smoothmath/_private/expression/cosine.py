@@ -3,8 +3,11 @@ from typing import TYPE_CHECKING, Callable, Optional
 import smoothmath._private.base_expression as base
 import smoothmath._private.expression as ex
 import smoothmath._private.math_functions as mf
+import smoothmath._private.vectorized_math_functions as vmf
+import smoothmath._private.taylor_series as ts
 if TYPE_CHECKING:
-    from smoothmath import Point, Expression
+    from smoothmath import Expression
+    from smoothmath._private.vectorized_math_functions import Array
 
 
 class Cosine(base.UnaryExpression):
@@ -19,6 +22,8 @@ class Cosine(base.UnaryExpression):
     :param inner: an expression representing an angle in radians
     """
 
+    __slots__ = ()
+
     ## Evaluation ##
 
     def _verify_domain_constraints(
@@ -33,15 +38,44 @@ class Cosine(base.UnaryExpression):
     ) -> float:
         return mf.cosine(inner_value)
 
+    def _vectorized_domain_violations(
+        self: Cosine,
+        inner_values: Array
+    ) -> list[tuple[str, Array]]:
+        return []
+
+    def _vectorized_value_formula(
+        self: Cosine,
+        inner_values: Array
+    ) -> Array:
+        return vmf.cosine(inner_values)
+
     ## Partials ##
 
-    def _numeric_partial_formula(
+    def _local_partial_formula(
         self: Cosine,
-        point: Point,
-        multiplier: float
+        inner_value: float,
+        value: float
     ) -> float:
-        inner_value = self._inner._evaluate(point)
-        return mf.multiply(mf.negation(mf.sine(inner_value)), multiplier)
+        return mf.negation(mf.sine(inner_value))
+
+    def _local_second_partial_formula(
+        self: Cosine,
+        inner_value: float,
+        value: float
+    ) -> float:
+        return mf.negation(mf.cosine(inner_value))
+
+    def _taylor_coefficients(
+        self: Cosine,
+        value: float,
+        inner_coefficients: list[list[float]],
+        order: int
+    ) -> list[float]:
+        (inner,) = inner_coefficients
+        (_, cosine) = ts.sine_and_cosine(inner)
+        cosine[0] = value
+        return cosine
 
     def _synthetic_partial_formula(
         self: Cosine,
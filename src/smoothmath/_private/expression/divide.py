@@ -3,12 +3,12 @@ from typing import TYPE_CHECKING, Callable, Optional
 import smoothmath._private.base_expression as base
 import smoothmath._private.expression as ex
 import smoothmath._private.math_functions as mf
+import smoothmath._private.vectorized_math_functions as vmf
 import smoothmath._private.errors as er
+import smoothmath._private.taylor_series as ts
 if TYPE_CHECKING:
-    from smoothmath import Point, Expression
-    from smoothmath._private.accumulators import (
-        NumericPartialsAccumulator, SyntheticPartialsAccumulator
-    )
+    from smoothmath import Expression
+    from smoothmath._private.vectorized_math_functions import Array
 
 
 class Divide(base.BinaryExpression):
@@ -27,6 +27,8 @@ class Divide(base.BinaryExpression):
     :param right: the denominator
     """
 
+    __slots__ = ()
+
     ## Evaluation ##
 
     def _verify_domain_constraints(
@@ -47,65 +49,82 @@ class Divide(base.BinaryExpression):
     ) -> float:
         return mf.divide(left_value, right_value)
 
+    def _vectorized_domain_violations(
+        self: Divide,
+        left_values: Array,
+        right_values: Array
+    ) -> list[tuple[str, Array]]:
+        right_is_zero = (right_values == 0)
+        return [
+            ("Divide(x, y) is not smooth around (x = 0, y = 0)", right_is_zero & (left_values == 0)),
+            ("Divide(x, y) blows up around x != 0 and y = 0", right_is_zero & (left_values != 0))
+        ]
+
+    def _vectorized_value_formula(
+        self: Divide,
+        left_values: Array,
+        right_values: Array
+    ) -> Array:
+        return vmf.divide(left_values, right_values)
+
     ## Partials ##
 
-    def _numeric_partial(
+    def _synthetic_partial_from_inners(
         self: Divide,
         variable_name: str,
-        point: Point
-    ) -> float:
-        left_value = self._left._evaluate(point)
-        right_value = self._right._evaluate(point)
-        self._verify_domain_constraints(left_value, right_value)
-        left_partial = self._left._numeric_partial(variable_name, point)
-        right_partial = self._right._numeric_partial(variable_name, point)
-        return mf.add(
-            self._numeric_partial_formula_left(point, left_partial),
-            self._numeric_partial_formula_right(point, right_partial)
-        )
-
-    def _synthetic_partial(
-        self: Divide,
-        variable_name: str
+        inner_partials: list[Expression]
     ) -> Expression:
-        left_partial = self._left._synthetic_partial(variable_name)
-        right_partial = self._right._synthetic_partial(variable_name)
+        (left_partial, right_partial) = inner_partials
         return ex.Add(
             self._synthetic_partial_formula_left(left_partial),
             self._synthetic_partial_formula_right(right_partial)
         )
 
-    def _compute_numeric_partials(
-        self: Divide,
-        accumulator: NumericPartialsAccumulator,
-        multiplier: float,
-        point: Point
-    ) -> None:
-        left_value = self._left._evaluate(point)
-        right_value = self._right._evaluate(point)
-        self._verify_domain_constraints(left_value, right_value)
-        next_multiplier_left = self._numeric_partial_formula_left(point, multiplier)
-        next_multiplier_right = self._numeric_partial_formula_right(point, multiplier)
-        self._left._compute_numeric_partials(accumulator, next_multiplier_left, point)
-        self._right._compute_numeric_partials(accumulator, next_multiplier_right, point)
-
-    def _compute_synthetic_partials(
+    def _local_partial_formula_left(
         self: Divide,
-        accumulator: SyntheticPartialsAccumulator,
-        multiplier: Expression
-    ) -> None:
-        next_multiplier_left = self._synthetic_partial_formula_left(multiplier)
-        next_multiplier_right = self._synthetic_partial_formula_right(multiplier)
-        self._left._compute_synthetic_partials(accumulator, next_multiplier_left)
-        self._right._compute_synthetic_partials(accumulator, next_multiplier_right)
+        left_value: float,
+        right_value: float,
+        value: float
+    ) -> float:
+        return mf.reciprocal(right_value)
 
-    def _numeric_partial_formula_left(
+    def _local_partial_formula_right(
         self: Divide,
-        point: Point,
-        multiplier: float
+        left_value: float,
+        right_value: float,
+        value: float
     ) -> float:
-        right_value = self._right._evaluate(point)
-        return mf.divide(multiplier, right_value)
+        return mf.negation(mf.divide(left_value, mf.nth_power(right_value, n = 2)))
+
+    def _local_second_partial_formulas(
+        self: Divide,
+        left_value: float,
+        right_value: float,
+        value: float
+    ) -> tuple[float, float, float]:
+        return (
+            0.0,
+            mf.negation(mf.reciprocal(mf.nth_power(right_value, n = 2))),
+            mf.divide(mf.multiply(2, left_value), mf.nth_power(right_value, n = 3))
+        )
+
+    def _taylor_coefficients(
+        self: Divide,
+        value: float,
+        inner_coefficients: list[list[float]],
+        order: int
+    ) -> list[float]:
+        (left, right) = inner_coefficients
+        return ts.divide(left, right, value)
+
+    def _synthetic_multipliers(
+        self: Divide,
+        multiplier: Expression
+    ) -> list[Expression]:
+        return [
+            self._synthetic_partial_formula_left(multiplier),
+            self._synthetic_partial_formula_right(multiplier)
+        ]
 
     def _synthetic_partial_formula_left(
         self: Divide,
@@ -113,18 +132,6 @@ class Divide(base.BinaryExpression):
     ) -> Expression:
         return ex.Divide(multiplier, self._right)
 
-    def _numeric_partial_formula_right(
-        self: Divide,
-        point: Point,
-        multiplier: float
-    ) -> float:
-        left_value = self._left._evaluate(point)
-        right_value = self._right._evaluate(point)
-        return mf.multiply(
-            mf.negation(mf.divide(left_value, mf.nth_power(right_value, n = 2))),
-            multiplier
-        )
-
     def _synthetic_partial_formula_right(
         self: Divide,
         multiplier: Expression
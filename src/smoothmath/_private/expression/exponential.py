@@ -4,9 +4,12 @@ import math
 import smoothmath._private.base_expression as base
 import smoothmath._private.expression as ex
 import smoothmath._private.math_functions as mf
+import smoothmath._private.vectorized_math_functions as vmf
 import smoothmath._private.errors as er
+import smoothmath._private.taylor_series as ts
 if TYPE_CHECKING:
-    from smoothmath import Point, Expression
+    from smoothmath import Expression
+    from smoothmath._private.vectorized_math_functions import Array
 
 
 class Exponential(base.ParameterizedUnaryExpression):
@@ -22,6 +25,8 @@ class Exponential(base.ParameterizedUnaryExpression):
     :param base: the base, *as a positive real number*
     """
 
+    __slots__ = ()
+
     def __init__(
         self: Exponential,
         inner: Expression,
@@ -37,10 +42,10 @@ class Exponential(base.ParameterizedUnaryExpression):
     ) -> float:
         return self._parameter
 
-    def _to_string(
+    def _string_pieces(
         self: Exponential
-    ) -> str:
-        return f"Exponential({self._inner}, base={self.base})"
+    ) -> list[str]:
+        return ["Exponential(", f", base={self.base})"]
 
     ## Evaluation ##
 
@@ -56,24 +61,57 @@ class Exponential(base.ParameterizedUnaryExpression):
     ):
         return mf.exponential(inner_value, base = self.base)
 
+    def _vectorized_domain_violations(
+        self: Exponential,
+        inner_values: Array
+    ) -> list[tuple[str, Array]]:
+        return []
+
+    def _vectorized_value_formula(
+        self: Exponential,
+        inner_values: Array
+    ) -> Array:
+        return vmf.exponential(inner_values, base = self.base)
+
     ## Partials ##
 
-    def _numeric_partial_formula(
+    def _local_partial_formula(
         self: Exponential,
-        point: Point,
-        multiplier: float
+        inner_value: float,
+        value: float
     ) -> float:
         if self.base == 1:
-            return 0
-        self_value = self._evaluate(point)
-        if self.base == math.e:
-            return mf.multiply(self_value, multiplier)
+            return 0.0
+        elif self.base == math.e:
+            return value
         else:
-            return mf.multiply(
-                mf.logarithm(self.base, base = math.e),
-                self_value,
-                multiplier
-            )
+            return mf.multiply(mf.logarithm(self.base, base = math.e), value)
+
+    def _local_second_partial_formula(
+        self: Exponential,
+        inner_value: float,
+        value: float
+    ) -> float:
+        if self.base == 1:
+            return 0.0
+        elif self.base == math.e:
+            return value
+        else:
+            return mf.multiply(mf.nth_power(mf.logarithm(self.base, base = math.e), n = 2), value)
+
+    def _taylor_coefficients(
+        self: Exponential,
+        value: float,
+        inner_coefficients: list[list[float]],
+        order: int
+    ) -> list[float]:
+        (inner,) = inner_coefficients
+        if self.base == 1:
+            return ts.constant(value, order)
+        elif self.base == math.e:
+            return ts.natural_exponential(inner, value)
+        else:
+            return ts.natural_exponential(ts.scale(inner, mf.logarithm(self.base, base = math.e)), value)
 
     def _synthetic_partial_formula(
         self: Exponential,
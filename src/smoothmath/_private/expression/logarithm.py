@@ -4,10 +4,13 @@ import math
 import smoothmath._private.base_expression as base
 import smoothmath._private.expression as ex
 import smoothmath._private.math_functions as mf
+import smoothmath._private.vectorized_math_functions as vmf
 import smoothmath._private.utilities as util
 import smoothmath._private.errors as er
+import smoothmath._private.taylor_series as ts
 if TYPE_CHECKING:
-    from smoothmath import Point, Expression
+    from smoothmath import Expression
+    from smoothmath._private.vectorized_math_functions import Array
 
 
 class Logarithm(base.ParameterizedUnaryExpression):
@@ -24,6 +27,9 @@ class Logarithm(base.ParameterizedUnaryExpression):
     :param inner: the expression to take the logarithm of
     :param base: the base, *as a positive real number other than one*
     """
+
+    __slots__ = ()
+
     def __init__(
         self: Logarithm,
         inner: Expression,
@@ -41,10 +47,10 @@ class Logarithm(base.ParameterizedUnaryExpression):
     ) -> float:
         return self._parameter
 
-    def _to_string(
+    def _string_pieces(
         self: Logarithm
-    ) -> str:
-        return f"Logarithm({self._inner}, base={self.base})"
+    ) -> list[str]:
+        return ["Logarithm(", f", base={self.base})"]
 
     ## Evaluation ##
 
@@ -63,21 +69,61 @@ class Logarithm(base.ParameterizedUnaryExpression):
     ):
         return mf.logarithm(inner_value, base = self.base)
 
+    def _vectorized_domain_violations(
+        self: Logarithm,
+        inner_values: Array
+    ) -> list[tuple[str, Array]]:
+        return [
+            ("Logarithm(x) blows up around x = 0", inner_values == 0),
+            ("Logarithm(x) is undefined for x < 0", inner_values < 0)
+        ]
+
+    def _vectorized_value_formula(
+        self: Logarithm,
+        inner_values: Array
+    ) -> Array:
+        return vmf.logarithm(inner_values, base = self.base)
+
     ## Partials ##
 
-    def _numeric_partial_formula(
+    def _local_partial_formula(
         self: Logarithm,
-        point: Point,
-        multiplier: float
+        inner_value: float,
+        value: float
     ) -> float:
-        inner_value = self._inner._evaluate(point)
         if self.base == math.e:
-            return mf.divide(multiplier, inner_value)
+            return mf.reciprocal(inner_value)
         else:
-            return mf.divide(
-                multiplier,
-                mf.multiply(mf.logarithm(self.base, base = math.e), inner_value)
+            return mf.reciprocal(mf.multiply(mf.logarithm(self.base, base = math.e), inner_value))
+
+    def _local_second_partial_formula(
+        self: Logarithm,
+        inner_value: float,
+        value: float
+    ) -> float:
+        if self.base == math.e:
+            return mf.negation(mf.reciprocal(mf.nth_power(inner_value, n = 2)))
+        else:
+            return mf.negation(mf.reciprocal(
+                mf.multiply(mf.logarithm(self.base, base = math.e), mf.nth_power(inner_value, n = 2))
+            ))
+
+    def _taylor_coefficients(
+        self: Logarithm,
+        value: float,
+        inner_coefficients: list[list[float]],
+        order: int
+    ) -> list[float]:
+        (inner,) = inner_coefficients
+        if self.base == math.e:
+            return ts.natural_logarithm(inner, value)
+        else:
+            coefficients = ts.scale(
+                ts.natural_logarithm(inner, mf.logarithm(inner[0], base = math.e)),
+                mf.reciprocal(mf.logarithm(self.base, base = math.e))
             )
+            coefficients[0] = value
+            return coefficients
 
     def _synthetic_partial_formula(
         self: Logarithm,
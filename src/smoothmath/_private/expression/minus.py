@@ -3,11 +3,11 @@ from typing import TYPE_CHECKING, Callable, Optional
 import smoothmath._private.base_expression as base
 import smoothmath._private.expression as ex
 import smoothmath._private.math_functions as mf
+import smoothmath._private.vectorized_math_functions as vmf
+import smoothmath._private.taylor_series as ts
 if TYPE_CHECKING:
-    from smoothmath import Point, Expression
-    from smoothmath._private.accumulators import (
-        NumericPartialsAccumulator, SyntheticPartialsAccumulator
-    )
+    from smoothmath import Expression
+    from smoothmath._private.vectorized_math_functions import Array
 
 
 class Minus(base.BinaryExpression):
@@ -24,6 +24,8 @@ class Minus(base.BinaryExpression):
     :param right: the expression being subtracted
     """
 
+    __slots__ = ()
+
     ## Evaluation ##
 
     def _verify_domain_constraints(
@@ -40,41 +42,68 @@ class Minus(base.BinaryExpression):
     ) -> float:
         return mf.minus(left_value, right_value)
 
+    def _vectorized_domain_violations(
+        self: Minus,
+        left_values: Array,
+        right_values: Array
+    ) -> list[tuple[str, Array]]:
+        return []
+
+    def _vectorized_value_formula(
+        self: Minus,
+        left_values: Array,
+        right_values: Array
+    ) -> Array:
+        return vmf.minus(left_values, right_values)
+
     ## Partials ##
 
-    def _numeric_partial(
+    def _synthetic_partial_from_inners(
         self: Minus,
         variable_name: str,
-        point: Point
+        inner_partials: list[Expression]
+    ) -> Expression:
+        (left_partial, right_partial) = inner_partials
+        return ex.Minus(left_partial, right_partial)
+
+    def _local_partial_formula_left(
+        self: Minus,
+        left_value: float,
+        right_value: float,
+        value: float
     ) -> float:
-        left_partial = self._left._numeric_partial(variable_name, point)
-        right_partial = self._right._numeric_partial(variable_name, point)
-        return mf.minus(left_partial, right_partial)
+        return 1.0
 
-    def _synthetic_partial(
+    def _local_partial_formula_right(
         self: Minus,
-        variable_name: str
-    ) -> Expression:
-        left_partial = self._left._synthetic_partial(variable_name)
-        right_partial = self._right._synthetic_partial(variable_name)
-        return ex.Minus(left_partial, right_partial)
+        left_value: float,
+        right_value: float,
+        value: float
+    ) -> float:
+        return -1.0
 
-    def _compute_numeric_partials(
+    def _local_second_partial_formulas(
         self: Minus,
-        accumulator: NumericPartialsAccumulator,
-        multiplier: float,
-        point: Point
-    ) -> None:
-        self._left._compute_numeric_partials(accumulator, multiplier, point)
-        self._right._compute_numeric_partials(accumulator, mf.negation(multiplier), point)
+        left_value: float,
+        right_value: float,
+        value: float
+    ) -> tuple[float, float, float]:
+        return (0.0, 0.0, 0.0)
+
+    def _taylor_coefficients(
+        self: Minus,
+        value: float,
+        inner_coefficients: list[list[float]],
+        order: int
+    ) -> list[float]:
+        (left, right) = inner_coefficients
+        return ts.minus(left, right)
 
-    def _compute_synthetic_partials(
+    def _synthetic_multipliers(
         self: Minus,
-        accumulator: SyntheticPartialsAccumulator,
         multiplier: Expression
-    ) -> None:
-        self._left._compute_synthetic_partials(accumulator, multiplier)
-        self._right._compute_synthetic_partials(accumulator, ex.Negation(multiplier))
+    ) -> list[Expression]:
+        return [multiplier, ex.Negation(multiplier)]
 
     ## Normalization and Reduction ##
 
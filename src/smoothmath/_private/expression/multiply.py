@@ -4,13 +4,13 @@ import smoothmath._private.base_expression as base
 import smoothmath._private.base_expression.expression as be
 import smoothmath._private.expression as ex
 import smoothmath._private.math_functions as mf
+import smoothmath._private.vectorized_math_functions as vmf
 import smoothmath._private.utilities as util
+import smoothmath._private.taylor_series as ts
 if TYPE_CHECKING:
-    from smoothmath import Point, Expression
-    from smoothmath.expression import Constant, Negation, Reciprocal, NthPower, NthRoot, Exponential
-    from smoothmath._private.accumulators import (
-        NumericPartialsAccumulator, SyntheticPartialsAccumulator
-    )
+    from smoothmath import Expression
+    from smoothmath.expression import Constant, Negation, NthPower, NthRoot, Exponential
+    from smoothmath._private.vectorized_math_functions import Array
 
 
 class Multiply(base.NAryExpression):
@@ -26,6 +26,8 @@ class Multiply(base.NAryExpression):
     :param \\*args: the expressions being multiplied together
     """
 
+    __slots__ = ()
+
     ## Evaluation ##
 
     def _verify_domain_constraints(
@@ -40,59 +42,107 @@ class Multiply(base.NAryExpression):
     ) -> float:
         return mf.multiply(*inner_values)
 
-    ## Partials ##
+    def _vectorized_domain_violations(
+        self: Multiply,
+        *inner_values: Array
+    ) -> list[tuple[str, Array]]:
+        return []
 
-    def _numeric_partial(
+    def _vectorized_value_formula(
         self: Multiply,
-        variable_name: str,
-        point: Point
-    ) -> float:
-        inner_values = [inner._evaluate(point) for inner in self._inners]
-        return mf.add(*(
-            mf.multiply(
-                inner._numeric_partial(variable_name, point),
-                *util.list_without_entry_at(inner_values, i)
-            )
-            for (i, inner) in enumerate(self._inners)
-        ))
+        *inner_values: Array
+    ) -> Array:
+        return vmf.multiply(*inner_values)
+
+    ## Partials ##
 
-    def _synthetic_partial(
+    def _synthetic_partial_from_inners(
         self: Multiply,
-        variable_name: str
+        variable_name: str,
+        inner_partials: list[Expression]
     ) -> Expression:
         return ex.Add(*(
-            ex.Multiply(
-                inner._synthetic_partial(variable_name),
-                *util.list_without_entry_at(self._inners, i)
-            )
-            for (i, inner) in enumerate(self._inners)
+            ex.Multiply(inner_partial, *factors)
+            for (inner_partial, factors) in zip(inner_partials, self._synthetic_factors_of_others())
         ))
 
-    def _compute_numeric_partials(
+    def _local_partials(
         self: Multiply,
-        accumulator: NumericPartialsAccumulator,
-        multiplier: float,
-        point: Point
-    ) -> None:
-        inner_values = [inner._evaluate(point) for inner in self._inners]
-        for i, inner in enumerate(self._inners):
-            next_multiplier = mf.multiply(
-                multiplier,
-                *util.list_without_entry_at(inner_values, i)
-            )
-            inner._compute_numeric_partials(accumulator, next_multiplier, point)
+        value: float,
+        inner_values: list[float]
+    ) -> list[float]:
+        # The product of the other inner values is the product of the values before it
+        # times the product of the values after it. Like mf.multiply(), these products
+        # skip multiplying as soon as a factor is zero.
+        prefixes = _prefix_products(inner_values)
+        suffixes = _prefix_products(inner_values[::-1])[::-1]
+        return [
+            mf.multiply(prefix, suffix)
+            for (prefix, suffix) in zip(prefixes, suffixes)
+        ]
+
+    def _local_partial_tangents(
+        self: Multiply,
+        value: float,
+        inner_values: list[float],
+        inner_tangents: list[float]
+    ) -> list[float]:
+        # The local partial for inner i is a prefix product times a suffix product, so
+        # its tangent follows from the tangents of those products, by the product rule.
+        prefixes = _prefix_products(inner_values)
+        prefix_tangents = _prefix_product_tangents(inner_values, inner_tangents, prefixes)
+        suffixes = _prefix_products(inner_values[::-1])[::-1]
+        suffix_tangents = _prefix_product_tangents(inner_values[::-1], inner_tangents[::-1], suffixes[::-1])[::-1]
+        return [
+            mf.add(mf.multiply(prefix_tangent, suffix), mf.multiply(prefix, suffix_tangent))
+            for (prefix, prefix_tangent, suffix, suffix_tangent)
+            in zip(prefixes, prefix_tangents, suffixes, suffix_tangents)
+        ]
+
+    def _taylor_coefficients(
+        self: Multiply,
+        value: float,
+        inner_coefficients: list[list[float]],
+        order: int
+    ) -> list[float]:
+        coefficients = ts.constant(1.0, order)
+        for inner in inner_coefficients:
+            coefficients = ts.multiply(coefficients, inner)
+        return coefficients
 
-    def _compute_synthetic_partials(
+    def _synthetic_multipliers(
         self: Multiply,
-        accumulator: SyntheticPartialsAccumulator,
         multiplier: Expression
-    ) -> None:
-        for i, inner in enumerate(self._inners):
-            next_multiplier = ex.Multiply(
-                multiplier,
-                *util.list_without_entry_at(self._inners, i)
-            )
-            inner._compute_synthetic_partials(accumulator, next_multiplier)
+    ) -> list[Expression]:
+        return [
+            ex.Multiply(multiplier, *factors)
+            for factors in self._synthetic_factors_of_others()
+        ]
+
+    def _synthetic_factors_of_others(
+        self: Multiply
+    ) -> list[list[Expression]]:
+        # For each inner, factors whose product is the product of the other inners. The
+        # factors are products of the inners before it and of the inners after it. These
+        # prefix and suffix products are shared, so there are O(n) of them in all, rather
+        # than O(n^2) copies of inner expressions.
+        inners = self._inners
+        count = len(inners)
+        prefixes: list[Optional[Expression]]
+        prefixes = [None]
+        for i in range(1, count):
+            previous = prefixes[i - 1]
+            prefixes.append(inners[0] if previous is None else ex.Multiply(previous, inners[i - 1]))
+        suffixes: list[Optional[Expression]]
+        suffixes = [None]
+        for i in range(count - 2, -1, -1):
+            following = suffixes[-1]
+            suffixes.append(inners[count - 1] if following is None else ex.Multiply(inners[i + 1], following))
+        suffixes.reverse()
+        return [
+            [factor for factor in (prefix, suffix) if factor is not None]
+            for (prefix, suffix) in zip(prefixes, suffixes)
+        ]
 
     ## Normalization and Reduction ##
 
@@ -232,12 +282,17 @@ class Multiply(base.NAryExpression):
         return Multiply(*non_constants, ex.Constant(product))
 
     def _normalize_fully_reduced(
-        self: Multiply
+        self: Multiply,
+        normalized_inners: list[Expression]
     ) -> Expression:
-        reciprocals: list[Reciprocal]; non_reciprocals: list[Expression]
-        reciprocals, non_reciprocals = be.partition_by_given_type(self._inners, ex.Reciprocal)
-        numerator_terms = [non_reciprocal._normalize() for non_reciprocal in non_reciprocals]
-        denominator_terms = [reciprocal._inner._normalize() for reciprocal in reciprocals]
+        # A normalized Reciprocal is a Reciprocal of the normalized inner expression.
+        numerator_terms: list[Expression]; denominator_terms: list[Expression]
+        numerator_terms = []; denominator_terms = []
+        for inner, normalized_inner in zip(self._inners, normalized_inners):
+            if isinstance(inner, ex.Reciprocal):
+                denominator_terms.append(normalized_inner._inner)
+            else:
+                numerator_terms.append(normalized_inner)
         numerator_count = len(numerator_terms)
         denominator_count = len(denominator_terms)
         if numerator_count >= 1 and denominator_count >= 1:
@@ -263,3 +318,32 @@ def _simplified_Multiply(
         return terms[0]
     else: # inners_count >= 2
         return Multiply(*terms)
+
+
+# Entry i is the product of the values before index i.
+def _prefix_products(
+    values: list[float]
+) -> list[float]:
+    if not values:
+        return []
+    products = [1.0]
+    for value in values[:-1]:
+        products.append(mf.multiply(products[-1], value))
+    return products
+
+
+# Entry i is the tangent of the product of the values before index i.
+def _prefix_product_tangents(
+    values: list[float],
+    tangents: list[float],
+    prefixes: list[float]
+) -> list[float]:
+    if not values:
+        return []
+    product_tangents = [0.0]
+    for i in range(len(values) - 1):
+        product_tangents.append(mf.add(
+            mf.multiply(product_tangents[-1], values[i]),
+            mf.multiply(prefixes[i], tangents[i])
+        ))
+    return product_tangents
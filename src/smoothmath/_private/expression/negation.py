@@ -3,8 +3,11 @@ from typing import TYPE_CHECKING, Callable, Optional
 import smoothmath._private.base_expression as base
 import smoothmath._private.expression as ex
 import smoothmath._private.math_functions as mf
+import smoothmath._private.vectorized_math_functions as vmf
+import smoothmath._private.taylor_series as ts
 if TYPE_CHECKING:
-    from smoothmath import Point, Expression
+    from smoothmath import Expression
+    from smoothmath._private.vectorized_math_functions import Array
 
 
 class Negation(base.UnaryExpression):
@@ -19,6 +22,8 @@ class Negation(base.UnaryExpression):
     :param inner: the inner expression
     """
 
+    __slots__ = ()
+
     ## Evaluation ##
 
     def _verify_domain_constraints(
@@ -33,14 +38,42 @@ class Negation(base.UnaryExpression):
     ) -> float:
         return mf.negation(inner_value)
 
+    def _vectorized_domain_violations(
+        self: Negation,
+        inner_values: Array
+    ) -> list[tuple[str, Array]]:
+        return []
+
+    def _vectorized_value_formula(
+        self: Negation,
+        inner_values: Array
+    ) -> Array:
+        return vmf.negation(inner_values)
+
     ## Partials ##
 
-    def _numeric_partial_formula(
+    def _local_partial_formula(
         self: Negation,
-        point: Point,
-        multiplier: float
+        inner_value: float,
+        value: float
     ) -> float:
-        return mf.negation(multiplier)
+        return -1.0
+
+    def _local_second_partial_formula(
+        self: Negation,
+        inner_value: float,
+        value: float
+    ) -> float:
+        return 0.0
+
+    def _taylor_coefficients(
+        self: Negation,
+        value: float,
+        inner_coefficients: list[list[float]],
+        order: int
+    ) -> list[float]:
+        (inner,) = inner_coefficients
+        return ts.negation(inner)
 
     def _synthetic_partial_formula(
         self: Negation,
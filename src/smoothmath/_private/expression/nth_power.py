@@ -4,10 +4,13 @@ import math
 import smoothmath._private.base_expression as base
 import smoothmath._private.expression as ex
 import smoothmath._private.math_functions as mf
+import smoothmath._private.vectorized_math_functions as vmf
 import smoothmath._private.utilities as util
 import smoothmath._private.errors as er
+import smoothmath._private.taylor_series as ts
 if TYPE_CHECKING:
-    from smoothmath import Point, Expression
+    from smoothmath import Expression
+    from smoothmath._private.vectorized_math_functions import Array
 
 
 class NthPower(base.ParameterizedUnaryExpression):
@@ -23,6 +26,8 @@ class NthPower(base.ParameterizedUnaryExpression):
     :param n: the exponent, *which must be an integer greater or equal to 1*
     """
 
+    __slots__ = ()
+
     def __init__(
         self: NthPower,
         inner: Expression,
@@ -43,10 +48,10 @@ class NthPower(base.ParameterizedUnaryExpression):
     ) -> int:
         return self._parameter
 
-    def _to_string(
+    def _string_pieces(
         self: NthPower
-    ) -> str:
-        return f"NthPower({self._inner}, n={self.n})"
+    ) -> list[str]:
+        return ["NthPower(", f", n={self.n})"]
 
     ## Evaluation ##
 
@@ -62,23 +67,54 @@ class NthPower(base.ParameterizedUnaryExpression):
     ):
         return mf.nth_power(inner_value, self.n)
 
+    def _vectorized_domain_violations(
+        self: NthPower,
+        inner_values: Array
+    ) -> list[tuple[str, Array]]:
+        return []
+
+    def _vectorized_value_formula(
+        self: NthPower,
+        inner_values: Array
+    ) -> Array:
+        return vmf.nth_power(inner_values, self.n)
+
     ## Partials ##
 
-    def _numeric_partial_formula(
+    def _local_partial_formula(
         self: NthPower,
-        point: Point,
-        multiplier: float
+        inner_value: float,
+        value: float
     ) -> float:
         n = self.n
         if n == 1:
-            return multiplier
+            return 1.0
         else: # n >= 2
-            inner_value = self._inner._evaluate(point)
-            return mf.multiply(
-                n,
-                mf.nth_power(inner_value, n - 1),
-                multiplier
-            )
+            return mf.multiply(n, mf.nth_power(inner_value, n - 1))
+
+    def _local_second_partial_formula(
+        self: NthPower,
+        inner_value: float,
+        value: float
+    ) -> float:
+        n = self.n
+        if n == 1:
+            return 0.0
+        elif n == 2:
+            return 2.0
+        else: # n >= 3
+            return mf.multiply(n * (n - 1), mf.nth_power(inner_value, n - 2))
+
+    def _taylor_coefficients(
+        self: NthPower,
+        value: float,
+        inner_coefficients: list[list[float]],
+        order: int
+    ) -> list[float]:
+        (inner,) = inner_coefficients
+        coefficients = ts.integer_power(inner, self.n)
+        coefficients[0] = value
+        return coefficients
 
     def _synthetic_partial_formula(
         self: NthPower,
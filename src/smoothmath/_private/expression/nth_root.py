@@ -3,10 +3,13 @@ from typing import TYPE_CHECKING, Callable, Optional
 import smoothmath._private.base_expression as base
 import smoothmath._private.expression as ex
 import smoothmath._private.math_functions as mf
+import smoothmath._private.vectorized_math_functions as vmf
 import smoothmath._private.utilities as util
 import smoothmath._private.errors as er
+import smoothmath._private.taylor_series as ts
 if TYPE_CHECKING:
-    from smoothmath import Point, Expression
+    from smoothmath import Expression
+    from smoothmath._private.vectorized_math_functions import Array
 
 
 class NthRoot(base.ParameterizedUnaryExpression):
@@ -25,6 +28,8 @@ class NthRoot(base.ParameterizedUnaryExpression):
     :param n: *must be an integer greater or equal to 1*
     """
 
+    __slots__ = ()
+
     def __init__(
         self: NthRoot,
         inner: Expression,
@@ -45,10 +50,10 @@ class NthRoot(base.ParameterizedUnaryExpression):
     ) -> int:
         return self._parameter
 
-    def _to_string(
+    def _string_pieces(
         self: NthRoot
-    ) -> str:
-        return f"NthPower({self._inner}, n={self.n})"
+    ) -> list[str]:
+        return ["NthPower(", f", n={self.n})"]
 
     ## Evaluation ##
 
@@ -67,22 +72,59 @@ class NthRoot(base.ParameterizedUnaryExpression):
     ):
         return mf.nth_root(inner_value, self.n)
 
+    def _vectorized_domain_violations(
+        self: NthRoot,
+        inner_values: Array
+    ) -> list[tuple[str, Array]]:
+        violations: list[tuple[str, Array]]
+        violations = []
+        if self.n >= 2:
+            violations.append((f"NthRoot(x, n) is not defined at x = 0 when n = {self.n}", inner_values == 0))
+        if util.is_even(self.n):
+            violations.append((f"NthRoot(x, n) is not defined for negative x when n = {self.n}", inner_values < 0))
+        return violations
+
+    def _vectorized_value_formula(
+        self: NthRoot,
+        inner_values: Array
+    ) -> Array:
+        return vmf.nth_root(inner_values, self.n)
+
     ## Partials ##
 
-    def _numeric_partial_formula(
+    def _local_partial_formula(
         self: NthRoot,
-        point: Point,
-        multiplier: float
+        inner_value: float,
+        value: float
     ) -> float:
         n = self.n
         if n == 1:
-            return multiplier
-        else:
-            self_value = self._evaluate(point)
-            return mf.divide(
-                multiplier,
-                mf.multiply(n, mf.nth_power(self_value, n - 1))
-            )
+            return 1.0
+        else: # n >= 2
+            return mf.reciprocal(mf.multiply(n, mf.nth_power(value, n - 1)))
+
+    def _local_second_partial_formula(
+        self: NthRoot,
+        inner_value: float,
+        value: float
+    ) -> float:
+        n = self.n
+        if n == 1:
+            return 0.0
+        else: # n >= 2
+            return mf.divide(1 - n, mf.multiply(n * n, mf.nth_power(value, 2 * n - 1)))
+
+    def _taylor_coefficients(
+        self: NthRoot,
+        value: float,
+        inner_coefficients: list[list[float]],
+        order: int
+    ) -> list[float]:
+        (inner,) = inner_coefficients
+        if self.n == 1:
+            return list(inner)
+        else: # n >= 2, so the inner value is nonzero
+            return ts.real_power(inner, 1 / self.n, value)
 
     def _synthetic_partial_formula(
         self: NthRoot,
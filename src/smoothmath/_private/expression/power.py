@@ -5,12 +5,12 @@ import smoothmath._private.base_expression as base
 import smoothmath._private.expression as ex
 import smoothmath._private.utilities as util
 import smoothmath._private.math_functions as mf
+import smoothmath._private.vectorized_math_functions as vmf
 import smoothmath._private.errors as er
+import smoothmath._private.taylor_series as ts
 if TYPE_CHECKING:
-    from smoothmath import Point, Expression
-    from smoothmath._private.accumulators import (
-        NumericPartialsAccumulator, SyntheticPartialsAccumulator
-    )
+    from smoothmath import Expression
+    from smoothmath._private.vectorized_math_functions import Array
 
 
 class Power(base.BinaryExpression):
@@ -30,6 +30,8 @@ class Power(base.BinaryExpression):
     :param right: the exponent
     """
 
+    __slots__ = ()
+
     ## Evaluation ##
 
     def _verify_domain_constraints(
@@ -54,79 +56,91 @@ class Power(base.BinaryExpression):
     ) -> float:
         return mf.power(left_value, right_value)
 
-    ## Partials ##
+    def _vectorized_domain_violations(
+        self: Power,
+        left_values: Array,
+        right_values: Array
+    ) -> list[tuple[str, Array]]:
+        left_is_zero = (left_values == 0)
+        return [
+            ("Power(x, y) is not smooth around x = 0 for y > 0", left_is_zero & (right_values > 0)),
+            ("Power(x, y) is not smooth around (x = 0, y = 0)", left_is_zero & (right_values == 0)),
+            ("Power(x, y) blows up around x = 0 for y < 0", left_is_zero & ~(right_values >= 0)),
+            ("Power(x, y) is undefined for x < 0", left_values < 0)
+        ]
 
-    def _numeric_partial(
+    def _vectorized_value_formula(
         self: Power,
-        variable_name: str,
-        point: Point
-    ) -> float:
-        if (not self._left._variable_names) and self._left._evaluate(point) == 1:
-            # If we find something like `Constant(1) ** Whatever`, we can short-circuit.
-            return 0
-        else:
-            left_value = self._left._evaluate(point)
-            right_value = self._right._evaluate(point)
-            self._verify_domain_constraints(left_value, right_value)
-            left_partial = self._left._numeric_partial(variable_name, point)
-            right_partial = self._right._numeric_partial(variable_name, point)
-            return (
-                self._numeric_partial_formula_left(point, left_partial) +
-                self._numeric_partial_formula_right(point, right_partial)
-            )
+        left_values: Array,
+        right_values: Array
+    ) -> Array:
+        return vmf.power(left_values, right_values)
 
-    def _synthetic_partial(
+    ## Partials ##
+
+    def _synthetic_partial_from_inners(
         self: Power,
-        variable_name: str
+        variable_name: str,
+        inner_partials: list[Expression]
     ) -> Expression:
-        left_partial = self._left._synthetic_partial(variable_name)
-        right_partial = self._right._synthetic_partial(variable_name)
+        (left_partial, right_partial) = inner_partials
         return ex.Add(
             self._synthetic_partial_formula_left(left_partial),
             self._synthetic_partial_formula_right(right_partial)
         )
 
-    def _compute_numeric_partials(
+    def _local_partial_formula_left(
         self: Power,
-        accumulator: NumericPartialsAccumulator,
-        multiplier: float,
-        point: Point
-    ) -> None:
-        if (not self._left._variable_names) and self._left._evaluate(point) == 1:
-            # If we find something like `Constant(1) ** Whatever`, we can short-circuit.
-            pass
-        else:
-            left_value = self._left._evaluate(point)
-            right_value = self._right._evaluate(point)
-            self._verify_domain_constraints(left_value, right_value)
-            next_multiplier_left = self._numeric_partial_formula_left(point, multiplier)
-            next_multiplier_right = self._numeric_partial_formula_right(point, multiplier)
-            self._left._compute_numeric_partials(accumulator, next_multiplier_left, point)
-            self._right._compute_numeric_partials(accumulator, next_multiplier_right, point)
+        left_value: float,
+        right_value: float,
+        value: float
+    ) -> float:
+        return mf.multiply(
+            right_value,
+            mf.power(left_value, mf.minus(right_value, 1))
+        )
 
-    def _compute_synthetic_partials(
+    def _local_partial_formula_right(
         self: Power,
-        accumulator: SyntheticPartialsAccumulator,
-        multiplier: Expression
-    ) -> None:
-        next_multiplier_left = self._synthetic_partial_formula_left(multiplier)
-        next_multiplier_right = self._synthetic_partial_formula_right(multiplier)
-        self._left._compute_synthetic_partials(accumulator, next_multiplier_left)
-        self._right._compute_synthetic_partials(accumulator, next_multiplier_right)
+        left_value: float,
+        right_value: float,
+        value: float
+    ) -> float:
+        return mf.multiply(mf.logarithm(left_value, base = math.e), value)
 
-    def _numeric_partial_formula_left(
+    def _local_second_partial_formulas(
         self: Power,
-        point: Point,
-        multiplier: float
-    ) -> float:
-        left_value = self._left._evaluate(point)
-        right_value = self._right._evaluate(point)
-        return mf.multiply(
-            right_value,
-            mf.power(left_value, mf.minus(right_value, 1)),
-            multiplier
+        left_value: float,
+        right_value: float,
+        value: float
+    ) -> tuple[float, float, float]:
+        log_of_left = mf.logarithm(left_value, base = math.e)
+        left_power = mf.power(left_value, mf.minus(right_value, 1))
+        return (
+            mf.multiply(right_value, mf.minus(right_value, 1), mf.power(left_value, mf.minus(right_value, 2))),
+            mf.multiply(left_power, mf.add(1, mf.multiply(right_value, log_of_left))),
+            mf.multiply(mf.nth_power(log_of_left, n = 2), value)
         )
 
+    def _taylor_coefficients(
+        self: Power,
+        value: float,
+        inner_coefficients: list[list[float]],
+        order: int
+    ) -> list[float]:
+        (left, right) = inner_coefficients
+        logarithm_of_left = ts.natural_logarithm(left, mf.logarithm(left[0], base = math.e))
+        return ts.natural_exponential(ts.multiply(right, logarithm_of_left), value)
+
+    def _synthetic_multipliers(
+        self: Power,
+        multiplier: Expression
+    ) -> list[Expression]:
+        return [
+            self._synthetic_partial_formula_left(multiplier),
+            self._synthetic_partial_formula_right(multiplier)
+        ]
+
     def _synthetic_partial_formula_left(
         self: Power,
         multiplier: Expression
@@ -143,15 +157,6 @@ class Power(base.BinaryExpression):
     ) -> Expression:
         return ex.Multiply(ex.Logarithm(self._left, base = math.e), self, multiplier)
 
-    def _numeric_partial_formula_right(
-        self: Power,
-        point: Point,
-        multiplier: float
-    ) -> float:
-        left_value = self._left._evaluate(point)
-        self_value = self._evaluate(point)
-        return mf.multiply(mf.logarithm(left_value, base = math.e), self_value, multiplier)
-
     ## Normalization and Reduction ##
 
     @property
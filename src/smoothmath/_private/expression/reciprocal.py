@@ -3,9 +3,12 @@ from typing import TYPE_CHECKING, Callable, Optional
 import smoothmath._private.base_expression as base
 import smoothmath._private.expression as ex
 import smoothmath._private.math_functions as mf
+import smoothmath._private.vectorized_math_functions as vmf
 import smoothmath._private.errors as er
+import smoothmath._private.taylor_series as ts
 if TYPE_CHECKING:
-    from smoothmath import Point, Expression
+    from smoothmath import Expression
+    from smoothmath._private.vectorized_math_functions import Array
 
 
 class Reciprocal(base.UnaryExpression):
@@ -22,6 +25,8 @@ class Reciprocal(base.UnaryExpression):
     :param inner: the expression we are taking the reciprocal of
     """
 
+    __slots__ = ()
+
     ## Evaluation ##
 
     def _verify_domain_constraints(
@@ -37,15 +42,44 @@ class Reciprocal(base.UnaryExpression):
     ):
         return mf.reciprocal(inner_value)
 
+    def _vectorized_domain_violations(
+        self: Reciprocal,
+        inner_values: Array
+    ) -> list[tuple[str, Array]]:
+        return [
+            ("Reciprocal(x) blows up around x = 0", inner_values == 0)
+        ]
+
+    def _vectorized_value_formula(
+        self: Reciprocal,
+        inner_values: Array
+    ) -> Array:
+        return vmf.reciprocal(inner_values)
+
     ## Partials ##
 
-    def _numeric_partial_formula(
+    def _local_partial_formula(
+        self: Reciprocal,
+        inner_value: float,
+        value: float
+    ) -> float:
+        return mf.negation(mf.reciprocal(mf.nth_power(inner_value, n = 2)))
+
+    def _local_second_partial_formula(
         self: Reciprocal,
-        point: Point,
-        multiplier: float
+        inner_value: float,
+        value: float
     ) -> float:
-        inner_value = self._inner._evaluate(point)
-        return mf.negation(mf.divide(multiplier, mf.nth_power(inner_value, n = 2)))
+        return mf.multiply(2, mf.reciprocal(mf.nth_power(inner_value, n = 3)))
+
+    def _taylor_coefficients(
+        self: Reciprocal,
+        value: float,
+        inner_coefficients: list[list[float]],
+        order: int
+    ) -> list[float]:
+        (inner,) = inner_coefficients
+        return ts.reciprocal(inner, value)
 
     def _synthetic_partial_formula(
         self: Reciprocal,
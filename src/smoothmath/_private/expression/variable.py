@@ -1,13 +1,14 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence
 import re
 import smoothmath._private.base_expression as base
 import smoothmath._private.expression as ex
+import smoothmath._private.taylor_series as ts
 if TYPE_CHECKING:
     from smoothmath import Point, Expression
-    from smoothmath._private.accumulators import (
-        NumericPartialsAccumulator, SyntheticPartialsAccumulator
-    )
+    from smoothmath._private.compiled_expression import Step, IndexedStep, VectorizedStep
+    from smoothmath._private.columns import Columns
+    from smoothmath._private.vectorized_math_functions import Array
 
 
 ALPHANUMERIC_PATTERN = re.compile(r"\A\w*\Z")
@@ -24,11 +25,13 @@ class Variable(base.Expression):
     :param name: the variable's name
     """
 
+    __slots__ = ("name",)
+
     def __init__(
         self: Variable,
         name: str
     ) -> None:
-        super().__init__(variable_names = {name})
+        super().__init__(variable_names = frozenset((name,)))
         if (not name) or (ALPHANUMERIC_PATTERN.match(name) is None):
             raise Exception(f"Illegal variable name: {name}")
         self.name: str
@@ -39,90 +42,134 @@ class Variable(base.Expression):
     ) -> Expression:
         return Variable(self.name)
 
-    ## Evaluation ##
+    def _interning_key(
+        self: Variable
+    ) -> tuple[Any, ...]:
+        return (Variable, self.name)
 
-    def _reset_evaluation_cache(
+    def _subexpressions(
         self: Variable
-    ) -> None:
-        pass
+    ) -> list[Expression]:
+        return []
 
-    def _evaluate(
+    ## Evaluation ##
+
+    def _value_from_inners(
         self: Variable,
+        inner_values: list[float],
         point: Point
     ) -> float:
         return point.coordinate(self.name)
 
+    def _compile_step(
+        self: Variable,
+        inner_indices: tuple[int, ...]
+    ) -> Step:
+        name = self.name
+        def step(
+            values: list[float],
+            point: Point
+        ) -> float:
+            return point.coordinate(name)
+        return step
+
+    def _compile_indexed_step(
+        self: Variable,
+        slot: int
+    ) -> IndexedStep:
+        def step(
+            values: list[float],
+            coordinates: Sequence[float]
+        ) -> float:
+            return coordinates[slot]
+        return step
+
+    def _vectorized_step(
+        self: Variable,
+        inner_indices: tuple[int, ...]
+    ) -> VectorizedStep:
+        name = self.name
+        def step(
+            values: list[Array],
+            columns: Columns
+        ) -> Array:
+            return columns.column(name)
+        return step
+
     ## Partials ##
 
-    def _numeric_partial(
+    def _synthetic_partial_from_inners(
         self: Variable,
         variable_name: str,
-        point: Point
-    ) -> float:
-        if self.name == variable_name:
-            return 1
-        else:
-            return 0
-
-    def _synthetic_partial(
-        self: Variable,
-        variable_name: str
+        inner_partials: list[Expression]
     ) -> Expression:
         if self.name == variable_name:
             return ex.Constant(1)
         else:
             return ex.Constant(0)
 
-    def _compute_numeric_partials(
+    def _local_partials(
         self: Variable,
-        accumulator: NumericPartialsAccumulator,
-        multiplier: float,
-        point: Point
-    ) -> None:
-        accumulator.add_to(self, multiplier)
+        value: float,
+        inner_values: list[float]
+    ) -> list[float]:
+        return []
+
+    def _local_partial_tangents(
+        self: Variable,
+        value: float,
+        inner_values: list[float],
+        inner_tangents: list[float]
+    ) -> list[float]:
+        return []
 
-    def _compute_synthetic_partials(
+    def _taylor_coefficients(
+        self: Variable,
+        value: float,
+        inner_coefficients: list[list[float]],
+        order: int
+    ) -> list[float]:
+        # The tape seeds the variable we differentiate with respect to; any other
+        # variable is constant.
+        return ts.constant(value, order)
+
+    def _synthetic_multipliers(
         self: Variable,
-        accumulator: SyntheticPartialsAccumulator,
         multiplier: Expression
-    ) -> None:
-        accumulator.add_to(self, multiplier)
+    ) -> list[Expression]:
+        return []
 
     ## Normalization and Reduction ##
 
-    def _take_reduction_step(
+    @property
+    def _reducers(
         self: Variable
-    ) -> Variable:
-        self._is_fully_reduced = True
-        return self
+    ) -> list[Callable[[], Optional[Expression]]]:
+        return []
 
     def _normalize_fully_reduced(
-        self: Variable
+        self: Variable,
+        normalized_inners: list[Expression]
     ) -> Expression:
         return self._rebuild()
 
     ## Operations ##
 
-    def __eq__(
+    def _same_parameters(
         self: Variable,
-        other: Any
+        other: Variable
     ) -> bool:
-        return (other.__class__ == self.__class__) and (other.name == self.name)
+        return other.name == self.name
 
-    def __hash__(
+    def _structural_hash(
         self: Variable
     ) -> int:
         return hash(("Variable", self.name))
 
-    def __str__(
-        self: Variable
-    ) -> str:
-        return f"Variable(\"{self.name}\")"
-
-    def __repr__(
+    def _string_pieces(
         self: Variable
-    ) -> str:
-        return f"Variable(\"{self.name}\")"
+    ) -> list[str]:
+        return [f"Variable(\"{self.name}\")"]
 
 
 def get_variable_name(
@@ -0,0 +1,117 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any
+import smoothmath._private.point as pt
+if TYPE_CHECKING:
+    from smoothmath import Point, Expression
+
+
+class Hessian:
+    """
+    The Hessian of an expression: its second partials. Rows and columns correspond
+    to the variables of the expression.
+
+    >>> from smoothmath import Point, Hessian
+    >>> from smoothmath.expression import Variable
+    >>> x = Variable("x")
+    >>> y = Variable("y")
+    >>> hessian = Hessian(x * x * y)
+    >>> hessian.variable_names()
+    ['x', 'y']
+    >>> hessian.at(Point(x=3, y=2))
+    [[4.0, 6.0], [6.0, 0.0]]
+    >>> hessian.hvp(Point(x=3, y=2), Point(x=1, y=0))
+    {'x': 4.0, 'y': 6.0}
+
+    Second partials are computed numerically by differentiating forward-over-reverse,
+    so no expressions for the second partials are built.
+
+    :param expression: an expression
+    """
+
+    def __init__(
+        self: Hessian,
+        expression: Expression
+    ) -> None:
+        self._original_expression: Expression
+        self._original_expression = expression
+        self._variable_names: list[str]
+        self._variable_names = sorted(expression._variable_names)
+
+    def variable_names(
+        self: Hessian
+    ) -> list[str]:
+        """
+        The variable names, in the order of the rows and columns.
+        """
+        return list(self._variable_names)
+
+    def at(
+        self: Hessian,
+        point: Point
+    ) -> list[list[float]]:
+        """
+        Evaluates the Hessian at a point, giving a list of rows.
+
+        :param point: where to evaluate
+        """
+        unit_vectors = [
+            pt.Point(**{
+                other_name: (1 if other_name == variable_name else 0)
+                for other_name in self._variable_names
+            })
+            for variable_name in self._variable_names
+        ]
+        products = self._original_expression._partials_tape().hessian_vector_products(point, unit_vectors)
+        return [
+            [float(product[variable_name]) for variable_name in self._variable_names]
+            for product in products
+        ]
+
+    def hvp(
+        self: Hessian,
+        point: Point,
+        vector: Point
+    ) -> dict[str, float]:
+        """
+        Evaluates the Hessian at a point and multiplies it by a vector, keyed by variable name.
+
+        This costs about as much as evaluating the differential, however many variables
+        the expression has. The vector needs a coordinate for each variable of the expression.
+
+        :param point: where to evaluate
+        :param vector: the vector, given as a point
+        """
+        (product,) = self._original_expression._partials_tape().hessian_vector_products(point, [vector])
+        return {
+            variable_name: float(product[variable_name])
+            for variable_name in self._variable_names
+        }
+
+    def __eq__(
+        self: Hessian,
+        other: Any
+    ) -> bool:
+        return (
+            (other.__class__ == self.__class__) and
+            (self._original_expression == other._original_expression)
+        )
+
+    def __hash__(
+        self: Hessian
+    ) -> int:
+        return hash(("Hessian", self._original_expression))
+
+    def __str__(
+        self: Hessian
+    ) -> str:
+        return self._to_string()
+
+    def __repr__(
+        self: Hessian
+    ) -> str:
+        return self._to_string()
+
+    def _to_string(
+        self: Hessian
+    ) -> str:
+        return f"Hessian({self._original_expression})"
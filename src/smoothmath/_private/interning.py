@@ -0,0 +1,122 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Iterator
+from contextlib import contextmanager
+import threading
+import weakref
+if TYPE_CHECKING:
+    from smoothmath import Expression
+
+
+# While interning is on, constructing an expression returns the one canonical instance
+# for its structure. Canonical instances are kept in a table keyed by their class, their
+# parameters and the identities of their (also canonical) inner expressions. Because the
+# table holds its values weakly, an entry disappears once nothing else refers to it.
+# Interned expressions stay canonical after interning is turned off, so at any time there
+# is at most one living interned expression per structure.
+
+_lock = threading.RLock()
+_canonical_expressions: weakref.WeakValueDictionary[tuple[Any, ...], Expression]
+_canonical_expressions = weakref.WeakValueDictionary()
+_interning_depth = 0
+
+# Rebuilding an expression from canonical inner expressions turns interning on for the
+# rebuilding thread only, so other threads don't start interning as a side effect.
+_rebuilding = threading.local()
+
+
+@contextmanager
+def interning() -> Iterator[None]:
+    """
+    Turns on interning of expressions within a ``with`` block.
+
+    While interning is on, structurally equal expressions are the same object.
+    Comparing an interned expression with itself is an identity check, and expressions built while
+    interning (including partials computed with ``compute_early=True``) share their
+    common subexpressions rather than duplicating them.
+
+    >>> from smoothmath import interning
+    >>> from smoothmath.expression import Variable
+    >>> with interning():
+    ...     Variable("x") * Variable("y") is Variable("x") * Variable("y")
+    True
+
+    Interning is process-wide: it applies to expressions built on any thread while
+    the ``with`` block is active.
+    """
+    global _interning_depth
+    with _lock:
+        _interning_depth += 1
+    try:
+        yield
+    finally:
+        with _lock:
+            _interning_depth -= 1
+
+
+def is_interning() -> bool:
+    return _interning_depth > 0 or getattr(_rebuilding, "depth", 0) > 0
+
+
+def interned_count() -> int:
+    return len(_canonical_expressions)
+
+
+def intern(
+    expression: Expression
+) -> Expression:
+    if expression._is_interned:
+        return expression
+    with _lock:
+        # We canonicalize inner expressions before the expressions that contain them,
+        # using an explicit stack so deep expressions don't exhaust the Python call stack.
+        canonical_by_id: dict[int, Expression]
+        canonical_by_id = {}
+        stack = [(expression, False)]
+        while stack:
+            node, inners_visited = stack.pop()
+            if node._is_interned or id(node) in canonical_by_id:
+                continue
+            inners = node._subexpressions()
+            if not inners_visited:
+                stack.append((node, True))
+                stack.extend((inner, False) for inner in inners)
+                continue
+            canonical_inners = [_canonical_from(inner, canonical_by_id) for inner in inners]
+            if any(a is not b for (a, b) in zip(canonical_inners, inners)):
+                # Rebuilding while interning is on makes the result canonical.
+                canonical_by_id[id(node)] = _interning_rebuild(node, canonical_inners)
+            else:
+                canonical_by_id[id(node)] = _register(node)
+        return canonical_by_id[id(expression)]
+
+
+def _canonical_from(
+    expression: Expression,
+    canonical_by_id: dict[int, Expression]
+) -> Expression:
+    if expression._is_interned:
+        return expression
+    return canonical_by_id[id(expression)]
+
+
+def _interning_rebuild(
+    expression: Expression,
+    canonical_inners: list[Expression]
+) -> Expression:
+    _rebuilding.depth = getattr(_rebuilding, "depth", 0) + 1
+    try:
+        return expression._rebuild(*canonical_inners)
+    finally:
+        _rebuilding.depth -= 1
+
+
+def _register(
+    expression: Expression
+) -> Expression:
+    key = expression._interning_key()
+    canonical = _canonical_expressions.get(key, None)
+    if canonical is not None:
+        return canonical
+    expression._is_interned = True
+    _canonical_expressions[key] = expression
+    return expression
@@ -0,0 +1,263 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Iterable, NamedTuple, Optional
+from array import array
+import smoothmath._private.tape as tp
+import smoothmath._private.parallel as pl
+import smoothmath._private.coloring as cl
+if TYPE_CHECKING:
+    from smoothmath import Point, Expression
+    from smoothmath._private.tape import Tape
+
+
+DenseJacobian = list[list[float]]
+SparseJacobian = dict[tuple[int, str], float]
+
+
+class COOMatrix(NamedTuple):
+    """
+    A sparse matrix in coordinate format: entry k is at (rows[k], columns[k]).
+    """
+
+    rows: array[int]
+    columns: array[int]
+    values: array[float]
+    shape: tuple[int, int]
+
+
+class CSRMatrix(NamedTuple):
+    """
+    A sparse matrix in compressed sparse row format: the entries of row r are at
+    positions indptr[r] up to indptr[r + 1] of columns and values.
+    """
+
+    indptr: array[int]
+    columns: array[int]
+    values: array[float]
+    shape: tuple[int, int]
+
+
+class Jacobian:
+    """
+    The Jacobian of several expressions. Each row holds the partials of one expression,
+    and each column corresponds to a variable.
+
+    >>> from smoothmath import Point, Jacobian
+    >>> from smoothmath.expression import Variable, Sine
+    >>> x = Variable("x")
+    >>> y = Variable("y")
+    >>> jacobian = Jacobian([x * y, Sine(x)])
+    >>> jacobian.variable_names()
+    ['x', 'y']
+    >>> jacobian.at(Point(x=0, y=2))
+    [[2.0, 0.0], [1.0, 0.0]]
+    >>> jacobian.at(Point(x=0, y=2), sparse=True)
+    {(0, 'x'): 2.0, (0, 'y'): 0.0, (1, 'x'): 1.0}
+
+    Subexpressions shared between the expressions are evaluated once per point.
+
+    :param expressions: the expressions, one for each row
+    """
+
+    def __init__(
+        self: Jacobian,
+        expressions: Iterable[Expression]
+    ) -> None:
+        self._original_expressions: tuple[Expression, ...]
+        self._original_expressions = tuple(expressions)
+        self._variable_names: list[str]
+        self._variable_names = sorted(set().union(
+            *(expression._variable_names for expression in self._original_expressions)
+        ))
+        self._tape: Optional[Tape]
+        self._tape = None
+        # For each row, the columns of the variables appearing in the row's expression.
+        column_by_variable_name = { name: i for i, name in enumerate(self._variable_names) }
+        self._sparsity_pattern: list[list[int]]
+        self._sparsity_pattern = [
+            sorted(column_by_variable_name[name] for name in expression._variable_names)
+            for expression in self._original_expressions
+        ]
+        self._column_colors: Optional[list[int]]
+        self._column_colors = None
+
+    def variable_names(
+        self: Jacobian
+    ) -> list[str]:
+        """
+        The variable names, in the order of the columns.
+        """
+        return list(self._variable_names)
+
+    def at(
+        self: Jacobian,
+        point: Point,
+        sparse: bool = False
+    ) -> DenseJacobian | SparseJacobian:
+        """
+        Evaluates the Jacobian at a point.
+
+        By default, the result is a list of rows. With ``sparse=True``, the result is a
+        dictionary keyed by (row, variable name) holding only the partials with respect
+        to variables appearing in the row's expression. For large sparse Jacobians,
+        see :meth:`sparse_at`.
+
+        :param point: where to evaluate
+        :param sparse: whether to return a dictionary rather than a list of rows
+        """
+        return self._sparse_at(point) if sparse else self._dense_at(point)
+
+    def sparse_at(
+        self: Jacobian,
+        point: Point,
+        format: str = "csr"
+    ) -> CSRMatrix | COOMatrix:
+        """
+        Evaluates the Jacobian at a point, giving a sparse matrix.
+
+        >>> from smoothmath import Point, Jacobian
+        >>> from smoothmath.expression import Variable
+        >>> x = Variable("x")
+        >>> y = Variable("y")
+        >>> z = Variable("z")
+        >>> jacobian = Jacobian([x * y, z + z, x])
+        >>> csr = jacobian.sparse_at(Point(x=2, y=3, z=4))
+        >>> list(csr.indptr), list(csr.columns), list(csr.values)
+        ([0, 2, 3, 4], [0, 1, 2, 0], [3.0, 2.0, 2.0, 1.0])
+
+        Entries are stored for each variable appearing in each row's expression. Columns
+        which never appear in the same row are grouped together, and each group takes a
+        single tangent sweep through the expressions. So the cost depends on how many
+        variables a row can have rather than on the total number of variables.
+
+        The result's fields can be passed to the constructors of ``scipy.sparse.csr_matrix``
+        or ``scipy.sparse.coo_matrix``.
+
+        :param point: where to evaluate
+        :param format: either "csr" or "coo"
+        """
+        if format not in ("csr", "coo"):
+            raise Exception(f"Sparse format must be \"csr\" or \"coo\", found: {format}")
+        colors = self._colors()
+        color_count = max(colors, default = -1) + 1
+        all_seeds = [
+            array("d", [1.0 if column_color == color else 0.0 for column_color in colors])
+            for color in range(color_count)
+        ]
+        compressed = self._shared_tape().compressed_jacobian(point, all_seeds)
+        rows = array("q")
+        columns = array("q")
+        values = array("d")
+        indptr = array("q", [0])
+        for row, pattern in enumerate(self._sparsity_pattern):
+            for column in pattern:
+                rows.append(row)
+                columns.append(column)
+                values.append(float(compressed[colors[column]][row]))
+            indptr.append(len(values))
+        shape = (len(self._original_expressions), len(self._variable_names))
+        if format == "coo":
+            return COOMatrix(rows, columns, values, shape)
+        return CSRMatrix(indptr, columns, values, shape)
+
+    def at_many(
+        self: Jacobian,
+        points: Iterable[Point],
+        workers: Optional[int] = None,
+        sparse: bool = False
+    ) -> list[DenseJacobian] | list[SparseJacobian]:
+        """
+        Evaluates the Jacobian at many points, spreading the work over a pool of processes.
+
+        Each worker process receives the Jacobian once. The results come back in the same
+        order as the points.
+
+        :param points: where to evaluate
+        :param workers: how many processes to use; defaults to the number of CPUs, and 1 evaluates in this process
+        :param sparse: whether to return dictionaries rather than lists of rows
+        """
+        evaluate = self._sparse_at if sparse else self._dense_at
+        return pl.evaluate_many(evaluate, points, workers)
+
+    def _dense_at(
+        self: Jacobian,
+        point: Point
+    ) -> DenseJacobian:
+        return [
+            [float(numeric_partials.get(variable_name, 0)) for variable_name in self._variable_names]
+            for numeric_partials in self._all_numeric_partials_at(point)
+        ]
+
+    def _sparse_at(
+        self: Jacobian,
+        point: Point
+    ) -> SparseJacobian:
+        results: SparseJacobian
+        results = {}
+        for row, numeric_partials in enumerate(self._all_numeric_partials_at(point)):
+            for variable_name in sorted(numeric_partials):
+                results[(row, variable_name)] = float(numeric_partials[variable_name])
+        return results
+
+    def _all_numeric_partials_at(
+        self: Jacobian,
+        point: Point
+    ) -> list[dict[str, float]]:
+        _, all_numeric_partials = self._shared_tape().values_and_numeric_partials(point)
+        return all_numeric_partials
+
+    def _colors(
+        self: Jacobian
+    ) -> list[int]:
+        colors = self._column_colors
+        if colors is None:
+            colors = cl.color_columns(self._sparsity_pattern, len(self._variable_names))
+            self._column_colors = colors
+        return colors
+
+    def _shared_tape(
+        self: Jacobian
+    ) -> Tape:
+        # If two threads race here, each builds an equivalent tape.
+        tape = self._tape
+        if tape is None:
+            tape = tp.Tape(*self._original_expressions)
+            self._tape = tape
+        return tape
+
+    def __getstate__(
+        self: Jacobian
+    ) -> dict[str, Any]:
+        # The tape is rebuilt on demand after unpickling.
+        state = self.__dict__.copy()
+        state["_tape"] = None
+        return state
+
+    def __eq__(
+        self: Jacobian,
+        other: Any
+    ) -> bool:
+        return (
+            (other.__class__ == self.__class__) and
+            (self._original_expressions == other._original_expressions)
+        )
+
+    def __hash__(
+        self: Jacobian
+    ) -> int:
+        return hash(("Jacobian", self._original_expressions))
+
+    def __str__(
+        self: Jacobian
+    ) -> str:
+        return self._to_string()
+
+    def __repr__(
+        self: Jacobian
+    ) -> str:
+        return self._to_string()
+
+    def _to_string(
+        self: Jacobian
+    ) -> str:
+        expressions_string = ", ".join(str(expression) for expression in self._original_expressions)
+        return f"Jacobian([{expressions_string}])"
@@ -0,0 +1,64 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from smoothmath import Expression
+
+
+class Linearization:
+    """
+    The nodes of one or more expressions laid out in a flat list.
+
+    Each node appears after all of its inner expressions, and structurally equal
+    subexpressions share a single entry.
+    """
+
+    def __init__(
+        self: Linearization,
+        nodes: list[Expression],
+        inner_indices: list[tuple[int, ...]],
+        output_indices: list[int]
+    ) -> None:
+        self.nodes: list[Expression]
+        self.nodes = nodes
+        self.inner_indices: list[tuple[int, ...]]
+        self.inner_indices = inner_indices
+        self.output_indices: list[int]
+        self.output_indices = output_indices
+
+    def __len__(
+        self: Linearization
+    ) -> int:
+        return len(self.nodes)
+
+
+def linearize(
+    *expressions: Expression
+) -> Linearization:
+    nodes: list[Expression]
+    nodes = []
+    inner_indices: list[tuple[int, ...]]
+    inner_indices = []
+    index_by_node: dict[Expression, int]
+    index_by_node = {}
+    output_indices: list[int]
+    output_indices = []
+    for expression in expressions:
+        # We walk the tree with an explicit stack so that deep expressions don't
+        # exhaust the Python call stack.
+        stack = [(expression, False)]
+        while stack:
+            node, inners_visited = stack.pop()
+            if node in index_by_node:
+                continue
+            subexpressions = node._subexpressions()
+            if inners_visited:
+                index_by_node[node] = len(nodes)
+                nodes.append(node)
+                inner_indices.append(tuple(index_by_node[inner] for inner in subexpressions))
+            else:
+                stack.append((node, True))
+                for inner in reversed(subexpressions):
+                    if inner not in index_by_node:
+                        stack.append((inner, False))
+        output_indices.append(index_by_node[expression])
+    return Linearization(nodes, inner_indices, output_indices)
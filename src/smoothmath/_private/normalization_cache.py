@@ -0,0 +1,172 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Hashable, NamedTuple, Optional
+from collections import OrderedDict
+import threading
+if TYPE_CHECKING:
+    from smoothmath import Expression
+
+
+DEFAULT_MAXSIZE = 4096
+
+# Entries are tagged with which form they hold.
+REDUCED = "reduced"
+NORMALIZED = "normalized"
+
+
+class CacheInfo(NamedTuple):
+    """
+    Statistics about the normalization cache, in the style of ``functools.lru_cache``.
+    """
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+class LRUCache:
+    """
+    A thread-safe mapping which keeps at most maxsize entries, dropping the least
+    recently used entry first.
+    """
+
+    def __init__(
+        self: LRUCache,
+        maxsize: int
+    ) -> None:
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, Any]
+        self._entries = OrderedDict()
+        self._maxsize: int
+        self._maxsize = maxsize
+        self._hits: int
+        self._hits = 0
+        self._misses: int
+        self._misses = 0
+
+    def get(
+        self: LRUCache,
+        key: Hashable
+    ) -> Optional[Any]:
+        with self._lock:
+            value = self._entries.get(key, None)
+            if value is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(
+        self: LRUCache,
+        key: Hashable,
+        value: Any
+    ) -> None:
+        with self._lock:
+            if self._maxsize <= 0:
+                return
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last = False)
+
+    def resize(
+        self: LRUCache,
+        maxsize: int
+    ) -> None:
+        with self._lock:
+            self._maxsize = maxsize
+            while len(self._entries) > max(maxsize, 0):
+                self._entries.popitem(last = False)
+
+    def clear(
+        self: LRUCache
+    ) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def info(
+        self: LRUCache
+    ) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize, len(self._entries))
+
+
+# Maps (REDUCED, expression) to the fully reduced form of the expression, and
+# (NORMALIZED, expression) to the normalized form of a fully reduced expression.
+# Expressions hash by structure, so structurally equal expressions share entries.
+#
+# The limit counts entries, not nodes. Each entry holds its key and result expressions
+# (and so their whole trees) alive, so the cache can pin up to maxsize entries times the
+# size of the largest expressions normalized. Entries for the subexpressions of a tree
+# mostly share that tree's nodes, so the typical cost is far smaller. Expressions no longer
+# hold compiled forms or tapes (see evaluation_cache), so only the trees themselves are kept.
+_cache = LRUCache(DEFAULT_MAXSIZE)
+
+
+def is_cacheable(
+    expression: Expression
+) -> bool:
+    # Variables and Constants are their own reduced and normalized forms.
+    return bool(expression._subexpressions())
+
+
+def lookup(
+    form: str,
+    expression: Expression
+) -> Optional[Expression]:
+    if not is_cacheable(expression):
+        return None
+    return _cache.get((form, expression))
+
+
+def remember(
+    form: str,
+    expression: Expression,
+    result: Expression
+) -> None:
+    if is_cacheable(expression):
+        _cache.put((form, expression), result)
+
+
+def normalization_cache_info() -> CacheInfo:
+    """
+    Reports hits, misses, maximum size and current size of the normalization cache.
+
+    Computing partials early (with ``compute_early=True``) reduces and normalizes
+    expressions. Results are cached by the structure of the expression, so work done
+    for one partial is reused for others.
+
+    NOTE: The cache holds its expressions alive. Its size counts entries rather than
+    nodes, so caching the normalization of very large expressions can hold a lot of
+    memory. Use :func:`set_normalization_cache_size` to limit it, or
+    :func:`clear_normalization_cache` to release it.
+
+    >>> from smoothmath import normalization_cache_info
+    >>> normalization_cache_info().maxsize
+    4096
+    """
+    return _cache.info()
+
+
+def set_normalization_cache_size(
+    maxsize: int
+) -> None:
+    """
+    Sets the maximum number of entries in the normalization cache.
+
+    A maxsize of 0 turns off caching. Each entry holds an expression and its reduced or
+    normalized form alive, so lowering the size also bounds the memory the cache holds.
+
+    :param maxsize: the maximum number of entries
+    """
+    _cache.resize(maxsize)
+
+
+def clear_normalization_cache() -> None:
+    """
+    Empties the normalization cache and resets its hit and miss counts.
+    """
+    _cache.clear()
@@ -0,0 +1,291 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Sequence
+from array import array
+import smoothmath._private.point as pt
+import smoothmath._private.expression.variable as va
+import smoothmath._private.errors as er
+if TYPE_CHECKING:
+    from smoothmath import Point
+    from smoothmath.expression import Variable
+
+
+class VariableLayout:
+    """
+    A fixed order for variable names, giving each name a slot index.
+
+    >>> from smoothmath import Point, VariableLayout
+    >>> layout = VariableLayout(["x", "y"])
+    >>> layout.index_of("y")
+    1
+    >>> layout.pack(Point(x=3, y=4.5))
+    PackedPoint(x=3.0, y=4.5)
+
+    :param variable_names: the variable names, in slot order
+    """
+
+    def __init__(
+        self: VariableLayout,
+        variable_names: Iterable[str]
+    ) -> None:
+        self.names: tuple[str, ...]
+        self.names = tuple(variable_names)
+        self._index_by_name: dict[str, int]
+        self._index_by_name = { name: i for i, name in enumerate(self.names) }
+        if len(self._index_by_name) != len(self.names):
+            raise Exception(f"Variable layout has repeated names: {list(self.names)}")
+
+    def index_of(
+        self: VariableLayout,
+        variable: Variable | str
+    ) -> int:
+        """
+        Retrieves the slot index of a variable.
+
+        Raises :exc:`~smoothmath.CoordinateMissing` if the layout has no slot for the variable.
+
+        :param variable: the variable or its name
+        """
+        variable_name = va.get_variable_name(variable)
+        index = self._index_by_name.get(variable_name, None)
+        if index is None:
+            raise er.CoordinateMissing(f"Variable layout has no slot for variable: {variable_name}")
+        return index
+
+    def pack(
+        self: VariableLayout,
+        point: Point
+    ) -> PackedPoint:
+        """
+        Copies a point's coordinates into a packed point with this layout.
+
+        :param point: a point with a coordinate for each name of the layout
+        """
+        return PackedPoint(self, array("d", (point.coordinate(name) for name in self.names)))
+
+    def pack_many(
+        self: VariableLayout,
+        points: Iterable[Point]
+    ) -> PackedPoints:
+        """
+        Copies the coordinates of many points into one contiguous buffer.
+
+        :param points: points with a coordinate for each name of the layout
+        """
+        buffer = array("d")
+        for point in points:
+            buffer.extend(point.coordinate(name) for name in self.names)
+        return PackedPoints(self, buffer)
+
+    def __len__(
+        self: VariableLayout
+    ) -> int:
+        return len(self.names)
+
+    def __eq__(
+        self: VariableLayout,
+        other: Any
+    ) -> bool:
+        return (
+            (other.__class__ == self.__class__) and
+            (other.names == self.names)
+        )
+
+    def __hash__(
+        self: VariableLayout
+    ) -> int:
+        return hash(("VariableLayout", self.names))
+
+    def __str__(
+        self: VariableLayout
+    ) -> str:
+        return self._to_string()
+
+    def __repr__(
+        self: VariableLayout
+    ) -> str:
+        return self._to_string()
+
+    def _to_string(
+        self: VariableLayout
+    ) -> str:
+        return f"VariableLayout({list(self.names)})"
+
+
+class PackedPoint(pt.Point):
+    """
+    A point whose coordinates are stored by slot index, following a variable layout.
+    A packed point can be used wherever a point can. Compiled expressions read its
+    coordinates by index rather than by name.
+
+    >>> from array import array
+    >>> from smoothmath import PackedPoint, VariableLayout
+    >>> point = PackedPoint(VariableLayout(["x", "y"]), array("d", [3, 4.5]))
+    >>> point.coordinate("y")
+    4.5
+    >>> point.to_point()
+    Point(x=3.0, y=4.5)
+
+    The coordinates are not copied, so a packed point can be a view into a larger buffer.
+    Rather than holding a mapping like a :class:`Point`, a packed point supplies its
+    coordinates through :meth:`coordinate` and :meth:`coordinate_names`.
+
+    :param layout: the variable layout
+    :param coordinates: a coordinate for each slot of the layout, e.g. an ``array("d")``
+    """
+
+    def __init__(
+        self: PackedPoint,
+        layout: VariableLayout,
+        coordinates: Sequence[float]
+    ) -> None:
+        if len(coordinates) != len(layout):
+            raise Exception(f"Expected {len(layout)} coordinates for the layout, found: {len(coordinates)}")
+        self.layout: VariableLayout
+        self.layout = layout
+        self._values: Sequence[float]
+        self._values = coordinates
+
+    def coordinate(
+        self: PackedPoint,
+        variable: Variable | str
+    ) -> float:
+        return self._values[self.layout.index_of(variable)]
+
+    def coordinate_names(
+        self: PackedPoint
+    ) -> list[str]:
+        return list(self.layout.names)
+
+    def to_point(
+        self: PackedPoint
+    ) -> Point:
+        """
+        Copies the coordinates into a :class:`Point`.
+        """
+        return pt.Point(**dict(zip(self.layout.names, self._values)))
+
+    def __getstate__(
+        self: PackedPoint
+    ) -> dict[str, Any]:
+        # The coordinates may be a view into a larger buffer, which can't be pickled.
+        state = self.__dict__.copy()
+        state["_values"] = array("d", self._values)
+        return state
+
+    def __eq__(
+        self: PackedPoint,
+        other: Any
+    ) -> bool:
+        return (
+            (other.__class__ == self.__class__) and
+            (other.layout == self.layout) and
+            (list(other._values) == list(self._values))
+        )
+
+    def __hash__(
+        self: PackedPoint
+    ) -> int:
+        return hash(("PackedPoint", self.layout, tuple(self._values)))
+
+    def _to_string(
+        self: PackedPoint
+    ) -> str:
+        equations_string = ", ".join(
+            f'{variable_name}={value}'
+            for variable_name, value in zip(self.layout.names, self._values)
+        )
+        return f"PackedPoint({equations_string})"
+
+
+class PackedPoints:
+    """
+    Many points stored in one contiguous buffer of doubles, one point after another,
+    each following a variable layout.
+
+    >>> from array import array
+    >>> from smoothmath import PackedPoints, VariableLayout
+    >>> points = PackedPoints(VariableLayout(["x", "y"]), array("d", [1, 2, 3, 4]))
+    >>> len(points)
+    2
+    >>> points[1]
+    PackedPoint(x=3.0, y=4.0)
+
+    Any C-contiguous buffer of doubles, such as an ``array("d")`` or a numpy array of
+    float64 with one row per point, is used without copying. Other sequences of numbers
+    are copied into an ``array("d")``.
+
+    :param layout: the variable layout
+    :param buffer: the coordinates of all the points, point by point
+    """
+
+    def __init__(
+        self: PackedPoints,
+        layout: VariableLayout,
+        buffer: Any
+    ) -> None:
+        self.layout: VariableLayout
+        self.layout = layout
+        self._buffer: memoryview
+        self._buffer = _flat_view_of_doubles(buffer)
+        slot_count = len(layout)
+        if slot_count == 0:
+            raise Exception("Packed points require a layout with at least one variable")
+        if len(self._buffer) % slot_count != 0:
+            raise Exception(f"Expected the buffer length to be a multiple of {slot_count}, found: {len(self._buffer)}")
+
+    def __len__(
+        self: PackedPoints
+    ) -> int:
+        return len(self._buffer) // len(self.layout)
+
+    def __getitem__(
+        self: PackedPoints,
+        i: int
+    ) -> PackedPoint:
+        count = len(self)
+        if i < 0:
+            i += count
+        if not 0 <= i < count:
+            raise IndexError(f"Packed point index out of range: {i}")
+        slot_count = len(self.layout)
+        start = i * slot_count
+        return PackedPoint(self.layout, self._buffer[start:start + slot_count])
+
+    def __iter__(
+        self: PackedPoints
+    ) -> Iterator[PackedPoint]:
+        slot_count = len(self.layout)
+        for start in range(0, len(self._buffer), slot_count):
+            yield PackedPoint(self.layout, self._buffer[start:start + slot_count])
+
+    def __getstate__(
+        self: PackedPoints
+    ) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_buffer"] = array("d", self._buffer)
+        return state
+
+    def __setstate__(
+        self: PackedPoints,
+        state: dict[str, Any]
+    ) -> None:
+        self.__dict__.update(state)
+        self._buffer = memoryview(self._buffer)
+
+
+def _flat_view_of_doubles(
+    buffer: Any
+) -> memoryview:
+    try:
+        view = memoryview(buffer)
+    except TypeError:
+        view = memoryview(array("d", buffer))
+    if view.format != "d":
+        if view.ndim != 1:
+            raise Exception(f"Packed points require a buffer of doubles, found format: {view.format}")
+        view = memoryview(array("d", view.tolist()))
+    if view.ndim != 1:
+        if not view.c_contiguous:
+            raise Exception("Packed points require a C-contiguous buffer")
+        view = view.cast("B").cast("d")
+    return view
@@ -0,0 +1,68 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional, TypeVar
+from concurrent.futures import ProcessPoolExecutor
+import math
+import os
+if TYPE_CHECKING:
+    from smoothmath import Point
+
+
+T = TypeVar("T")
+
+# How many chunks each worker receives, on average. Several chunks per worker keep the
+# workers busy when some points take longer than others.
+CHUNKS_PER_WORKER = 4
+
+# The evaluation function installed in a worker process.
+_installed_evaluate: Optional[Callable[[Point], Any]]
+_installed_evaluate = None
+
+
+def evaluate_many(
+    evaluate: Callable[[Point], T],
+    points: Iterable[Point],
+    workers: Optional[int]
+) -> list[T]:
+    # evaluate should be a bound method, such as expression.at. Each worker receives
+    # (and unpickles) the object it is bound to once, rather than once per chunk.
+    points = list(points)
+    worker_count = workers if workers is not None else (os.cpu_count() or 1)
+    if worker_count < 1:
+        raise Exception(f"Expected a positive number of workers, found: {workers}")
+    if worker_count == 1 or len(points) <= 1:
+        return [evaluate(point) for point in points]
+    chunks = _split(points, worker_count * CHUNKS_PER_WORKER)
+    with ProcessPoolExecutor(
+        max_workers = min(worker_count, len(chunks)),
+        initializer = _install,
+        initargs = (evaluate,)
+    ) as executor:
+        results: list[T]
+        results = []
+        for chunk_results in executor.map(_evaluate_chunk, chunks):
+            results.extend(chunk_results)
+        return results
+
+
+def _split(
+    points: list[Point],
+    chunk_count: int
+) -> list[list[Point]]:
+    chunk_size = math.ceil(len(points) / chunk_count)
+    return [points[i : i + chunk_size] for i in range(0, len(points), chunk_size)]
+
+
+def _install(
+    evaluate: Callable[[Point], Any]
+) -> None:
+    global _installed_evaluate
+    _installed_evaluate = evaluate
+
+
+def _evaluate_chunk(
+    chunk: list[Point]
+) -> list[Any]:
+    evaluate = _installed_evaluate
+    if evaluate is None:
+        raise Exception("No evaluation function is installed in this worker")
+    return [evaluate(point) for point in chunk]
@@ -1,9 +1,14 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional
 import smoothmath._private.expression.variable as va
+import smoothmath._private.parallel as pl
+import smoothmath._private.vectorized_math_functions as vmf
+import smoothmath._private.point_batch as pb
+import smoothmath._private.streaming as st
 if TYPE_CHECKING:
-    from smoothmath import Point, Expression
+    from smoothmath import Point, PointBatch, Expression
     from smoothmath.expression import Variable
+    from smoothmath._private.vectorized_math_functions import Array
 
 
 class Partial:
@@ -36,24 +41,84 @@ class Partial:
         self._synthetic_partial = _initial_synthetic_partial(
             expression, variable_name, compute_early, _private
         )
+        # The synthetic partial built for evaluating at a PointBatch, when not computed early.
+        self._lazy_synthetic_partial: Optional[Expression]
+        self._lazy_synthetic_partial = None
 
     def at(
         self: Partial,
-        point: Point
-    ) -> float:
+        point: Point | PointBatch
+    ) -> float | Array:
         """
         Evaluates the partial at a point.
 
+        At a :class:`PointBatch`, evaluates at all of its points at once, giving a numpy array
+        of values. This writes the partial as an expression (see :meth:`as_expression`) and
+        evaluates it over whole columns, without changing how the partial is evaluated at
+        single points.
+
         :param point: where to evaluate the partial
         """
+        if isinstance(point, pb.PointBatch):
+            # We evaluate the original expression to check for DomainErrors.
+            self._original_expression.at(point)
+            return self._batch_synthetic_partial().at(point)
         if self._synthetic_partial is None:
-            self._original_expression._reset_evaluation_cache()
             return self._original_expression._numeric_partial(self._variable_name, point)
         else:
             # We evaluate the original expression to check for DomainErrors.
             self._original_expression.at(point)
             return self._synthetic_partial.at(point)
 
+    def at_many(
+        self: Partial,
+        points: Iterable[Point],
+        workers: Optional[int] = None,
+        columnar: bool = False
+    ) -> list[float] | Array:
+        """
+        Evaluates the partial at many points, spreading the work over a pool of processes.
+
+        Each worker process receives the partial once. The values come back in the
+        same order as the points.
+
+        :param points: where to evaluate the partial
+        :param workers: how many processes to use; defaults to the number of CPUs, and 1 evaluates in this process
+        :param columnar: whether to return the values as a numpy array rather than a list
+        """
+        values = pl.evaluate_many(self.at, points, workers)
+        return vmf.as_column(values) if columnar else values
+
+    def stream(
+        self: Partial,
+        points: Iterable[Point],
+        chunk_size: int = st.DEFAULT_CHUNK_SIZE
+    ) -> Iterator[Array]:
+        """
+        Evaluates the partial at a stream of points, a chunk at a time, yielding a numpy
+        array of values for each chunk. Requires numpy.
+
+        See :meth:`Expression.stream`.
+
+        :param points: where to evaluate the partial
+        :param chunk_size: how many points to evaluate at once
+        """
+        for batch in st.batches_of(points, chunk_size):
+            yield self.at(batch) # type: ignore
+
+    def _batch_synthetic_partial(
+        self: Partial
+    ) -> Expression:
+        # Unlike as_expression(), this leaves evaluating at single points unchanged.
+        if self._synthetic_partial is not None:
+            return self._synthetic_partial
+        # If two threads race here, each builds an equivalent synthetic partial.
+        synthetic_partial = self._lazy_synthetic_partial
+        if synthetic_partial is None:
+            synthetic_partial = _retrieve_synthetic_partial(self._original_expression, self._variable_name)
+            self._lazy_synthetic_partial = synthetic_partial
+        return synthetic_partial
+
     def as_expression(
         self: Partial
     ) -> Expression:
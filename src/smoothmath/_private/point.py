@@ -49,6 +49,18 @@ class Point:
             raise er.CoordinateMissing(f"Point has no coordinate for variable: {variable_name}")
         return value
 
+    def coordinate_names(
+        self: Point
+    ) -> list[str]:
+        """
+        The coordinate names of the point.
+
+        >>> from smoothmath import Point
+        >>> Point(x=3, y=4.5).coordinate_names()
+        ['x', 'y']
+        """
+        return list(self._coordinates.keys())
+
     def __eq__(
         self: Point,
         other: Any
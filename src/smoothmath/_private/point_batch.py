@@ -0,0 +1,110 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Iterable
+import smoothmath._private.point as pt
+import smoothmath._private.columns as co
+import smoothmath._private.expression.variable as va
+if TYPE_CHECKING:
+    from smoothmath import Point
+    from smoothmath.expression import Variable
+    from smoothmath._private.vectorized_math_functions import Array
+
+
+class PointBatch:
+    """
+    Many points, stored as one column of coordinates per variable name. Requires numpy.
+
+    >>> from smoothmath import PointBatch
+    >>> from smoothmath.expression import Variable
+    >>> x = Variable("x")
+    >>> y = Variable("y")
+    >>> batch = PointBatch(x=[1, 2, 3], y=[4, 5, 6])
+    >>> len(batch)
+    3
+    >>> (x * y).at(batch)
+    array([ 4., 10., 18.])
+
+    A batch can be passed to :meth:`Expression.at`, :meth:`Partial.at`, :meth:`Derivative.at`
+    and :meth:`Differential.at` to evaluate at all of its points at once.
+
+    Columns which support the buffer protocol and hold doubles, such as numpy arrays of
+    float64, an ``array("d")`` or a ``memoryview`` of one, are used without copying.
+    Other columns are copied into numpy arrays.
+
+    :param \\*\\*columns: an array of coordinates for each coordinate name
+    """
+
+    def __init__(
+        self: PointBatch,
+        **columns: Any
+    ) -> None:
+        self._columns: co.Columns
+        self._columns = co.Columns(columns)
+
+    @staticmethod
+    def from_points(
+        points: Iterable[Point]
+    ) -> PointBatch:
+        """
+        Gathers the coordinates of points into a batch.
+
+        The points should all have the same coordinate names.
+
+        :param points: the points
+        """
+        points = list(points)
+        if not points:
+            return PointBatch()
+        variable_names = points[0].coordinate_names()
+        return PointBatch(**{
+            variable_name: [point.coordinate(variable_name) for point in points]
+            for variable_name in variable_names
+        })
+
+    def coordinate(
+        self: PointBatch,
+        variable: Variable | str
+    ) -> Array:
+        """
+        Retrieves the column of coordinates for a variable.
+
+        Raises :exc:`~smoothmath.CoordinateMissing` if the batch has no column for
+        the coordinate name.
+
+        :param variable: selects which coordinate
+        """
+        return self._columns.column(va.get_variable_name(variable))
+
+    def point(
+        self: PointBatch,
+        i: int
+    ) -> Point:
+        """
+        Retrieves one point of the batch.
+
+        :param i: which point
+        """
+        return pt.Point(**{
+            variable_name: float(self._columns.column(variable_name)[i])
+            for variable_name in self._columns.variable_names()
+        })
+
+    def __len__(
+        self: PointBatch
+    ) -> int:
+        return self._columns.row_count
+
+    def __str__(
+        self: PointBatch
+    ) -> str:
+        return self._to_string()
+
+    def __repr__(
+        self: PointBatch
+    ) -> str:
+        return self._to_string()
+
+    def _to_string(
+        self: PointBatch
+    ) -> str:
+        names_string = ", ".join(self._columns.variable_names())
+        return f"PointBatch({names_string}; {len(self)} points)"
@@ -0,0 +1,159 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Optional
+import logging
+import smoothmath._private.normalization_cache as nc
+if TYPE_CHECKING:
+    from smoothmath import Expression
+
+
+# The reducers are not guaranteed to terminate when applied to arbitrary expressions,
+# so we give up on reducing after this many steps per node of the original expression.
+REDUCTION_STEPS_PER_NODE_BOUND = 100
+
+# Stack entries pair an expression with what to do to it next.
+_VISIT = 0 # start reducing the expression
+_SETTLE = 1 # its inner expressions are reduced; now rebuild it and apply its reducers
+_ADOPT = 2 # a reducer replaced it; its result is the result of the replacement
+
+
+class ReductionStatistics:
+    """
+    Counts the work done while reducing an expression.
+    """
+
+    def __init__(
+        self: ReductionStatistics
+    ) -> None:
+        # How many times a reducer (or consolidating an expression without variables)
+        # replaced an expression.
+        self.steps: int
+        self.steps = 0
+        # How many expressions were rebuilt because their inner expressions changed.
+        self.rebuilds: int
+        self.rebuilds = 0
+        # How many expressions were visited, counting each shared subexpression once.
+        self.visits: int
+        self.visits = 0
+
+    def __repr__(
+        self: ReductionStatistics
+    ) -> str:
+        return f"ReductionStatistics(steps={self.steps}, rebuilds={self.rebuilds}, visits={self.visits})"
+
+
+def fully_reduce(
+    expression: Expression,
+    statistics: Optional[ReductionStatistics] = None
+) -> Expression:
+    # We reduce bottom-up: an expression's reducers only run once its inner expressions
+    # are fully reduced. When a reducer replaces an expression, only the replacement is
+    # revisited, and the parts it shares with the original are already fully reduced.
+    if expression._is_fully_reduced:
+        return expression
+    if statistics is None:
+        statistics = ReductionStatistics()
+    steps_bound = REDUCTION_STEPS_PER_NODE_BOUND * _count_nodes(expression)
+    # The statistics may carry steps from earlier calls, so we bound the steps of this call.
+    steps_before = statistics.steps
+    gave_up = False
+    # Results are keyed by id, so we also keep the expressions alive while reducing.
+    results: dict[int, tuple[Expression, Expression]]
+    results = {}
+    stack: list[tuple[int, Expression, Optional[Expression]]]
+    stack = [(_VISIT, expression, None)]
+    while stack:
+        action, node, replacement = stack.pop()
+        if action == _ADOPT:
+            assert replacement is not None
+            _settle_result(results, node, _result_for(results, replacement))
+            continue
+        if action == _VISIT:
+            if node._is_fully_reduced:
+                continue
+            if id(node) in results:
+                continue
+            cached = nc.lookup(nc.REDUCED, node)
+            if cached is not None:
+                results[id(node)] = (node, cached)
+                continue
+            statistics.visits += 1
+            consolidated = node._consolidate_expression_lacking_variables()
+            if consolidated is not None:
+                statistics.steps += 1
+                stack.append((_ADOPT, node, consolidated))
+                stack.append((_VISIT, consolidated, None))
+                continue
+            stack.append((_SETTLE, node, None))
+            stack.extend((_VISIT, inner, None) for inner in reversed(node._subexpressions()))
+            continue
+        # action == _SETTLE
+        inners = node._subexpressions()
+        reduced_inners = [_result_for(results, inner) for inner in inners]
+        settled = node
+        if any(a is not b for (a, b) in zip(reduced_inners, inners)):
+            statistics.rebuilds += 1
+            settled = node._rebuild(*reduced_inners)
+            consolidated = settled._consolidate_expression_lacking_variables()
+            if consolidated is not None:
+                statistics.steps += 1
+                stack.append((_ADOPT, node, consolidated))
+                stack.append((_VISIT, consolidated, None))
+                continue
+        reduced = _apply_reducers(settled)
+        if reduced is not None and statistics.steps - steps_before >= steps_bound:
+            if not gave_up:
+                logging.warning(f"Unable to fully reduce within {steps_bound} steps")
+                gave_up = True
+            reduced = None
+        if reduced is None:
+            settled._is_fully_reduced = True
+            _settle_result(results, node, settled)
+        else:
+            statistics.steps += 1
+            stack.append((_ADOPT, node, reduced))
+            stack.append((_VISIT, reduced, None))
+    return _result_for(results, expression)
+
+
+def _settle_result(
+    results: dict[int, tuple[Expression, Expression]],
+    expression: Expression,
+    result: Expression
+) -> None:
+    results[id(expression)] = (expression, result)
+    nc.remember(nc.REDUCED, expression, result)
+
+
+def _result_for(
+    results: dict[int, tuple[Expression, Expression]],
+    expression: Expression
+) -> Expression:
+    entry = results.get(id(expression), None)
+    if entry is None: # the expression was already fully reduced
+        return expression
+    _, result = entry
+    return result
+
+
+def _apply_reducers(
+    expression: Expression
+) -> Optional[Expression]:
+    for reducer in expression._reducers:
+        reduced = reducer()
+        if reduced is not None:
+            return reduced
+    return None
+
+
+def _count_nodes(
+    expression: Expression
+) -> int:
+    seen = set()
+    stack = [expression]
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        stack.extend(node._subexpressions())
+    return len(seen)
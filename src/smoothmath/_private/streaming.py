@@ -0,0 +1,28 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Iterable, Iterator
+import itertools
+import smoothmath._private.point_batch as pb
+import smoothmath._private.utilities as util
+if TYPE_CHECKING:
+    from smoothmath import Point, PointBatch
+
+
+# How many points are evaluated together, unless a stream asks otherwise.
+DEFAULT_CHUNK_SIZE = 4096
+
+
+def batches_of(
+    points: Iterable[Point],
+    chunk_size: int
+) -> Iterator[PointBatch]:
+    # Pulls points from the iterable only as each batch is needed, so at most one chunk
+    # of points is held at a time, however many points there are.
+    integer_chunk_size = util.integer_from_integral_float(chunk_size)
+    if integer_chunk_size is None or integer_chunk_size < 1:
+        raise Exception(f"Expected a positive integer chunk size, found: {chunk_size}")
+    iterator = iter(points)
+    while True:
+        chunk = list(itertools.islice(iterator, integer_chunk_size))
+        if not chunk:
+            return
+        yield pb.PointBatch.from_points(chunk)
@@ -0,0 +1,326 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from array import array
+import smoothmath._private.linearization as li
+import smoothmath._private.accumulators as acc
+import smoothmath._private.expression as ex
+if TYPE_CHECKING:
+    from smoothmath import Point, Expression
+    from smoothmath._private.compiled_expression import Step
+
+
+class Tape:
+    """
+    Computes the values of one or more expressions and all of their partials in two sweeps.
+
+    The forward sweep runs through the linearized expression, storing each node's
+    value and the partials of each node with respect to its inner expressions.
+    The backward sweep then runs through the nodes in reverse, passing each node's
+    accumulated partial on to its inner expressions.
+
+    Alternatively, a single forward sweep can carry each node's value together with
+    its tangent: the rate of change of the node along a given direction.
+
+    When there are several expressions, they share the entries for their common
+    subexpressions, so the forward sweep evaluates those only once. Each expression
+    then gets its own backward sweep.
+
+    Second partials come from running the two sweeps forward-over-reverse: along a
+    direction, the forward sweep also computes tangents of the values and of the local
+    partials, and the backward sweep carries tangents of the accumulated partials. The
+    tangents reaching the variables form the Hessian-vector product.
+
+    Higher derivatives with respect to one variable come from a single forward sweep
+    carrying each node's truncated Taylor series.
+    """
+
+    def __init__(
+        self: Tape,
+        *expressions: Expression
+    ) -> None:
+        linearization = li.linearize(*expressions)
+        self._original_expressions: tuple[Expression, ...]
+        self._original_expressions = expressions
+        self._nodes: list[Expression]
+        self._nodes = linearization.nodes
+        self._inner_indices: list[tuple[int, ...]]
+        self._inner_indices = linearization.inner_indices
+        self._steps: list[Step]
+        self._steps = [
+            node._compile_step(inner_indices)
+            for node, inner_indices in zip(self._nodes, self._inner_indices)
+        ]
+        # The local partials of node i are stored starting at _edge_offsets[i].
+        self._edge_offsets: list[int]
+        self._edge_offsets = []
+        edge_count = 0
+        for inner_indices in self._inner_indices:
+            self._edge_offsets.append(edge_count)
+            edge_count += len(inner_indices)
+        self._output_indices: list[int]
+        self._output_indices = linearization.output_indices
+        # Partials accumulate into a buffer with an entry for each variable, so the
+        # backward sweep looks up each variable's index here rather than its name.
+        self.variable_index: acc.VariableIndex
+        self.variable_index = acc.VariableIndex(
+            node.name for node in self._nodes if isinstance(node, ex.Variable)
+        )
+        self._node_variable_indices: list[int]
+        self._node_variable_indices = [
+            self.variable_index.index_of(node.name) if isinstance(node, ex.Variable) else -1
+            for node in self._nodes
+        ]
+
+    def value_and_numeric_partials(
+        self: Tape,
+        point: Point
+    ) -> tuple[float, dict[str, float]]:
+        # Uses the first expression.
+        values, local_partials = self._forward_sweep(point)
+        output_index = self._output_indices[0]
+        accumulator = self._backward_sweep(local_partials, output_index)
+        numeric_partials = accumulator.numeric_partials_for(self._original_expressions[0]._variable_names)
+        return (values[output_index], numeric_partials)
+
+    def value_and_indexed_partials(
+        self: Tape,
+        point: Point
+    ) -> tuple[float, acc.IndexedPartialsAccumulator]:
+        # Uses the first expression.
+        values, local_partials = self._forward_sweep(point)
+        output_index = self._output_indices[0]
+        return (values[output_index], self._backward_sweep(local_partials, output_index))
+
+    def values(
+        self: Tape,
+        point: Point
+    ) -> list[float]:
+        # Gives the value of each expression, from a forward sweep which skips the local partials.
+        values: list[float]
+        values = []
+        append = values.append
+        for step in self._steps:
+            append(step(values, point))
+        return [values[i] for i in self._output_indices]
+
+    def values_and_numeric_partials(
+        self: Tape,
+        point: Point
+    ) -> tuple[list[float], list[dict[str, float]]]:
+        # Gives a value and partials for each expression.
+        values, local_partials = self._forward_sweep(point)
+        all_numeric_partials = [
+            self._backward_sweep(local_partials, output_index).numeric_partials_for(expression._variable_names)
+            for expression, output_index in zip(self._original_expressions, self._output_indices)
+        ]
+        return ([values[i] for i in self._output_indices], all_numeric_partials)
+
+    def value_and_directional_derivative(
+        self: Tape,
+        point: Point,
+        direction: Point
+    ) -> tuple[float, float]:
+        # Uses the first expression.
+        values: list[float]
+        values = []
+        tangents: list[float]
+        tangents = []
+        for node, step, inner_indices in zip(self._nodes, self._steps, self._inner_indices):
+            value = step(values, point)
+            values.append(value)
+            tangent = 0.0
+            if inner_indices:
+                inner_values = [values[i] for i in inner_indices]
+                local_partials = node._local_partials(value, inner_values)
+                for local_partial, inner_index in zip(local_partials, inner_indices):
+                    inner_tangent = tangents[inner_index]
+                    if inner_tangent != 0:
+                        tangent += local_partial * inner_tangent
+            elif isinstance(node, ex.Variable):
+                tangent = direction.coordinate(node.name)
+            tangents.append(tangent)
+        output_index = self._output_indices[0]
+        return (values[output_index], tangents[output_index])
+
+    def value_and_partial(
+        self: Tape,
+        point: Point,
+        variable_name: str
+    ) -> tuple[float, float]:
+        # Uses the first expression, which must have the variable. Like the directional
+        # derivative along the variable, but nodes not depending on the variable skip their
+        # local partials.
+        seed_index = self.variable_index.index_of(variable_name)
+        values: list[float]
+        values = []
+        tangents: list[float]
+        tangents = []
+        nodes_and_steps = zip(self._nodes, self._steps, self._inner_indices, self._node_variable_indices)
+        for node, step, inner_indices, variable_index in nodes_and_steps:
+            value = step(values, point)
+            values.append(value)
+            tangent = 0.0
+            if variable_index == seed_index:
+                tangent = 1.0
+            else:
+                for inner_index in inner_indices:
+                    if tangents[inner_index] != 0:
+                        inner_values = [values[i] for i in inner_indices]
+                        local_partials = node._local_partials(value, inner_values)
+                        for local_partial, j in zip(local_partials, inner_indices):
+                            inner_tangent = tangents[j]
+                            if inner_tangent != 0:
+                                tangent += local_partial * inner_tangent
+                        break
+            tangents.append(tangent)
+        output_index = self._output_indices[0]
+        return (values[output_index], tangents[output_index])
+
+    def compressed_jacobian(
+        self: Tape,
+        point: Point,
+        all_seeds: list[array[float]]
+    ) -> list[list[float]]:
+        # For each seed, which gives a tangent for each variable (by variable index), runs
+        # a tangent sweep and collects the tangents of all of the expressions. Those are the
+        # Jacobian times the seed. The forward sweep is shared by all of the seeds.
+        _, local_partials = self._forward_sweep(point)
+        return [self._tangent_sweep(local_partials, seeds) for seeds in all_seeds]
+
+    def _tangent_sweep(
+        self: Tape,
+        local_partials: array[float],
+        seeds: array[float]
+    ) -> list[float]:
+        tangents = [0.0] * len(self._nodes)
+        for i, inner_indices in enumerate(self._inner_indices):
+            if inner_indices:
+                offset = self._edge_offsets[i]
+                tangent = 0.0
+                for k, inner_index in enumerate(inner_indices):
+                    inner_tangent = tangents[inner_index]
+                    if inner_tangent != 0:
+                        tangent += local_partials[offset + k] * inner_tangent
+                tangents[i] = tangent
+            else:
+                variable_index = self._node_variable_indices[i]
+                if variable_index >= 0:
+                    tangents[i] = seeds[variable_index]
+        return [tangents[output_index] for output_index in self._output_indices]
+
+    def taylor_coefficients(
+        self: Tape,
+        point: Point,
+        variable_name: str,
+        order: int
+    ) -> list[float]:
+        # Uses the first expression.
+        values: list[float]
+        values = []
+        all_coefficients: list[list[float]]
+        all_coefficients = []
+        for node, step, inner_indices in zip(self._nodes, self._steps, self._inner_indices):
+            value = step(values, point)
+            values.append(value)
+            if isinstance(node, ex.Variable) and node.name == variable_name:
+                coefficients = [value, 1.0] + [0.0] * (order - 1)
+                coefficients = coefficients[:order + 1]
+            else:
+                inner_coefficients = [all_coefficients[i] for i in inner_indices]
+                coefficients = node._taylor_coefficients(value, inner_coefficients, order)
+            all_coefficients.append(coefficients)
+        return all_coefficients[self._output_indices[0]]
+
+    def hessian_vector_products(
+        self: Tape,
+        point: Point,
+        vectors: list[Point]
+    ) -> list[dict[str, float]]:
+        # Uses the first expression. The values and local partials are shared by all vectors.
+        values, local_partials = self._forward_sweep(point)
+        return [
+            self._hessian_vector_product(values, local_partials, vector)
+            for vector in vectors
+        ]
+
+    def _hessian_vector_product(
+        self: Tape,
+        values: list[float],
+        local_partials: array[float],
+        vector: Point
+    ) -> dict[str, float]:
+        tangents: list[float]
+        tangents = []
+        local_partial_tangents = array("d")
+        for i, (node, inner_indices) in enumerate(zip(self._nodes, self._inner_indices)):
+            tangent = 0.0
+            if inner_indices:
+                inner_values = [values[j] for j in inner_indices]
+                inner_tangents = [tangents[j] for j in inner_indices]
+                offset = self._edge_offsets[i]
+                for k, inner_tangent in enumerate(inner_tangents):
+                    if inner_tangent != 0:
+                        tangent += local_partials[offset + k] * inner_tangent
+                local_partial_tangents.extend(node._local_partial_tangents(values[i], inner_values, inner_tangents))
+            elif isinstance(node, ex.Variable):
+                tangent = vector.coordinate(node.name)
+            tangents.append(tangent)
+        output_index = self._output_indices[0]
+        accumulator = acc.IndexedPartialsAccumulator(self.variable_index)
+        multipliers = [0.0] * len(self._nodes)
+        multipliers[output_index] = 1.0
+        multiplier_tangents = [0.0] * len(self._nodes)
+        for i in range(output_index, -1, -1):
+            multiplier = multipliers[i]
+            multiplier_tangent = multiplier_tangents[i]
+            if multiplier == 0 and multiplier_tangent == 0:
+                continue
+            variable_index = self._node_variable_indices[i]
+            if variable_index >= 0:
+                accumulator.add_at(variable_index, multiplier_tangent)
+                continue
+            offset = self._edge_offsets[i]
+            for k, inner_index in enumerate(self._inner_indices[i]):
+                local_partial = local_partials[offset + k]
+                multipliers[inner_index] += multiplier * local_partial
+                multiplier_tangents[inner_index] += (
+                    multiplier_tangent * local_partial +
+                    multiplier * local_partial_tangents[offset + k]
+                )
+        return accumulator.numeric_partials_for(self._original_expressions[0]._variable_names)
+
+    def _forward_sweep(
+        self: Tape,
+        point: Point
+    ) -> tuple[list[float], array[float]]:
+        values: list[float]
+        values = []
+        local_partials = array("d")
+        for node, step, inner_indices in zip(self._nodes, self._steps, self._inner_indices):
+            value = step(values, point)
+            values.append(value)
+            if inner_indices:
+                inner_values = [values[i] for i in inner_indices]
+                local_partials.extend(node._local_partials(value, inner_values))
+        return (values, local_partials)
+
+    def _backward_sweep(
+        self: Tape,
+        local_partials: array[float],
+        output_index: int
+    ) -> acc.IndexedPartialsAccumulator:
+        accumulator = acc.IndexedPartialsAccumulator(self.variable_index)
+        multipliers = [0.0] * len(self._nodes)
+        multipliers[output_index] = 1.0
+        for i in range(output_index, -1, -1):
+            multiplier = multipliers[i]
+            if multiplier == 0:
+                continue
+            variable_index = self._node_variable_indices[i]
+            if variable_index >= 0:
+                accumulator.add_at(variable_index, multiplier)
+                continue
+            offset = self._edge_offsets[i]
+            for k, inner_index in enumerate(self._inner_indices[i]):
+                multipliers[inner_index] += multiplier * local_partials[offset + k]
+        return accumulator
@@ -0,0 +1,132 @@
+from __future__ import annotations
+import smoothmath._private.math_functions as mf
+
+
+# Truncated Taylor series are lists of coefficients [c_0, c_1, ..., c_k], standing for
+# c_0 + c_1 t + ... + c_k t^k. Every series passed to one function has the same length.
+# Where the constant coefficient of a result is known (it is the value of an expression),
+# it is passed in rather than recomputed. Each function takes O(k^2) operations.
+
+
+def constant(
+    value: float,
+    order: int
+) -> list[float]:
+    return [value] + [0.0] * order
+
+
+def add(
+    *series: list[float]
+) -> list[float]:
+    return [sum(coefficients) for coefficients in zip(*series)]
+
+
+def minus(
+    a: list[float],
+    b: list[float]
+) -> list[float]:
+    return [a_n - b_n for (a_n, b_n) in zip(a, b)]
+
+
+def negation(
+    a: list[float]
+) -> list[float]:
+    return [- a_n for a_n in a]
+
+
+def scale(
+    a: list[float],
+    factor: float
+) -> list[float]:
+    return [factor * a_n for a_n in a]
+
+
+def multiply(
+    a: list[float],
+    b: list[float]
+) -> list[float]:
+    return [
+        sum(a[j] * b[n - j] for j in range(n + 1))
+        for n in range(len(a))
+    ]
+
+
+def divide(
+    a: list[float],
+    b: list[float],
+    value: float
+) -> list[float]:
+    # From a = b c, matching coefficients of t^n gives a_n = sum_j b_j c_{n - j}.
+    c = [value]
+    for n in range(1, len(a)):
+        c.append((a[n] - sum(b[j] * c[n - j] for j in range(1, n + 1))) / b[0])
+    return c
+
+
+def reciprocal(
+    b: list[float],
+    value: float
+) -> list[float]:
+    return divide(constant(1.0, len(b) - 1), b, value)
+
+
+def natural_exponential(
+    a: list[float],
+    value: float
+) -> list[float]:
+    # From e' = a' e.
+    e = [value]
+    for n in range(1, len(a)):
+        e.append(sum(j * a[j] * e[n - j] for j in range(1, n + 1)) / n)
+    return e
+
+
+def natural_logarithm(
+    a: list[float],
+    value: float
+) -> list[float]:
+    # From a l' = a'.
+    l = [value]
+    for n in range(1, len(a)):
+        l.append((a[n] - sum(j * l[j] * a[n - j] for j in range(1, n)) / n) / a[0])
+    return l
+
+
+def sine_and_cosine(
+    a: list[float]
+) -> tuple[list[float], list[float]]:
+    # From s' = a' c and c' = - a' s.
+    s = [mf.sine(a[0])]
+    c = [mf.cosine(a[0])]
+    for n in range(1, len(a)):
+        s.append(sum(j * a[j] * c[n - j] for j in range(1, n + 1)) / n)
+        c.append(- sum(j * a[j] * s[n - j] for j in range(1, n + 1)) / n)
+    return (s, c)
+
+
+def real_power(
+    a: list[float],
+    r: float,
+    value: float
+) -> list[float]:
+    # From a p' = r a' p, which needs a_0 to be nonzero.
+    p = [value]
+    for n in range(1, len(a)):
+        p.append(sum((r * j - (n - j)) * a[j] * p[n - j] for j in range(1, n + 1)) / (n * a[0]))
+    return p
+
+
+def integer_power(
+    a: list[float],
+    n: int
+) -> list[float]:
+    # Repeated squaring, which also works when a_0 is zero.
+    result = constant(1.0, len(a) - 1)
+    base = a
+    while n > 0:
+        if n % 2 == 1:
+            result = multiply(result, base)
+        n //= 2
+        if n > 0:
+            base = multiply(base, base)
+    return result
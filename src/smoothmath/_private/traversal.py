@@ -0,0 +1,149 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar
+if TYPE_CHECKING:
+    from smoothmath import Expression
+
+
+# These traversals use explicit stacks rather than recursion, so they handle
+# expressions of any depth without exhausting the Python call stack.
+
+T = TypeVar("T")
+
+
+def fold(
+    expression: Expression,
+    combine: Callable[[Expression, list[T]], T],
+    known: Optional[Callable[[Expression], Optional[T]]] = None
+) -> T:
+    # Combines the results for the inner expressions of each node into a result for
+    # the node itself, working from the leaves up. A subexpression shared by several
+    # nodes is only combined once. When known gives a result for a node, that result
+    # is used and the node's inner expressions are not visited.
+    results: dict[int, T]
+    results = {}
+    # Recursion is much faster than an explicit stack, so we recurse until the expression
+    # turns out to be deep, then finish with the stack, keeping the results so far.
+    try:
+        return _fold_recursively(expression, combine, known, results, 0)
+    except _TooDeep:
+        return _fold_with_stack(expression, combine, known, results)
+
+
+# How deep fold() recurses before switching to an explicit stack.
+RECURSION_DEPTH = 100
+
+
+class _TooDeep(Exception):
+    pass
+
+
+def _fold_recursively(
+    node: Expression,
+    combine: Callable[[Expression, list[T]], T],
+    known: Optional[Callable[[Expression], Optional[T]]],
+    results: dict[int, T],
+    depth: int
+) -> T:
+    if depth > RECURSION_DEPTH:
+        raise _TooDeep()
+    if known is not None:
+        result = known(node)
+        if result is not None:
+            results[id(node)] = result
+            return result
+    inner_results = []
+    for inner in node._subexpressions():
+        inner_id = id(inner)
+        if inner_id in results:
+            inner_results.append(results[inner_id])
+        else:
+            inner_results.append(_fold_recursively(inner, combine, known, results, depth + 1))
+    result = combine(node, inner_results)
+    results[id(node)] = result
+    return result
+
+
+def _fold_with_stack(
+    expression: Expression,
+    combine: Callable[[Expression, list[T]], T],
+    known: Optional[Callable[[Expression], Optional[T]]],
+    results: dict[int, T]
+) -> T:
+    stack = [(expression, False)]
+    while stack:
+        node, inners_visited = stack.pop()
+        if id(node) in results:
+            continue
+        inners = node._subexpressions()
+        if not inners_visited:
+            if known is not None:
+                result = known(node)
+                if result is not None:
+                    results[id(node)] = result
+                    continue
+            stack.append((node, True))
+            stack.extend((inner, False) for inner in reversed(inners))
+            continue
+        results[id(node)] = combine(node, [results[id(inner)] for inner in inners])
+    return results[id(expression)]
+
+
+def structurally_equal(
+    expression: Expression,
+    other: Any
+) -> bool:
+    stack = [(expression, other)]
+    while stack:
+        a, b = stack.pop()
+        quick = _quick_equality(a, b)
+        if quick is None:
+            if not a._same_parameters(b):
+                return False
+            a_inners = a._subexpressions()
+            b_inners = b._subexpressions()
+            if len(a_inners) != len(b_inners):
+                return False
+            stack.extend(zip(a_inners, b_inners))
+        elif not quick:
+            return False
+    return True
+
+
+# Decides whether two expressions are equal when that can be done without comparing
+# their parameters and inner expressions. Otherwise, returns None.
+def _quick_equality(
+    expression: Expression,
+    other: Any
+) -> Optional[bool]:
+    if expression is other:
+        return True
+    if other.__class__ != expression.__class__:
+        return False
+    if other._hash != expression._hash:
+        return False
+    # Distinct interned expressions may still be equal, such as Constant(2) and
+    # Constant(2.0), which are interned separately to keep their representations.
+    return None
+
+
+def to_string(
+    expression: Expression
+) -> str:
+    # A node's string pieces go around the strings of its inner expressions, so a
+    # node with n inner expressions has n + 1 pieces.
+    parts: list[str]
+    parts = []
+    stack: list[Expression | str]
+    stack = [expression]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, str):
+            parts.append(item)
+            continue
+        pieces = item._string_pieces()
+        inners = item._subexpressions()
+        stack.append(pieces[-1])
+        for piece, inner in zip(reversed(pieces[:-1]), reversed(inners)):
+            stack.append(inner)
+            stack.append(piece)
+    return "".join(parts)
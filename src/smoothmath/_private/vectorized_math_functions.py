@@ -0,0 +1,210 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Any
+import math
+import smoothmath._private.errors as er
+import smoothmath._private.utilities as util
+try:
+    import numpy as np
+except ImportError: # numpy is an optional dependency
+    np = None
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+    Array = NDArray[Any]
+
+
+# These functions mirror the ones in smoothmath._private.math_functions, but they act
+# elementwise on numpy arrays. Unlike those, they don't check their elements: every
+# caller has already checked the expression's _vectorized_domain_violations(), either
+# raising a DomainError or, with BatchMasks, replacing invalid rows by 1. Scanning the
+# elements again would cost a pass over each column for nothing. They still check
+# their scalar parameters.
+
+
+def require_numpy() -> None:
+    if np is None:
+        raise Exception("Batch evaluation requires numpy. Install it with: pip install smoothmath[numpy]")
+
+
+def as_column(
+    values: Any
+) -> Array:
+    require_numpy()
+    column = np.asarray(values, dtype = np.float64)
+    if column.ndim != 1:
+        raise Exception(f"Expected a one-dimensional column, found shape: {column.shape}")
+    return column
+
+
+def full(
+    row_count: int,
+    value: float
+) -> Array:
+    require_numpy()
+    return np.full(row_count, value, dtype = np.float64)
+
+
+def broadcast(
+    values: Array,
+    row_count: int
+) -> Array:
+    return np.broadcast_to(values, (row_count,))
+
+
+def verify_no_violations(
+    violations: list[tuple[str, Array]]
+) -> None:
+    # Each violation pairs a message with a mask of the elements breaking a domain rule.
+    for message, mask in violations:
+        if mask.any():
+            raise er.DomainError(message)
+
+
+def all_valid(
+    row_count: int
+) -> Array:
+    require_numpy()
+    return np.ones(row_count, dtype = np.bool_)
+
+
+def no_error_codes(
+    row_count: int
+) -> Array:
+    require_numpy()
+    return np.zeros(row_count, dtype = np.int32)
+
+
+def where_valid(
+    valid: Array,
+    values: Array,
+    substitute: float
+) -> Array:
+    return np.where(valid, values, substitute)
+
+
+def add(
+    *args: Array
+) -> Array:
+    if not args:
+        return np.float64(0)
+    total = args[0]
+    for arg in args[1:]:
+        total = total + arg
+    return np.asarray(total, dtype = np.float64)
+
+
+def minus(
+    x: Array,
+    y: Array
+) -> Array:
+    return x - y
+
+
+def negation(
+    x: Array
+) -> Array:
+    return - x
+
+
+def multiply(
+    *args: Array
+) -> Array:
+    if not args:
+        return np.float64(1)
+    # Like math_functions.multiply(), a zero factor wins even against inf or nan.
+    product = args[0]
+    has_zero_factor = (args[0] == 0)
+    with np.errstate(invalid = "ignore"):
+        for arg in args[1:]:
+            product = product * arg
+            has_zero_factor = has_zero_factor | (arg == 0)
+    return np.where(has_zero_factor, 0.0, product)
+
+
+def divide(
+    x: Array,
+    y: Array
+) -> Array:
+    # Assumes y != 0.
+    return x / y
+
+
+def reciprocal(
+    x: Array
+) -> Array:
+    # Assumes x != 0.
+    return 1 / x
+
+
+def power(
+    x: Array,
+    y: Array
+) -> Array:
+    # Assumes x > 0.
+    return np.power(x, y)
+
+
+def nth_power(
+    x: Array,
+    n: int
+) -> Array:
+    if n <= 0:
+        raise er.DomainError(f"nth_power(x, n) is not defined for n = {n}")
+    return np.power(x, n)
+
+
+def nth_root(
+    x: Array,
+    n: int
+) -> Array:
+    if n <= 0:
+        raise er.DomainError(f"nth_root(x, n) is not defined for n = {n}")
+    elif n == 1:
+        return x
+    # Assumes x != 0, and x > 0 when n is even.
+    if util.is_even(n):
+        if n == 2:
+            return np.sqrt(x)
+        return np.power(x, 1 / n)
+    else: # n is odd
+        if n == 3:
+            return np.cbrt(x)
+        return np.sign(x) * np.power(np.abs(x), 1 / n)
+
+
+def exponential(
+    x: Array,
+    base: float = math.e
+) -> Array:
+    if base <= 0:
+        raise er.DomainError(f"exponential(x) must have a positive base, found: {base}")
+    elif base == math.e:
+        return np.exp(x)
+    else:
+        return np.power(base, x)
+
+
+def logarithm(
+    x: Array,
+    base: float = math.e
+) -> Array:
+    if base <= 0:
+        raise er.DomainError("logarithm(x) must have a positive base")
+    elif base == 1:
+        raise er.DomainError("logarithm(x) cannot have base = 1")
+    # Assumes x > 0.
+    if base == math.e:
+        return np.log(x)
+    else:
+        return np.log(x) / math.log(base)
+
+
+def cosine(
+    x: Array
+) -> Array:
+    return np.cos(x)
+
+
+def sine(
+    x: Array
+) -> Array:
+    return np.sin(x)
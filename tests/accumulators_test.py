@@ -1,17 +1,27 @@
 from smoothmath.expression import Variable, Constant, Add, Reciprocal
-from smoothmath._private.accumulators import NumericPartialsAccumulator, SyntheticPartialsAccumulator
+from smoothmath._private.accumulators import (
+    SyntheticPartialsAccumulator, VariableIndex, IndexedPartialsAccumulator
+)
 
 
-def test_NumericPartialsAccumulator():
-    x = Variable("x")
-    y = Variable("y")
-    accumulator = NumericPartialsAccumulator()
-    accumulator.add_to(x, 3)
-    accumulator.add_to(y, 5)
-    accumulator.add_to("x", 1)
-    numeric_partials = accumulator.numeric_partials_for(["x", "y"])
-    assert numeric_partials["x"] == 4
-    assert numeric_partials["y"] == 5
+def test_VariableIndex():
+    variable_index = VariableIndex(["y", "x", "y"])
+    assert variable_index.names == ["x", "y"]
+    assert len(variable_index) == 2
+    assert variable_index.index_of("y") == 1
+    assert variable_index.index_of(Variable("x")) == 0
+
+
+def test_IndexedPartialsAccumulator():
+    variable_index = VariableIndex(["x", "y", "z"])
+    accumulator = IndexedPartialsAccumulator(variable_index)
+    accumulator.add_at(0, 3)
+    accumulator.add_at(2, 5)
+    accumulator.add_at(0, 1)
+    assert list(accumulator.buffer) == [4, 0, 5]
+    assert accumulator.numeric_partials_for(["x", "y"]) == {"x": 4, "y": 0}
+    indices, values = accumulator.sparse()
+    assert (list(indices), list(values)) == ([0, 2], [4, 5])
 
 
 def test_SyntheticPartialsAccumulator():
@@ -0,0 +1,77 @@
+from pytest import approx, raises, importorskip
+import math
+from smoothmath import DomainError, Point, PointBatch
+from smoothmath.expression import (
+    Variable, Constant, Divide, Reciprocal, Power, NthRoot, Logarithm, Multiply, Sine
+)
+np = importorskip("numpy")
+
+
+def assert_masked_matches_pointwise(expression, columns):
+    result = expression.evaluate_batch(columns, masked = True)
+    names = list(columns.keys())
+    for i in range(len(columns[names[0]])):
+        point = Point(**{name: columns[name][i] for name in names})
+        try:
+            value = expression.at(point)
+        except DomainError as error:
+            assert not result.valid[i]
+            assert math.isnan(result.values[i])
+            code = result.error_codes[i]
+            assert code >= 1
+            assert result.errors[code - 1][1] == str(error)
+        else:
+            assert result.valid[i]
+            assert result.error_codes[i] == 0
+            assert result.values[i] == approx(value)
+
+
+def test_masked_evaluation():
+    x = Variable("x")
+    y = Variable("y")
+    columns = {"x": [0, 0, 0, 1, -1, 2, 0.5], "y": [1, 0, -1, 0, 2, 3, -2]}
+    expressions = [
+        Divide(y, x),
+        Divide(x, y),
+        Reciprocal(x),
+        Power(x, y),
+        NthRoot(x, n = 2),
+        NthRoot(x, n = 3),
+        Logarithm(x),
+        Logarithm(Divide(y, x)) + Sine(x),
+        Multiply(Reciprocal(x), Constant(0))
+    ]
+    for expression in expressions:
+        assert_masked_matches_pointwise(expression, columns)
+
+
+def test_masked_evaluation_names_the_failing_subexpression():
+    x = Variable("x")
+    y = Variable("y")
+    inner = Logarithm(x)
+    outer = Reciprocal(y)
+    z = inner + outer
+    result = z.evaluate_batch({"x": [-1, 1, 1, -1], "y": [1, 0, 1, 0]}, masked = True)
+    assert list(result.valid) == [False, False, True, False]
+    assert result.errors[result.error_codes[0] - 1][0] == inner
+    assert result.errors[result.error_codes[1] - 1][0] == outer
+    # The first failure in evaluation order is reported.
+    assert result.error_codes[3] == result.error_codes[0]
+    assert result.values[2] == approx(1)
+
+
+def test_masked_evaluation_when_all_valid():
+    x = Variable("x")
+    result = Logarithm(x).evaluate_batch(PointBatch(x = [1, math.e]), masked = True)
+    assert list(result.values) == approx([0, 1])
+    assert result.valid.all()
+    assert not result.error_codes.any()
+    assert result.errors == []
+
+
+def test_unmasked_evaluation_still_raises():
+    x = Variable("x")
+    with raises(DomainError):
+        Logarithm(x).evaluate_batch({"x": [1, -1]})
+    with raises(DomainError):
+        Logarithm(x).compile().evaluate_batch(PointBatch(x = [1, -1]))
@@ -0,0 +1,145 @@
+import pickle
+from pytest import approx, raises
+from smoothmath import DomainError, Point, PointBatch, Differential
+from smoothmath.expression import Variable, Constant, Add, Multiply, Logarithm, Sine, Exponential
+from smoothmath._private.tape import Tape
+from smoothmath._private.checkpointed_tape import CheckpointedTape
+
+
+def _deep_expression(
+    depth
+):
+    x = Variable("x")
+    y = Variable("y")
+    z = x
+    for i in range(depth):
+        z = Sine(z * Constant(0.9)) + y * Constant(i % 3)
+    return z
+
+
+def test_CheckpointedTape():
+    z = _deep_expression(2000)
+    point = Point(x = 0.3, y = 0.1)
+    tape = CheckpointedTape(z, memory_budget = 300)
+    assert tape._segment_length < 300
+    assert sum(tape._is_checkpoint) + tape._segment_length <= 300
+    value, numeric_partials = tape.value_and_numeric_partials(point)
+    expected_value, expected_partials = Tape(z).value_and_numeric_partials(point)
+    assert value == approx(expected_value)
+    assert numeric_partials == {name: approx(partial) for name, partial in expected_partials.items()}
+
+
+def test_CheckpointedTape_holds_few_values(monkeypatch):
+    z = _deep_expression(2000)
+    tape = CheckpointedTape(z, memory_budget = 300)
+    most_values_held = 0
+    most_held = 0
+    evaluate_segment = tape._evaluate_segment
+    backward_sweep_through_segment = tape._backward_sweep_through_segment
+    def evaluate_segment_spy(values, point, start):
+        nonlocal most_values_held
+        evaluate_segment(values, point, start)
+        most_values_held = max(most_values_held, len(values))
+    def backward_sweep_through_segment_spy(values, multipliers, accumulator, start):
+        nonlocal most_held
+        most_held = max(most_held, len(values) + len(multipliers))
+        backward_sweep_through_segment(values, multipliers, accumulator, start)
+        most_held = max(most_held, len(values) + len(multipliers))
+    monkeypatch.setattr(tape, "_evaluate_segment", evaluate_segment_spy)
+    monkeypatch.setattr(tape, "_backward_sweep_through_segment", backward_sweep_through_segment_spy)
+    tape.value_and_numeric_partials(Point(x = 0.3, y = 0.1))
+    assert 0 < most_values_held <= 300
+    assert 0 < most_held <= 300
+    assert len(tape._nodes) > 10 * 300
+
+
+def test_CheckpointedTape_counts_pending_multipliers():
+    x = Variable("x")
+    z = Add(*(Sine(x + Constant(i)) for i in range(50)))
+    # The sum's 50 inner expressions all have pending multipliers at once.
+    with raises(Exception):
+        CheckpointedTape(z, memory_budget = 60)
+    tape = CheckpointedTape(z, memory_budget = 160)
+    assert tape._most_held_for(tape._segment_length, tape._is_checkpoint) <= 160
+    assert tape.value_and_numeric_partials(Point(x = 0.5))[0] == approx(z.at(Point(x = 0.5)))
+
+
+def test_CheckpointedTape_with_shared_subexpressions():
+    x = Variable("x")
+    shared = Exponential(x * x)
+    z = Add(*(Multiply(shared, Constant(i), Sine(x + Constant(i))) for i in range(50)))
+    point = Point(x = 0.5)
+    for memory_budget in [1000, 200, 150]:
+        value, numeric_partials = CheckpointedTape(z, memory_budget).value_and_numeric_partials(point)
+        assert value == approx(z.at(point))
+        assert numeric_partials["x"] == approx(Tape(z).value_and_numeric_partials(point)[1]["x"])
+
+
+def test_CheckpointedTape_raises():
+    with raises(Exception):
+        CheckpointedTape(_deep_expression(100), memory_budget = 3)
+    t = Variable("t")
+    with raises(DomainError):
+        CheckpointedTape(Logarithm(t), memory_budget = 10).value_and_numeric_partials(Point(t = -1))
+    tape = CheckpointedTape(t, memory_budget = 10)
+    with raises(Exception):
+        tape.value_and_directional_derivative(Point(t = 1), Point(t = 1))
+    with raises(Exception):
+        tape.hessian_vector_products(Point(t = 1), [Point(t = 1)])
+    with raises(Exception):
+        tape.values_and_numeric_partials(Point(t = 1))
+    with raises(Exception):
+        tape.taylor_coefficients(Point(t = 1), "t", 2)
+    with raises(Exception):
+        tape.value_and_partial(Point(t = 1), "t")
+
+
+def test_Differential_with_memory_budget():
+    z = _deep_expression(1000)
+    point = Point(x = 0.3, y = 0.1)
+    differential = Differential(z, memory_budget = 200)
+    located = differential.at(point)
+    expected = Differential(z).at(point)
+    assert located.component("x") == approx(expected.component("x"))
+    assert differential.component_at("y", point) == approx(expected.component("y"))
+    value, gradient = differential.value_and_gradient(point)
+    assert value == approx(z.at(point))
+    assert list(differential.gradient_at(point)) == [approx(gradient.component("x")), approx(gradient.component("y"))]
+
+
+def test_Differential_with_memory_budget_takes_budgeted_sweeps(monkeypatch):
+    z = _deep_expression(50)
+    point = Point(x = 0.3, y = 0.1)
+    differential = Differential(z, memory_budget = 40)
+    expected = Differential(z)
+    tape = differential._reverse_mode_tape()
+    sweeps = 0
+    value_and_indexed_partials = tape.value_and_indexed_partials
+    def spy(point):
+        nonlocal sweeps
+        sweeps += 1
+        return value_and_indexed_partials(point)
+    monkeypatch.setattr(tape, "value_and_indexed_partials", spy)
+    direction = Point(x = 2, y = 3)
+    assert differential.directional_at(point, direction) == approx(expected.directional_at(point, direction))
+    assert sweeps == 1
+    batch = PointBatch(x = [0.3, 0.5], y = [0.1, 0.2])
+    components = differential.at(batch)
+    expected_components = expected.at(batch)
+    assert list(components) == ["x", "y"]
+    for variable_name in ["x", "y"]:
+        assert list(components[variable_name]) == [approx(c) for c in expected_components[variable_name]]
+    assert sweeps == 3
+    with raises(Exception):
+        differential.component("x")
+    with raises(Exception):
+        Differential(z, compute_early = True, memory_budget = 40)
+
+
+def test_Differential_with_memory_budget_pickles():
+    z = _deep_expression(20)
+    point = Point(x = 0.3, y = 0.1)
+    differential = Differential(z, memory_budget = 40)
+    differential.at(point)
+    unpickled = pickle.loads(pickle.dumps(differential))
+    assert unpickled.component_at("x", point) == approx(Differential(z).component_at("x", point))
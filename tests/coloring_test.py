@@ -0,0 +1,33 @@
+from smoothmath._private.coloring import color_columns
+
+
+def _assert_valid(
+    row_patterns,
+    colors
+):
+    for columns in row_patterns:
+        row_colors = [colors[column] for column in columns]
+        assert len(set(row_colors)) == len(row_colors)
+
+
+def test_color_columns_of_banded_pattern():
+    column_count = 100
+    row_patterns = [
+        [column for column in (row - 1, row, row + 1) if 0 <= column < column_count]
+        for row in range(column_count)
+    ]
+    colors = color_columns(row_patterns, column_count)
+    _assert_valid(row_patterns, colors)
+    assert max(colors) + 1 == 3
+
+
+def test_color_columns_of_dense_pattern():
+    row_patterns = [[0, 1, 2, 3]]
+    colors = color_columns(row_patterns, 4)
+    assert sorted(colors) == [0, 1, 2, 3]
+
+
+def test_color_columns_of_unused_columns():
+    colors = color_columns([[1], [1]], 3)
+    assert colors == [0, 0, 0]
+    assert color_columns([], 0) == []
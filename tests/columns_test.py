@@ -0,0 +1,22 @@
+from pytest import raises, importorskip
+from array import array
+from smoothmath import CoordinateMissing
+from smoothmath._private.columns import Columns
+np = importorskip("numpy")
+
+
+def test_Columns():
+    columns = Columns({"x": [1, 2, 3], "y": array("d", [4, 5, 6]), "z": np.arange(3)})
+    assert columns.row_count == 3
+    assert list(columns.column("y")) == [4, 5, 6]
+    with raises(CoordinateMissing):
+        columns.column("w")
+
+
+def test_Columns_with_mismatched_lengths():
+    with raises(Exception):
+        Columns({"x": [1, 2, 3], "y": [4, 5]})
+
+
+def test_Columns_when_empty():
+    assert Columns({}).row_count == 0
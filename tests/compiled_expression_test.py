@@ -0,0 +1,58 @@
+from pytest import approx, raises
+from smoothmath import DomainError, CoordinateMissing, Point, CompiledExpression
+from smoothmath.expression import (
+    Variable, Constant, Add, Minus, Multiply, Divide, Power, NthRoot, Logarithm, Cosine
+)
+
+
+def test_CompiledExpression():
+    x = Variable("x")
+    y = Variable("y")
+    z = Multiply(x, Cosine(y)) + Power(x, y) - Logarithm(x, base = 2) + NthRoot(y, n = 3)
+    compiled = z.compile()
+    for point in [Point(x = 2, y = 3), Point(x = 0.5, y = -8), Point(x = 7, y = 1)]:
+        assert compiled.at(point) == approx(z.at(point))
+        assert compiled(point) == approx(z.at(point))
+
+
+def test_CompiledExpression_at_number():
+    x = Variable("x")
+    compiled = (x ** 2 + Constant(3)).compile()
+    assert compiled.at(2) == approx(7)
+    compiled = (x ** 2 + Variable("y")).compile()
+    with raises(Exception):
+        compiled.at(2)
+
+
+def test_CompiledExpression_of_constant():
+    compiled = Add(Constant(2), Constant(3)).compile()
+    assert compiled.at(Point()) == approx(5)
+
+
+def test_CompiledExpression_raises():
+    t = Variable("t")
+    compiled = Divide(Constant(2) * t, t).compile()
+    with raises(DomainError):
+        compiled.at(Point(t = 0))
+    assert compiled.at(Point(t = 1)) == approx(2)
+    compiled = Logarithm(Minus(t, Constant(1))).compile()
+    with raises(DomainError):
+        compiled.at(Point(t = 1))
+    with raises(CoordinateMissing):
+        compiled.at(Point(s = 2))
+
+
+def test_CompiledExpression_shares_repeated_subexpressions():
+    x = Variable("x")
+    w = x ** 2
+    z = (w + Constant(1)) / w
+    compiled = z.compile()
+    assert len(compiled._steps) == 5
+    assert compiled.at(2) == approx(1.25)
+
+
+def test_CompiledExpression_equality():
+    x = Variable("x")
+    assert (x ** 2).compile() == CompiledExpression(x ** 2)
+    assert (x ** 2).compile() != (x ** 3).compile()
+    assert hash((x ** 2).compile()) == hash(CompiledExpression(x ** 2))
@@ -1,6 +1,10 @@
+import math
 from pytest import approx, raises
 from smoothmath import DomainError, Point, Derivative
-from smoothmath.expression import Variable, Constant, NthPower, Logarithm
+from smoothmath.expression import (
+    Variable, Constant, Add, Minus, Negation, Multiply, Reciprocal, Divide, Power,
+    NthPower, NthRoot, Exponential, Logarithm, Sine, Cosine
+)
 
 
 def test_Derivative():
@@ -55,3 +59,60 @@ def test_Derivative_hashing():
     z = x ** 2
     assert hash(Derivative(z)) == hash(Derivative(z))
     assert hash(Derivative(z)) == hash(Derivative(z, compute_early = True))
+
+
+def _nested_derivative_values(
+    expression,
+    number,
+    order
+):
+    # Differentiates synthetically, once per order.
+    values = [expression.at(number)]
+    for _ in range(order):
+        expression = expression._synthetic_partial("x")._normalize()
+        values.append(expression.at(number))
+    return values
+
+
+def test_taylor_coefficients():
+    x = Variable("x")
+    expressions = [
+        Add(Sine(x), NthPower(x, n = 2), Constant(3)),
+        Minus(Exponential(x), x),
+        Negation(Cosine(x)),
+        Multiply(x, Sine(x), Exponential(x)),
+        Reciprocal(x + Constant(1)),
+        Divide(Sine(x), x),
+        Power(x, x),
+        Power(Constant(3), Sine(x)),
+        NthPower(Sine(x), n = 5),
+        NthRoot(x, n = 2),
+        NthRoot(Negation(x), n = 3),
+        Exponential(x * x),
+        Exponential(x, base = 2),
+        Logarithm(x),
+        Logarithm(x * x, base = 10),
+        Cosine(x * x),
+    ]
+    order = 4
+    number = 0.8
+    for expression in expressions:
+        coefficients = Derivative(expression).taylor_coefficients(number, order = order)
+        expected = _nested_derivative_values(expression, number, order)
+        assert coefficients == [approx(value / math.factorial(k)) for k, value in enumerate(expected)]
+
+
+def test_taylor_coefficients_of_high_order():
+    x = Variable("x")
+    coefficients = Derivative(Exponential(x)).taylor_coefficients(Point(x = 0), order = 20)
+    assert coefficients == [approx(1 / math.factorial(k)) for k in range(21)]
+    assert Derivative(NthPower(x, n = 2)).taylor_coefficients(0, order = 0) == [0]
+    assert Derivative(Constant(2) * Constant(3)).taylor_coefficients(1, order = 2) == [6, 0, 0]
+
+
+def test_taylor_coefficients_raises():
+    x = Variable("x")
+    with raises(DomainError):
+        Derivative(Logarithm(x)).taylor_coefficients(-1, order = 3)
+    with raises(Exception):
+        Derivative(Sine(x)).taylor_coefficients(0, order = -1)
@@ -64,6 +64,21 @@ def test_Differential_raises():
         early_differential.at(point)
 
 
+def test_Differential_directional_at():
+    x = Variable("x")
+    y = Variable("y")
+    z = Logarithm(x * y) + Constant(3) * y
+    point = Point(x = 2, y = 5)
+    direction = Point(x = 1, y = -1)
+    for compute_early in (False, True):
+        differential = Differential(z, compute_early = compute_early)
+        located = differential.at(point)
+        expected = located.component(x) - located.component(y)
+        assert differential.directional_at(point, direction) == approx(expected)
+    with raises(DomainError):
+        Differential(z).directional_at(Point(x = -1, y = 1), direction)
+
+
 def test_LocatedDifferential_equality():
     x = Variable("x")
     y = Variable("y")
@@ -78,3 +93,52 @@ def test_LocatedDifferential_hashing():
     z = x * y ** 3
     assert hash(Differential(z)) == hash(Differential(z))
     assert hash(Differential(z)) == hash(Differential(z, compute_early = True))
+
+
+def test_Differential_value_and_gradient():
+    x = Variable("x")
+    y = Variable("y")
+    z = Logarithm(x * y) + Constant(3) * y
+    point = Point(x = 2, y = 5)
+    for compute_early in (False, True):
+        differential = Differential(z, compute_early = compute_early)
+        value, gradient = differential.value_and_gradient(point)
+        assert value == approx(z.at(point))
+        assert gradient == differential.at(point)
+        assert gradient.component(x) == approx(0.5)
+        assert gradient.component(y) == approx(3.2)
+        with raises(DomainError):
+            differential.value_and_gradient(Point(x = -1, y = 1))
+
+
+def test_Differential_value_and_gradient_computed_early_shares_one_tape():
+    x = Variable("x")
+    y = Variable("y")
+    z = Logarithm(x * y) + Constant(3) * y
+    differential = Differential(z, compute_early = True)
+    differential.value_and_gradient(Point(x = 2, y = 5))
+    tape = differential._synthetic_partials_tape
+    assert tape is not None
+    value, gradient = differential.value_and_gradient(Point(x = 1, y = 2))
+    assert differential._synthetic_partials_tape is tape
+    assert value == approx(z.at(Point(x = 1, y = 2)))
+    assert gradient.component(x) == approx(1)
+    assert gradient.component(y) == approx(3.5)
+
+
+def test_Differential_gradient_at():
+    variables = [Variable(f"x{i:04}") for i in range(1000)]
+    z = Constant(0)
+    for i, variable in enumerate(variables[::2]):
+        z = z + Constant(i) * variable
+    point = Point(**{variable.name: 1 for variable in variables})
+    differential = Differential(z)
+    names = differential.variable_names()
+    assert names == [variable.name for variable in variables[::2]]
+    gradient = differential.gradient_at(point)
+    assert list(gradient) == [approx(i) for i in range(500)]
+    indices, values = differential.gradient_at(point, sparse = True)
+    assert list(indices) == list(range(1, 500))
+    assert list(values) == [approx(i) for i in range(1, 500)]
+    early_differential = Differential(z, compute_early = True)
+    assert list(early_differential.gradient_at(point)) == [approx(i) for i in range(500)]
@@ -0,0 +1,72 @@
+from pytest import approx, raises, importorskip
+from smoothmath import DomainError, CoordinateMissing, Point
+from smoothmath.expression import (
+    Variable, Constant, Add, Minus, Negation, Multiply, Divide, Reciprocal,
+    Power, NthPower, NthRoot, Exponential, Logarithm, Cosine, Sine
+)
+np = importorskip("numpy")
+
+
+def assert_batch_matches_pointwise(expression, columns):
+    results = expression.evaluate_batch(columns)
+    names = list(columns.keys())
+    row_count = len(columns[names[0]])
+    assert results.shape == (row_count,)
+    for i in range(row_count):
+        point = Point(**{name: columns[name][i] for name in names})
+        assert results[i] == approx(expression.at(point))
+
+
+def test_evaluate_batch():
+    x = Variable("x")
+    y = Variable("y")
+    columns = {"x": [0.5, 1, 2, 3.5], "y": [-2, 0.25, 1, 3]}
+    expressions = [
+        Add(x, y, Constant(1)),
+        Minus(x, y),
+        Negation(x),
+        Multiply(x, y, Constant(0)),
+        Divide(y, x),
+        Reciprocal(x),
+        Power(x, y),
+        NthPower(y, n = 3),
+        NthRoot(y, n = 3),
+        NthRoot(x, n = 2),
+        Exponential(y),
+        Exponential(y, base = 2),
+        Logarithm(x),
+        Logarithm(x, base = 10),
+        Cosine(y),
+        Sine(y),
+        Exponential(x ** 2) * Cosine(x * y) - Logarithm(x + y ** 2)
+    ]
+    for expression in expressions:
+        assert_batch_matches_pointwise(expression, columns)
+
+
+def test_evaluate_batch_of_constant():
+    results = Add(Constant(2), Constant(3)).evaluate_batch({"x": [1, 2, 3]})
+    assert list(results) == [5, 5, 5]
+    results = Add().evaluate_batch({"x": [1, 2]})
+    assert list(results) == [0, 0]
+
+
+def test_evaluate_batch_raises():
+    x = Variable("x")
+    with raises(DomainError):
+        Logarithm(x).evaluate_batch({"x": [1, 2, -3]})
+    with raises(DomainError):
+        Divide(Constant(1), x).evaluate_batch({"x": [1, 0]})
+    with raises(DomainError):
+        Power(x, Constant(2)).evaluate_batch({"x": [0, 1]})
+    with raises(DomainError):
+        NthRoot(x, n = 2).evaluate_batch({"x": [1, -1]})
+    with raises(CoordinateMissing):
+        (x + Variable("y")).evaluate_batch({"x": [1, 2]})
+
+
+def test_CompiledExpression_evaluate_batch():
+    x = Variable("x")
+    compiled = (x ** 2 + Constant(1)).compile()
+    assert list(compiled.evaluate_batch({"x": [1, 2, 3]})) == [2, 5, 10]
+    assert list(compiled.evaluate_batch({"x": np.array([4.0])})) == [17]
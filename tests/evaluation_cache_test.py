@@ -0,0 +1,54 @@
+from pytest import approx, raises
+from smoothmath import DomainError, Point
+from smoothmath.expression import Variable, Constant, Add, Multiply, Sine, Logarithm
+import smoothmath._private.evaluation_cache as ec
+
+
+def test_evaluation_reuses_cached_compiled_expressions():
+    ec.clear()
+    x = Variable("x")
+    z = Sine(x) + x
+    assert z.at(Point(x = 0)) == 0
+    assert ec.cached_counts() == (0, 0)
+    assert z.at(Point(x = 0)) == 0
+    assert ec.cached_counts() == (1, 0)
+    assert ec.compiled_expression_for(z) is ec.compiled_expression_for(Sine(Variable("x")) + x)
+    z._numeric_partials(Point(x = 0))
+    assert ec.cached_counts() == (1, 1)
+    assert not hasattr(z, "_compiled")
+
+
+def test_evaluation_cache_is_bounded():
+    ec.clear()
+    x = Variable("x")
+    for n in range(ec.DEFAULT_MAXSIZE + 10):
+        (x + Constant(n)).at(Point(x = 1))
+        (x + Constant(n)).at(Point(x = 1))
+    assert ec.cached_counts() == (ec.DEFAULT_MAXSIZE, 0)
+
+
+def test_first_evaluation_walks_the_expression():
+    ec.clear()
+    x = Variable("x")
+    z = Logarithm(x) * Sine(x)
+    assert z.at(2) == approx(z.compile().at(2))
+    assert ec.cached_counts() == (0, 0)
+    with raises(DomainError):
+        (Logarithm(x) + Logarithm(Constant(-1) * x)).at(-1)
+    assert z.at(Point(x = 3)) == approx(z.compile().at(3))
+    assert ec.cached_counts() == (1, 0)
+
+
+def test_evaluation_cache_skips_leaves():
+    ec.clear()
+    assert Variable("x").at(Point(x = 2)) == 2
+    assert Constant(3).at(Point()) == 3
+    assert ec.cached_counts() == (0, 0)
+
+
+def test_reduction_does_not_cache_evaluations():
+    ec.clear()
+    x = Variable("x")
+    z = Multiply(Add(Constant(2), Constant(3)), Logarithm(Constant(1)), x)
+    assert z._fully_reduce() == Constant(0)
+    assert ec.cached_counts() == (0, 0)
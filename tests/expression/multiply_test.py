@@ -1,3 +1,4 @@
+import math
 from pytest import approx
 from smoothmath import Point
 from smoothmath.expression import (
@@ -79,6 +80,35 @@ def test_Multiply_by_zero():
     assert_1_ary_partials(z, point, x, 0)
 
 
+def test_Multiply_local_partials_with_zero_factors():
+    z = Multiply(Variable("w"), Variable("x"), Variable("y"), Variable("z"))
+    assert z._local_partials(0, [2, 0, math.inf, 3]) == [0, math.inf, 0, 0]
+    assert z._local_partials(0, [0, 5, 0, 3]) == [0, 0, 0, 0]
+    assert z._local_partials(24, [1, 2, 3, 4]) == [24, 12, 8, 6]
+
+
+def test_Multiply_local_partial_tangents():
+    values = [1.5, -2, 3, 0.5, 4]
+    tangents = [1, 0, -1, 2, 0.5]
+    z = Multiply(*(Variable(f"x{i}") for i in range(5)))
+    local_partial_tangents = z._local_partial_tangents(0, values, tangents)
+    for i, local_partial_tangent in enumerate(local_partial_tangents):
+        expected = sum(
+            tangents[k] * math.prod(values[j] for j in range(5) if j not in (i, k))
+            for k in range(5) if k != i
+        )
+        assert local_partial_tangent == approx(expected)
+
+
+def test_wide_Multiply():
+    variables = [Variable(f"x{i}") for i in range(500)]
+    z = Multiply(*variables)
+    point = Point(**{variable.name: (2 if i == 7 else 1) for (i, variable) in enumerate(variables)})
+    numeric_partials = z._numeric_partials(point)
+    assert numeric_partials["x7"] == approx(1)
+    assert numeric_partials["x8"] == approx(2)
+
+
 def test_Multiply_by_one():
     x = Variable("x")
     z = Multiply(Constant(1), x)
@@ -1,9 +1,12 @@
+import math
+import pickle
 from pytest import approx, raises, fail
 from smoothmath import DomainError, Point, Partial, Differential, LocatedDifferential
 from smoothmath.expression import (
-    Variable, Constant, Add, Multiply, Reciprocal, NthPower, Exponential, Logarithm
+    Variable, Constant, Add, Multiply, Reciprocal, NthPower, Exponential, Logarithm, Sine
 )
 from smoothmath._private.base_expression.expression import get_the_single_variable_name
+from smoothmath._private.linearization import linearize
 
 
 def test_expression_evaluation():
@@ -18,6 +21,44 @@ def test_expression_evaluation():
         z.at(2)
 
 
+def test_value_and_gradient():
+    x = Variable("x")
+    y = Variable("y")
+    z = x ** 2 + Sine(x * y)
+    point = Point(x = 2, y = 0)
+    value, gradient = z.value_and_gradient(point)
+    assert value == approx(4)
+    assert gradient == LocatedDifferential(z, point)
+    assert gradient.component(x) == approx(4)
+    assert gradient.component(y) == approx(2)
+    value, gradient = (x ** 3).value_and_gradient(2)
+    assert value == approx(8)
+    assert gradient.component(x) == approx(12)
+    with raises(Exception):
+        z.value_and_gradient(2)
+    with raises(DomainError):
+        Logarithm(x).value_and_gradient(-1)
+
+
+def test_synthetic_partials_share_subexpressions():
+    variables = [Variable(f"x{i}") for i in range(200)]
+    synthetic_partials = Sine(Multiply(*variables))._synthetic_partials()
+    # Each partial multiplies the shared Cosine(...) by a shared prefix and suffix product.
+    assert len(linearize(*synthetic_partials.values())) < 5 * len(variables)
+    point = Point(**{variable.name: 1 for variable in variables})
+    assert synthetic_partials["x7"].at(point) == approx(math.cos(1))
+
+
+def test_synthetic_partials_of_expression_with_many_paths():
+    x = Variable("x")
+    z = x
+    for _ in range(40):
+        z = Multiply(z, z) # 2^40 paths lead from the top down to x
+    synthetic_partial = z._synthetic_partials()["x"]
+    assert len(linearize(synthetic_partial)) < 400
+    assert synthetic_partial.at(Point(x = 1)) == approx(2 ** 40)
+
+
 def test_unary_expression_equality():
     x = Variable("x")
     y = Variable("y")
@@ -32,6 +73,52 @@ def test_binary_expression_equality():
     assert Multiply(x, y) != Multiply(y, x)
 
 
+def test_n_ary_expression_equality():
+    x = Variable("x")
+    y = Variable("y")
+    assert Add(x, y, Constant(1)) == Add(x, y, Constant(1))
+    assert Add(x, y, Constant(1)) != Add(x, y)
+    assert Add(x, y) != Multiply(x, y)
+
+
+def test_expression_hash_is_computed_at_construction():
+    x = Variable("x")
+    y = Variable("y")
+    z = Exponential(Add(x, y) * Sine(x), base = 2)
+    assert z._hash == hash(z)
+    assert hash(z) == hash(Exponential(Add(x, y) * Sine(x), base = 2))
+    assert hash(NthPower(x, n = 2)) != hash(NthPower(x, n = 3))
+
+
+def test_expression_hash_of_deep_expression():
+    z = Variable("x")
+    for _ in range(5000):
+        z = Sine(z)
+    assert {z: 1}[z] == 1
+    assert z != Sine(z)
+
+
+def test_expression_hash_after_pickling():
+    x = Variable("x")
+    z = Multiply(Sine(x), NthPower(x, n = 3))
+    copy = pickle.loads(pickle.dumps(z))
+    assert copy == z
+    assert hash(copy) == hash(z)
+    assert {z: 1}[copy] == 1
+
+
+def test_pickling_deep_expression():
+    x = Variable("x")
+    shared = Sine(x)
+    z = shared
+    for _ in range(5000):
+        z = Add(z, shared)
+    copy = pickle.loads(pickle.dumps(z))
+    assert copy == z
+    assert hash(copy) == hash(z)
+    assert copy._inners[1] is copy._inners[0]._inners[1]
+
+
 def test_expression_reuse():
     x = Variable("x")
     w = x ** 2
@@ -192,3 +279,14 @@ def test_get_the_single_variable_name():
     bad = x ** 2 + y ** 2
     with raises(Exception):
         get_the_single_variable_name(bad, exception_message)
+
+
+def test_expressions_share_variable_name_sets():
+    x = Variable("x")
+    y = Variable("y")
+    z = Sine(x * y) + Constant(1)
+    assert not hasattr(z, "__dict__")
+    assert not hasattr(x, "__dict__")
+    assert z._variable_names == frozenset(("x", "y"))
+    assert z._variable_names is z._inners[0]._variable_names
+    assert pickle.loads(pickle.dumps(z)) == z
@@ -0,0 +1,90 @@
+import pytest
+from pytest import approx, raises
+from smoothmath import DomainError, CoordinateMissing, Point, Hessian
+from smoothmath.expression import (
+    Variable, Constant, Add, Minus, Negation, Multiply, Reciprocal, Divide, Power,
+    NthPower, NthRoot, Exponential, Logarithm, Sine, Cosine
+)
+
+
+x = Variable("x")
+y = Variable("y")
+z = Variable("z")
+
+
+def _expected_hessian(
+    expression,
+    point,
+    variable_names
+):
+    # Differentiates synthetically twice.
+    return [
+        [
+            expression._synthetic_partial(a)._synthetic_partial(b).at(point)
+            for b in variable_names
+        ]
+        for a in variable_names
+    ]
+
+
+@pytest.mark.parametrize("expression", [
+    Add(x * y, Sine(x), Constant(2)),
+    Minus(x * x, y * y * x),
+    Negation(x * y * y),
+    Multiply(x, y, z, Sine(x)),
+    Reciprocal(x + y),
+    Divide(x * x, y + z),
+    Power(x, y),
+    Power(Constant(2), x * y),
+    NthPower(x + y, n = 3),
+    NthPower(x * y, n = 2),
+    NthRoot(x * y, n = 3),
+    NthRoot(x + y, n = 2),
+    Exponential(x * y),
+    Exponential(x * y, base = 3),
+    Logarithm(x * y),
+    Logarithm(x + y, base = 10),
+    Sine(x * y),
+    Cosine(x * y * z),
+])
+def test_Hessian(expression):
+    hessian = Hessian(expression)
+    names = hessian.variable_names()
+    point = Point(x = 1.5, y = 0.7, z = 1.2)
+    expected = _expected_hessian(expression, point, names)
+    assert hessian.at(point) == [[approx(value) for value in row] for row in expected]
+
+
+def test_Hessian_hvp():
+    expression = Exponential(x * y) + Sine(y * z) / (x + Constant(3))
+    hessian = Hessian(expression)
+    point = Point(x = 0.5, y = -1, z = 2)
+    vector = Point(x = 1, y = 2, z = -3)
+    matrix = hessian.at(point)
+    names = hessian.variable_names()
+    product = hessian.hvp(point, vector)
+    assert list(product) == names
+    for name, row in zip(names, matrix):
+        expected = sum(entry * vector.coordinate(other) for entry, other in zip(row, names))
+        assert product[name] == approx(expected)
+
+
+def test_Hessian_of_expression_without_variables():
+    hessian = Hessian(Constant(3) * Constant(4))
+    assert hessian.at(Point()) == []
+    assert hessian.hvp(Point(), Point()) == {}
+
+
+def test_Hessian_raises():
+    hessian = Hessian(Logarithm(x))
+    with raises(DomainError):
+        hessian.at(Point(x = -1))
+    with raises(CoordinateMissing):
+        hessian.hvp(Point(x = 1), Point(y = 1))
+
+
+def test_Hessian_equality():
+    assert Hessian(Sine(x)) == Hessian(Sine(x))
+    assert Hessian(Sine(x)) != Hessian(Cosine(x))
+    assert hash(Hessian(Sine(x))) == hash(Hessian(Sine(x)))
+    assert str(Hessian(Sine(x))) == "Hessian(Sine(Variable(\"x\")))"
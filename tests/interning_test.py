@@ -0,0 +1,111 @@
+import gc
+import pickle
+import threading
+from pytest import approx
+from smoothmath import Point, Differential, interning
+from smoothmath.expression import Variable, Constant, Add, Multiply, NthPower, Exponential, Sine
+from smoothmath._private.interning import is_interning, interned_count
+import smoothmath._private.interning as it
+
+
+def test_interning():
+    with interning():
+        assert is_interning()
+        x = Variable("x")
+        assert Variable("x") is x
+        assert Constant(2) is Constant(2)
+        assert Constant(2) is not Constant(2.0)
+        assert Multiply(x, Constant(2)) is Multiply(Variable("x"), Constant(2))
+        assert NthPower(x, n = 2) is NthPower(x, n = 2)
+        assert NthPower(x, n = 2) is not NthPower(x, n = 3)
+        assert Exponential(x, base = 2) is not Exponential(x)
+        assert Add(x, x, x) is Add(x, x, x)
+    assert not is_interning()
+    assert Variable("x") is not Variable("x")
+
+
+def test_interning_nests():
+    with interning():
+        with interning():
+            assert is_interning()
+        assert is_interning()
+    assert not is_interning()
+
+
+def test_interning_expressions_built_beforehand():
+    outside = Sine(Variable("x") + Constant(1))
+    with interning():
+        inside = Sine(Variable("x") + Constant(1))
+        assert Multiply(outside, Constant(3)) is Multiply(inside, Constant(3))
+        assert Multiply(outside, Constant(3))._inners[0] is inside
+    assert outside == inside
+    assert not outside._is_interned
+
+
+def test_equality_of_interned_expressions():
+    x = Variable("x")
+    y = Variable("y")
+    with interning():
+        a = Sine(x * y)
+        b = Sine(y * x)
+    assert a == Sine(Variable("x") * Variable("y"))
+    assert a != b
+    assert hash(a) == hash(Sine(Variable("x") * Variable("y")))
+
+
+def test_interned_synthetic_partials_share_subexpressions():
+    x = Variable("x")
+    y = Variable("y")
+    with interning():
+        z = Sine(x * y) * Sine(x * y) + x
+        differential = Differential(z, compute_early = True)
+        x_partial = differential.component(x).as_expression()
+        assert x_partial._is_interned
+    point = Point(x = 0.5, y = 2)
+    assert differential.component_at(x, point) == approx(Differential(z).component_at(x, point))
+
+
+def test_interned_expressions_are_released():
+    gc.collect()
+    before = interned_count()
+    with interning():
+        z = Sine(Variable("unused_variable") * Constant(12345))
+        assert interned_count() == before + 4
+    del z
+    gc.collect()
+    assert interned_count() == before
+
+
+def test_copies_of_interned_expressions_are_not_canonical():
+    with interning():
+        z = Sine(Variable("x"))
+    copied = pickle.loads(pickle.dumps(z))
+    assert copied is not z
+    assert not copied._is_interned
+    assert copied == z
+
+
+def test_interning_keeps_equality():
+    x = Variable("x")
+    with interning():
+        assert Constant(2) == Constant(2.0)
+        assert Multiply(x, Constant(2)) == Multiply(x, Constant(2.0))
+        assert Exponential(x, base = 2) == Exponential(x, base = 2.0)
+        table = { Constant(2): "two" }
+        assert table[Constant(2.0)] == "two"
+    assert Constant(2) == Constant(2.0)
+
+
+def test_rebuilding_does_not_turn_on_interning_for_other_threads():
+    observed = []
+    def observe() -> None:
+        observed.append(is_interning())
+    it._rebuilding.depth = 1
+    try:
+        assert is_interning()
+        thread = threading.Thread(target = observe)
+        thread.start()
+        thread.join()
+    finally:
+        it._rebuilding.depth = 0
+    assert observed == [False]
@@ -0,0 +1,92 @@
+import pickle
+from pytest import approx, raises
+from smoothmath import DomainError, Point, Differential, Jacobian
+from smoothmath.expression import Variable, Constant, Logarithm, Sine, Exponential
+
+
+def test_Jacobian():
+    x = Variable("x")
+    y = Variable("y")
+    w = Variable("w")
+    shared = Exponential(x * y)
+    expressions = [shared + Sine(x), shared * w, Constant(3)]
+    jacobian = Jacobian(expressions)
+    assert jacobian.variable_names() == ["w", "x", "y"]
+    point = Point(w = 2, x = 0.5, y = 1.5)
+    dense = jacobian.at(point)
+    assert len(dense) == 3
+    for row, expression in zip(dense, expressions):
+        located = Differential(expression).at(point)
+        assert row == [approx(located.component(name)) for name in ["w", "x", "y"]]
+    sparse = jacobian.at(point, sparse = True)
+    assert set(sparse) == {(0, "x"), (0, "y"), (1, "w"), (1, "x"), (1, "y")}
+    assert sparse[(1, "x")] == approx(dense[1][1])
+
+
+def test_Jacobian_at_many():
+    x = Variable("x")
+    y = Variable("y")
+    jacobian = Jacobian([x * y, x + y])
+    points = [Point(x = 1, y = 2), Point(x = 3, y = 4)]
+    assert jacobian.at_many(points, workers = 1) == [[[2, 1], [1, 1]], [[4, 3], [1, 1]]]
+    assert jacobian.at_many(points, workers = 2, sparse = True) == [
+        jacobian.at(point, sparse = True) for point in points
+    ]
+
+
+def test_Jacobian_raises():
+    x = Variable("x")
+    jacobian = Jacobian([x, Logarithm(x)])
+    with raises(DomainError):
+        jacobian.at(Point(x = -1))
+
+
+def test_Jacobian_pickles():
+    x = Variable("x")
+    jacobian = Jacobian([Sine(x), x * x])
+    jacobian.at(Point(x = 1))
+    unpickled = pickle.loads(pickle.dumps(jacobian))
+    assert unpickled == jacobian
+    assert hash(unpickled) == hash(jacobian)
+    assert unpickled.at(Point(x = 1)) == jacobian.at(Point(x = 1))
+
+
+def test_Jacobian_string():
+    x = Variable("x")
+    assert str(Jacobian([x, Sine(x)])) == "Jacobian([Variable(\"x\"), Sine(Variable(\"x\"))])"
+
+
+def test_Jacobian_sparse_at():
+    # A chain of constraints, each depending on neighboring variables.
+    variables = [Variable(f"x{i:03}") for i in range(300)]
+    expressions = [
+        Sine(variables[i]) * variables[i + 1] - Exponential(variables[i + 2])
+        for i in range(len(variables) - 2)
+    ]
+    jacobian = Jacobian(expressions)
+    point = Point(**{variable.name: 0.01 * i for (i, variable) in enumerate(variables)})
+    dense = jacobian.at(point)
+    csr = jacobian.sparse_at(point)
+    assert csr.shape == (298, 300)
+    assert len(csr.indptr) == 299
+    assert len(jacobian._shared_tape().compressed_jacobian(point, [])) == 0
+    assert max(jacobian._colors()) + 1 == 3 # three tangent sweeps
+    for row in range(298):
+        start, end = csr.indptr[row], csr.indptr[row + 1]
+        assert list(csr.columns[start:end]) == [row, row + 1, row + 2]
+        for column, value in zip(csr.columns[start:end], csr.values[start:end]):
+            assert value == approx(dense[row][column])
+    coo = jacobian.sparse_at(point, format = "coo")
+    assert coo.shape == csr.shape
+    assert list(coo.columns) == list(csr.columns)
+    assert list(coo.values) == list(csr.values)
+    assert list(coo.rows[:6]) == [0, 0, 0, 1, 1, 1]
+
+
+def test_Jacobian_sparse_at_raises():
+    x = Variable("x")
+    jacobian = Jacobian([Logarithm(x)])
+    with raises(DomainError):
+        jacobian.sparse_at(Point(x = -1))
+    with raises(Exception):
+        jacobian.sparse_at(Point(x = 1), format = "csc")
@@ -0,0 +1,42 @@
+from smoothmath.expression import Variable, Constant, Add, Multiply, Sine
+from smoothmath._private.linearization import linearize
+
+
+def test_linearize():
+    x = Variable("x")
+    y = Variable("y")
+    z = Add(Multiply(x, y), Sine(x))
+    linearization = linearize(z)
+    assert len(linearization) == 5
+    nodes = linearization.nodes
+    for node, inner_indices in zip(nodes, linearization.inner_indices):
+        assert [nodes[i] for i in inner_indices] == node._subexpressions()
+        assert all(nodes.index(node) > i for i in inner_indices)
+    assert linearization.output_indices == [4]
+    assert nodes[4] == z
+
+
+def test_linearize_shares_equal_subexpressions():
+    z = Add(Multiply(Variable("x"), Constant(2)), Multiply(Variable("x"), Constant(2)))
+    linearization = linearize(z)
+    assert len(linearization) == 4
+    assert linearization.inner_indices[-1] == (2, 2)
+
+
+def test_linearize_several_expressions():
+    x = Variable("x")
+    shared = Sine(x)
+    linearization = linearize(shared + Constant(1), shared * x)
+    assert len(linearization) == 5
+    first, second = linearization.output_indices
+    assert linearization.nodes[first] == shared + Constant(1)
+    assert linearization.nodes[second] == shared * x
+
+
+def test_linearize_deep_expression():
+    z = Variable("x")
+    for _ in range(5000):
+        z = Sine(z)
+    linearization = linearize(z)
+    assert len(linearization) == 5001
+    assert linearization.inner_indices[-1] == (4999,)
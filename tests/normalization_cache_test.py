@@ -0,0 +1,95 @@
+import pytest
+from smoothmath import (
+    Point,
+    Differential,
+    normalization_cache_info,
+    set_normalization_cache_size,
+    clear_normalization_cache
+)
+from smoothmath.expression import Variable, Constant, Add, Multiply, NthPower, Sine, Exponential
+import smoothmath._private.normalization_cache as nc
+from smoothmath._private.normalization_cache import DEFAULT_MAXSIZE, LRUCache
+from smoothmath._private.reduction import ReductionStatistics
+
+
+@pytest.fixture(autouse = True)
+def fresh_cache():
+    clear_normalization_cache()
+    yield
+    set_normalization_cache_size(DEFAULT_MAXSIZE)
+    clear_normalization_cache()
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(2)
+    x = Variable("x")
+    cache.put("a", x)
+    cache.put("b", x)
+    assert cache.get("a") is x # "a" is now the most recently used
+    cache.put("c", x)
+    assert cache.get("b") is None
+    assert cache.get("a") is x
+    assert cache.get("c") is x
+    info = cache.info()
+    assert (info.hits, info.misses, info.maxsize, info.currsize) == (3, 1, 2, 2)
+
+
+def test_lru_cache_resize():
+    cache = LRUCache(3)
+    x = Variable("x")
+    for key in ["a", "b", "c"]:
+        cache.put(key, x)
+    cache.resize(1)
+    assert cache.info().currsize == 1
+    assert cache.get("c") is x
+    cache.resize(0)
+    cache.put("d", x)
+    assert cache.info().currsize == 0
+
+
+def test_normalize_reuses_structurally_equal_expressions():
+    x = Variable("x")
+    Sine(NthPower(x, n = 1))._normalize()
+    assert normalization_cache_info().hits == 0
+    statistics = ReductionStatistics()
+    assert Sine(NthPower(x, n = 1))._normalize(statistics) == Sine(x)
+    assert statistics.visits == 0
+    assert normalization_cache_info().hits == 2 # its reduced and normalized forms
+
+
+def test_leaves_are_not_cached():
+    Add(Variable("x"), Constant(2))._normalize()
+    assert normalization_cache_info().currsize == 2 # reduced and normalized forms of the Add
+
+
+def test_differential_reuses_normalized_partials():
+    x = Variable("x")
+    y = Variable("y")
+    z = Multiply(Sine(x * y), Exponential(x * y))
+    differential = Differential(z, compute_early = True)
+    assert normalization_cache_info().hits > 0
+    hits = normalization_cache_info().hits
+    misses = normalization_cache_info().misses
+    assert Differential(z, compute_early = True).component_at("x", Point(x = 1, y = 2)) == \
+        differential.component_at("x", Point(x = 1, y = 2))
+    assert normalization_cache_info().misses == misses # all found in the cache
+    assert normalization_cache_info().hits > hits
+
+
+def test_cache_is_bounded():
+    set_normalization_cache_size(5)
+    x = Variable("x")
+    for i in range(20):
+        Sine(x + Constant(i))._normalize()
+    assert normalization_cache_info().currsize == 5
+
+
+def test_disabling_the_cache():
+    set_normalization_cache_size(0)
+    x = Variable("x")
+    Sine(NthPower(x, n = 1))._normalize()
+    statistics = ReductionStatistics()
+    Sine(NthPower(x, n = 1))._normalize(statistics)
+    assert statistics.visits == 2
+    assert normalization_cache_info().hits == 0
+    assert nc.lookup(nc.REDUCED, Sine(x)) is None
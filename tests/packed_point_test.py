@@ -0,0 +1,92 @@
+import pickle
+from array import array
+from pytest import approx, raises, importorskip
+from smoothmath import CoordinateMissing, DomainError, Point, VariableLayout, PackedPoint, PackedPoints
+from smoothmath.expression import Variable, Logarithm
+
+
+def test_VariableLayout():
+    layout = VariableLayout(["y", "x"])
+    assert layout.names == ("y", "x")
+    assert len(layout) == 2
+    assert layout.index_of("y") == 0
+    assert layout.index_of(Variable("x")) == 1
+    with raises(CoordinateMissing):
+        layout.index_of("z")
+    assert layout == VariableLayout(("y", "x"))
+    assert layout != VariableLayout(["x", "y"])
+    with raises(Exception):
+        VariableLayout(["x", "x"])
+
+
+def test_PackedPoint():
+    layout = VariableLayout(["x", "y"])
+    point = PackedPoint(layout, array("d", [3, 4.5]))
+    assert point.coordinate("x") == 3
+    assert point.coordinate(Variable("y")) == 4.5
+    assert point.coordinate_names() == ["x", "y"]
+    with raises(CoordinateMissing):
+        point.coordinate("z")
+    assert point.to_point() == Point(x = 3.0, y = 4.5)
+    assert layout.pack(Point(x = 3, y = 4.5, z = 7)) == point
+    assert point != Point(x = 3.0, y = 4.5)
+    with raises(Exception):
+        PackedPoint(layout, array("d", [1]))
+
+
+def test_PackedPoint_evaluation():
+    x = Variable("x")
+    y = Variable("y")
+    z = x ** 2 + Logarithm(y)
+    layout = VariableLayout(["y", "x"])
+    point = PackedPoint(layout, array("d", [1, 3]))
+    assert z.at(point) == approx(9)
+    assert z.compile().at(point) == approx(9)
+    assert z.at(point) == z.at(point.to_point())
+    with raises(DomainError):
+        z.at(PackedPoint(layout, array("d", [-1, 3])))
+    with raises(CoordinateMissing):
+        z.at(PackedPoint(VariableLayout(["x"]), array("d", [3])))
+
+
+def test_PackedPoints():
+    layout = VariableLayout(["x", "y"])
+    buffer = array("d", [1, 2, 3, 4, 5, 6])
+    points = PackedPoints(layout, buffer)
+    assert len(points) == 3
+    assert points[0] == PackedPoint(layout, array("d", [1, 2]))
+    assert points[-1].to_point() == Point(x = 5.0, y = 6.0)
+    with raises(IndexError):
+        points[3]
+    z = Variable("x") * Variable("y")
+    assert [z.at(point) for point in points] == [2, 12, 30]
+    # The points are views of the buffer, not copies.
+    buffer[0] = 10
+    assert points[0].coordinate("x") == 10
+    with raises(Exception):
+        PackedPoints(layout, array("d", [1, 2, 3]))
+
+
+def test_PackedPoints_from_points():
+    layout = VariableLayout(["x", "y"])
+    points = layout.pack_many([Point(x = 1, y = 2), Point(x = 3, y = 4)])
+    assert len(points) == 2
+    assert points[1].to_point() == Point(x = 3.0, y = 4.0)
+    assert list(PackedPoints(layout, [1, 2, 3, 4])) == list(points)
+
+
+def test_PackedPoints_from_numpy():
+    np = importorskip("numpy")
+    layout = VariableLayout(["x", "y"])
+    rows = np.array([[1.0, 2.0], [3.0, 4.0]])
+    points = PackedPoints(layout, rows)
+    assert points[1].to_point() == Point(x = 3.0, y = 4.0)
+    rows[1, 0] = 7.0
+    assert points[1].coordinate("x") == 7.0
+
+
+def test_pickling_packed_points():
+    layout = VariableLayout(["x", "y"])
+    points = PackedPoints(layout, array("d", [1, 2, 3, 4]))
+    assert list(pickle.loads(pickle.dumps(points))) == list(points)
+    assert pickle.loads(pickle.dumps(points[1])) == points[1]
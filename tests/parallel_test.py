@@ -0,0 +1,94 @@
+import pickle
+from pytest import approx, raises, importorskip
+from smoothmath import DomainError, Point, Partial, Differential, LocatedDifferential
+from smoothmath.expression import Variable, Constant, Add, Logarithm, Sine
+from smoothmath._private.parallel import evaluate_many, _split
+
+
+def test_split():
+    chunks = _split(list(range(10)), 4)
+    assert chunks == [[0, 1, 2], [3, 4, 5], [6, 7, 8], [9]]
+    assert _split(list(range(3)), 8) == [[0], [1], [2]]
+
+
+def test_evaluate_many():
+    x = Variable("x")
+    y = Variable("y")
+    z = Sine(x) * y + Logarithm(y)
+    points = [Point(x = i / 10, y = 1 + i) for i in range(50)]
+    expected = [z.at(point) for point in points]
+    assert evaluate_many(z.at, points, workers = 1) == expected
+    assert evaluate_many(z.at, points, workers = 2) == expected
+    assert evaluate_many(z.at, [], workers = 2) == []
+    with raises(Exception):
+        evaluate_many(z.at, points, workers = 0)
+
+
+def test_Expression_at_many():
+    x = Variable("x")
+    y = Variable("y")
+    z = Sine(x) * y + Logarithm(y)
+    points = [Point(x = i / 10, y = 1 + i) for i in range(50)]
+    values = z.at_many(points, workers = 2)
+    assert values == [approx(z.at(point)) for point in points]
+
+
+def test_Expression_at_many_with_deep_expression():
+    x = Variable("x")
+    z = Constant(0)
+    for i in range(5000):
+        z = Add(z, x * Constant(i % 7))
+    points = [Point(x = i / 10) for i in range(8)]
+    # Workers started by spawning rather than forking receive the expression pickled.
+    assert pickle.loads(pickle.dumps(z.at))(points[3]) == approx(z.at(points[3]))
+    assert z.at_many(points, workers = 2) == [approx(z.at(point)) for point in points]
+    assert Partial(z, "x").at_many(points, workers = 2) == [approx(sum(i % 7 for i in range(5000)))] * 8
+
+
+def test_Expression_at_many_raises():
+    x = Variable("x")
+    y = Variable("y")
+    z = Sine(x) * y + Logarithm(y)
+    points = [Point(x = i / 10, y = 1 + i) for i in range(50)] + [Point(x = 0, y = -1)]
+    with raises(DomainError):
+        z.at_many(points, workers = 2)
+
+
+def test_Partial_at_many():
+    x = Variable("x")
+    y = Variable("y")
+    z = Sine(x) * y + Logarithm(y)
+    points = [Point(x = i / 10, y = 1 + i) for i in range(50)]
+    for compute_early in (False, True):
+        partial = Partial(z, "x", compute_early = compute_early)
+        assert partial.at_many(points, workers = 2) == [approx(partial.at(point)) for point in points]
+
+
+def test_Differential_at_many():
+    x = Variable("x")
+    y = Variable("y")
+    z = Sine(x) * y + Logarithm(y)
+    points = [Point(x = i / 10, y = 1 + i) for i in range(50)]
+    for compute_early in (False, True):
+        differential = Differential(z, compute_early = compute_early)
+        located_differentials = differential.at_many(points, workers = 2)
+        assert len(located_differentials) == len(points)
+        for located, point in zip(located_differentials, points):
+            assert isinstance(located, LocatedDifferential)
+            assert located == LocatedDifferential(z, point)
+            assert located.component("x") == approx(differential.component_at("x", point))
+            assert located.component("y") == approx(differential.component_at("y", point))
+
+
+def test_at_many_columnar():
+    np = importorskip("numpy")
+    x = Variable("x")
+    y = Variable("y")
+    z = Sine(x) * y + Logarithm(y)
+    points = [Point(x = i / 10, y = 1 + i) for i in range(50)]
+    values = z.at_many(points, workers = 2, columnar = True)
+    assert isinstance(values, np.ndarray)
+    assert values.tolist() == [approx(z.at(point)) for point in points]
+    columns = Differential(z).at_many(points, workers = 2, columnar = True)
+    assert list(columns) == ["x", "y"]
+    assert columns["y"].tolist() == [approx(Partial(z, "y").at(point)) for point in points]
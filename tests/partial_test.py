@@ -1,6 +1,7 @@
 from pytest import approx, raises
 from smoothmath import DomainError, Point, Partial
 from smoothmath.expression import Variable, Constant, Multiply, Logarithm
+from smoothmath._private.tape import Tape
 
 
 # Note: numeric and synthetic partial testing is done in the tests for concrete expressions
@@ -35,6 +36,21 @@ def test_Partial_at_raises():
         early_partial.at(Point(x = -1))
 
 
+def test_Partial_takes_one_forward_sweep(monkeypatch):
+    x = Variable("x")
+    y = Variable("y")
+    z = Logarithm(x * y) + Constant(3) * y
+    def backward_sweep(*arguments):
+        raise AssertionError("took the backward sweep")
+    monkeypatch.setattr(Tape, "_backward_sweep", backward_sweep)
+    point = Point(x = 2, y = 5)
+    assert Partial(z, x).at(point) == approx(0.5)
+    assert Partial(z, y).at(point) == approx(3.2)
+    assert Partial(z, "w").at(point) == 0
+    with raises(DomainError):
+        Partial(z, "w").at(Point(x = -1, y = 1))
+
+
 def test_Partial_equality():
     x = Variable("x")
     y = Variable("y")
@@ -0,0 +1,99 @@
+from pytest import approx, raises, importorskip
+from array import array
+from smoothmath import (
+    DomainError, CoordinateMissing, Point, PointBatch, VariableLayout,
+    Derivative, Differential, Partial
+)
+from smoothmath.expression import Variable, Logarithm, Sine
+np = importorskip("numpy")
+
+
+def test_PointBatch():
+    x_column = np.array([1.0, 2.0, 3.0])
+    y_column = array("d", [4, 5, 6])
+    batch = PointBatch(x = x_column, y = y_column, z = memoryview(array("d", [7, 8, 9])))
+    assert len(batch) == 3
+    assert list(batch.coordinate(Variable("z"))) == [7, 8, 9]
+    assert batch.point(1) == Point(x = 2.0, y = 5.0, z = 8.0)
+    with raises(CoordinateMissing):
+        batch.coordinate("w")
+    # The columns are not copied.
+    assert np.shares_memory(batch.coordinate("x"), x_column)
+    y_column[0] = 40
+    assert batch.coordinate("y")[0] == 40
+
+
+def test_PointBatch_with_mismatched_columns():
+    with raises(Exception):
+        PointBatch(x = [1, 2, 3], y = [4, 5])
+
+
+def test_PointBatch_from_points():
+    batch = PointBatch.from_points([Point(x = 1, y = 2), Point(x = 3, y = 4)])
+    assert list(batch.coordinate("x")) == [1, 3]
+    assert list(batch.coordinate("y")) == [2, 4]
+    layout = VariableLayout(["x"])
+    batch = PointBatch.from_points(layout.pack_many([Point(x = 5), Point(x = 6)]))
+    assert list(batch.coordinate("x")) == [5, 6]
+    assert len(PointBatch.from_points([])) == 0
+
+
+def test_Expression_at_PointBatch():
+    x = Variable("x")
+    y = Variable("y")
+    z = Sine(x) * y + Logarithm(x)
+    batch = PointBatch(x = [0.5, 1, 2], y = [3, 4, 5])
+    results = z.at(batch)
+    assert results.shape == (3,)
+    for i in range(3):
+        assert results[i] == approx(z.at(batch.point(i)))
+    with raises(DomainError):
+        z.at(PointBatch(x = [1, -1], y = [3, 4]))
+
+
+def test_Partial_at_PointBatch():
+    x = Variable("x")
+    y = Variable("y")
+    z = Sine(x) * y + Logarithm(x)
+    batch = PointBatch(x = [0.5, 1, 2], y = [3, 4, 5])
+    for compute_early in [False, True]:
+        partial = Partial(z, x, compute_early = compute_early)
+        results = partial.at(batch)
+        for i in range(3):
+            assert results[i] == approx(partial.at(batch.point(i)))
+        with raises(DomainError):
+            partial.at(PointBatch(x = [1, -1], y = [3, 4]))
+
+
+def test_Partial_at_PointBatch_keeps_evaluating_numerically_at_points():
+    x = Variable("x")
+    y = Variable("y")
+    partial = Partial(Sine(x) * y, x)
+    partial.at(PointBatch(x = [0.5, 1], y = [3, 4]))
+    assert partial._synthetic_partial is None
+    lazy_synthetic_partial = partial._lazy_synthetic_partial
+    partial.at(PointBatch(x = [2], y = [5]))
+    assert partial._lazy_synthetic_partial is lazy_synthetic_partial
+
+
+def test_Derivative_at_PointBatch():
+    x = Variable("x")
+    derivative = Derivative(x ** 3)
+    assert list(derivative.at(PointBatch(x = [1, 2, 3]))) == [3, 12, 27]
+
+
+def test_Differential_at_PointBatch():
+    x = Variable("x")
+    y = Variable("y")
+    z = Sine(x) * y + Logarithm(x)
+    batch = PointBatch(x = [0.5, 1, 2], y = [3, 4, 5])
+    for compute_early in [False, True]:
+        differential = Differential(z, compute_early = compute_early)
+        results = differential.at(batch)
+        assert list(results.keys()) == ["x", "y"]
+        for i in range(3):
+            located = differential.at(batch.point(i))
+            assert results["x"][i] == approx(located.component(x))
+            assert results["y"][i] == approx(located.component(y))
+        with raises(DomainError):
+            differential.at(PointBatch(x = [1, -1], y = [3, 4]))
@@ -17,6 +17,7 @@ def test_Point():
     assert point.coordinate(y) == 6
     assert point.coordinate("x") == 5
     assert point.coordinate("y") == 6
+    assert point.coordinate_names() == ["x", "y"]
 
 
 def test_Point_when_missing_a_variable():
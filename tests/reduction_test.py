@@ -0,0 +1,82 @@
+import logging
+import pytest
+import smoothmath._private.reduction as rd
+from smoothmath.expression import Variable, Add, Multiply, Negation, NthPower, Sine
+from smoothmath import clear_normalization_cache
+from smoothmath._private.reduction import fully_reduce, ReductionStatistics
+
+
+@pytest.fixture(autouse = True)
+def empty_normalization_cache():
+    # These tests count reduction work, so they must not find earlier results cached.
+    clear_normalization_cache()
+
+
+def test_fully_reduce():
+    x = Variable("x")
+    z = Negation(Negation(NthPower(x, n = 1)))
+    statistics = ReductionStatistics()
+    assert fully_reduce(z, statistics) == x
+    assert statistics.steps == 2 # NthPower(x, n=1) => x, then Negation(Negation(x)) => x
+    assert statistics.rebuilds == 2 # both Negations, once their inner expressions changed
+    assert statistics.visits == 4
+
+
+def test_fully_reduce_rebuilds_changed_expressions_only():
+    x = Variable("x")
+    y = Variable("y")
+    unchanged = Sine(y)
+    z = Multiply(Sine(Negation(Negation(x))), unchanged)
+    statistics = ReductionStatistics()
+    reduced = fully_reduce(z, statistics)
+    assert reduced == Multiply(Sine(x), Sine(y))
+    assert reduced._subexpressions()[1] is unchanged
+    assert statistics.steps == 1
+    assert statistics.rebuilds == 2 # Sine(...) and the Multiply
+
+
+def test_fully_reduce_already_reduced():
+    z = Sine(Variable("x"))
+    fully_reduce(z)
+    statistics = ReductionStatistics()
+    assert fully_reduce(z, statistics) is z
+    assert statistics.visits == 0
+
+
+def test_fully_reduce_shared_subexpressions_once():
+    x = Variable("x")
+    shared = Sine(NthPower(x, n = 1))
+    statistics = ReductionStatistics()
+    assert fully_reduce(Add(shared, Sine(shared)), statistics) == Add(Sine(x), Sine(Sine(x)))
+    assert statistics.steps == 1
+
+
+def test_fully_reduce_deep_expression():
+    z = Variable("x")
+    for _ in range(3000):
+        z = Sine(NthPower(z, n = 1))
+    statistics = ReductionStatistics()
+    reduced = fully_reduce(z, statistics)
+    assert statistics.steps == 3000
+    expected = Variable("x")
+    for _ in range(3000):
+        expected = Sine(expected)
+    assert reduced == expected
+
+
+def test_fully_reduce_gives_up_with_a_warning(monkeypatch, caplog):
+    monkeypatch.setattr(rd, "REDUCTION_STEPS_PER_NODE_BOUND", 0)
+    z = NthPower(Variable("x"), n = 1)
+    with caplog.at_level(logging.WARNING):
+        assert fully_reduce(z) == z
+    assert "Unable to fully reduce" in caplog.text
+
+
+def test_fully_reduce_bounds_the_steps_of_each_call(caplog):
+    x = Variable("x")
+    statistics = ReductionStatistics()
+    statistics.steps = 1000000 # as if left over from earlier calls
+    with caplog.at_level(logging.WARNING):
+        assert fully_reduce(Negation(Negation(x)), statistics) == x
+    assert "Unable to fully reduce" not in caplog.text
+    assert statistics.steps == 1000001
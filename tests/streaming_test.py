@@ -0,0 +1,77 @@
+from pytest import approx, raises, importorskip
+from smoothmath import DomainError, CoordinateMissing, Point, VariableLayout, Differential, Partial
+from smoothmath.expression import Variable, Logarithm, Sine
+from smoothmath._private.streaming import batches_of
+np = importorskip("numpy")
+
+
+def counting_points(count, pulled):
+    for n in range(count):
+        pulled.append(n)
+        yield Point(x = 1 + n, y = 2 * n)
+
+
+def test_batches_of_consumes_lazily():
+    pulled = []
+    batches = batches_of(counting_points(10, pulled), 4)
+    assert pulled == []
+    batch = next(batches)
+    assert len(batch) == 4
+    assert len(pulled) == 4
+    assert [len(batch) for batch in batches] == [4, 2]
+    assert list(batches_of([], 4)) == []
+    with raises(Exception):
+        list(batches_of([Point(x = 1)], 0))
+
+
+def test_Expression_stream():
+    x = Variable("x")
+    y = Variable("y")
+    z = Sine(x) * y + Logarithm(x)
+    chunks = list(z.stream(counting_points(10, []), chunk_size = 3))
+    assert [len(chunk) for chunk in chunks] == [3, 3, 3, 1]
+    values = np.concatenate(chunks)
+    for n, value in enumerate(values):
+        assert value == approx(z.at(Point(x = 1 + n, y = 2 * n)))
+
+
+def test_Expression_stream_of_packed_points():
+    x = Variable("x")
+    layout = VariableLayout(["x"])
+    points = layout.pack_many([Point(x = n) for n in range(5)])
+    assert list(np.concatenate(list((x * x).stream(points, chunk_size = 2)))) == [0, 1, 4, 9, 16]
+
+
+def test_Expression_stream_raises():
+    x = Variable("x")
+    stream = Logarithm(x).stream((Point(x = n) for n in [1, 2, -3, 4]), chunk_size = 2)
+    assert list(next(stream)) == approx([0, 0.693147])
+    with raises(DomainError):
+        next(stream)
+    stream = x.stream([Point(x = 1), Point(y = 2)], chunk_size = 1)
+    next(stream)
+    with raises(CoordinateMissing):
+        next(stream)
+
+
+def test_Partial_stream():
+    x = Variable("x")
+    y = Variable("y")
+    partial = Partial(Sine(x) * y, x)
+    values = np.concatenate(list(partial.stream(counting_points(5, []), chunk_size = 2)))
+    for n, value in enumerate(values):
+        assert value == approx(partial.at(Point(x = 1 + n, y = 2 * n)))
+
+
+def test_Differential_stream():
+    x = Variable("x")
+    y = Variable("y")
+    differential = Differential(Sine(x) * y)
+    chunks = list(differential.stream(counting_points(5, []), chunk_size = 2))
+    assert len(chunks) == 3
+    xs = np.concatenate([chunk["x"] for chunk in chunks])
+    ys = np.concatenate([chunk["y"] for chunk in chunks])
+    for n in range(5):
+        located = differential.at(Point(x = 1 + n, y = 2 * n))
+        assert xs[n] == approx(located.component(x))
+        assert ys[n] == approx(located.component(y))
@@ -0,0 +1,85 @@
+from pytest import approx, raises
+from smoothmath import DomainError, CoordinateMissing, Point, Partial
+from smoothmath.expression import (
+    Variable, Constant, Add, Multiply, Divide, Power, NthRoot, Exponential, Logarithm, Sine
+)
+from smoothmath._private.tape import Tape
+
+
+def test_Tape():
+    x = Variable("x")
+    y = Variable("y")
+    z = Multiply(x, Sine(y)) + Power(x, y) / NthRoot(y, n = 3) - Logarithm(x, base = 2)
+    point = Point(x = 2, y = 3)
+    value, numeric_partials = Tape(z).value_and_numeric_partials(point)
+    assert value == approx(z.at(point))
+    assert numeric_partials["x"] == approx(Partial(z, "x", compute_early = True).at(point))
+    assert numeric_partials["y"] == approx(Partial(z, "y", compute_early = True).at(point))
+
+
+def test_Tape_with_shared_subexpressions():
+    x = Variable("x")
+    w = x ** 2
+    z = (w + Constant(1)) / w
+    value, numeric_partials = Tape(z).value_and_numeric_partials(Point(x = 2))
+    assert value == approx(1.25)
+    assert numeric_partials == {"x": approx(-0.25)}
+
+
+def test_Tape_with_unused_branch():
+    x = Variable("x")
+    y = Variable("y")
+    z = Multiply(Constant(0), Exponential(y)) + x
+    value, numeric_partials = Tape(z).value_and_numeric_partials(Point(x = 2, y = 1))
+    assert value == approx(2)
+    assert numeric_partials == {"x": approx(1), "y": approx(0)}
+
+
+def test_Tape_of_wide_expression():
+    variables = [Variable(f"x{i}") for i in range(2000)]
+    z = Add(*(Constant(i) * variable for (i, variable) in enumerate(variables)))
+    point = Point(**{variable.name: 1 for variable in variables})
+    value, numeric_partials = Tape(z).value_and_numeric_partials(point)
+    assert value == approx(sum(range(2000)))
+    assert numeric_partials["x7"] == approx(7)
+
+
+def test_Tape_raises():
+    t = Variable("t")
+    with raises(DomainError):
+        Tape(Divide(t, t)).value_and_numeric_partials(Point(t = 0))
+    with raises(DomainError):
+        Tape(Logarithm(t)).value_and_numeric_partials(Point(t = -1))
+
+
+def test_Tape_directional_derivative():
+    x = Variable("x")
+    y = Variable("y")
+    z = Multiply(x, Sine(y)) + Power(x, y) / NthRoot(y, n = 3) - Logarithm(x, base = 2)
+    point = Point(x = 2, y = 3)
+    direction = Point(x = 0.5, y = -2)
+    value, directional_derivative = Tape(z).value_and_directional_derivative(point, direction)
+    assert value == approx(z.at(point))
+    _, numeric_partials = Tape(z).value_and_numeric_partials(point)
+    assert directional_derivative == approx(0.5 * numeric_partials["x"] - 2 * numeric_partials["y"])
+
+
+def test_Tape_directional_derivative_raises():
+    t = Variable("t")
+    with raises(DomainError):
+        Tape(Logarithm(t)).value_and_directional_derivative(Point(t = -1), Point(t = 1))
+    with raises(CoordinateMissing):
+        Tape(Logarithm(t)).value_and_directional_derivative(Point(t = 1), Point(s = 1))
+
+
+def test_Tape_of_several_expressions():
+    x = Variable("x")
+    y = Variable("y")
+    shared = Sine(x * y)
+    tape = Tape(shared + x, Exponential(shared), Constant(2))
+    point = Point(x = 1, y = 2)
+    values, all_numeric_partials = tape.values_and_numeric_partials(point)
+    assert values == [approx((shared + x).at(point)), approx(Exponential(shared).at(point)), 2]
+    assert all_numeric_partials[0] == Tape(shared + x).value_and_numeric_partials(point)[1]
+    assert all_numeric_partials[1] == Tape(Exponential(shared)).value_and_numeric_partials(point)[1]
+    assert all_numeric_partials[2] == {}
@@ -0,0 +1,48 @@
+import math
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pytest import approx, fixture
+from smoothmath import Point, Partial, Differential
+from smoothmath.expression import Variable, Constant, Multiply, Exponential, Logarithm, Sine
+
+
+@fixture
+def frequent_thread_switching():
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    yield
+    sys.setswitchinterval(interval)
+
+
+def test_concurrent_evaluation(frequent_thread_switching):
+    x = Variable("x")
+    y = Variable("y")
+    w = Sine(x * y)
+    z = Multiply(w, w + Constant(1), Exponential(x)) + Logarithm(y)
+    points = [Point(x = i / 100, y = 1 + i / 50) for i in range(400)]
+    expected = []
+    for point in points:
+        sine = math.sin(point.coordinate("x") * point.coordinate("y"))
+        expected.append(sine * (sine + 1) * math.exp(point.coordinate("x")) + math.log(point.coordinate("y")))
+    with ThreadPoolExecutor(max_workers = 8) as executor:
+        for _ in range(5):
+            values = list(executor.map(z.at, points))
+            assert values == [approx(value) for value in expected]
+
+
+def test_concurrent_partials(frequent_thread_switching):
+    x = Variable("x")
+    y = Variable("y")
+    w = Sine(x * y)
+    z = Multiply(w, w + Constant(1), Exponential(x)) + Logarithm(y)
+    partial = Partial(z, "y")
+    differential = Differential(z)
+    points = [Point(x = i / 100, y = 1 + i / 50) for i in range(400)]
+    early_partial = Partial(z, "y", compute_early = True)
+    expected = [early_partial.at(point) for point in points]
+    with ThreadPoolExecutor(max_workers = 8) as executor:
+        for _ in range(5):
+            partials = list(executor.map(partial.at, points))
+            assert partials == [approx(value) for value in expected]
+            components = list(executor.map(lambda point: differential.component_at("y", point), points))
+            assert components == [approx(value) for value in expected]
@@ -0,0 +1,71 @@
+from pytest import approx
+from smoothmath import Point, Partial, Differential
+from smoothmath.expression import Variable, Constant, Add, Multiply, NthPower, Logarithm, Sine
+from smoothmath._private.traversal import RECURSION_DEPTH, fold, structurally_equal, to_string
+
+
+def _deep_sum(
+    depth
+):
+    x = Variable("x")
+    z = Constant(0)
+    for i in range(depth):
+        z = z + x * Constant(i)
+    return z
+
+
+def test_fold():
+    x = Variable("x")
+    shared = Sine(x)
+    z = Add(shared, Multiply(shared, Constant(2)))
+    visited = []
+    def combine(node, inner_results):
+        visited.append(node)
+        return 1 + sum(inner_results)
+    assert fold(z, combine) == 7
+    assert len(visited) == 5 # the shared Sine(x) is only combined once
+    assert visited[-1] is z
+
+
+def test_fold_of_deep_expression_combines_each_node_once():
+    depth = 10 * RECURSION_DEPTH
+    z = _deep_sum(depth)
+    visited = []
+    def combine(node, inner_results):
+        visited.append(node)
+        return node
+    assert fold(z, combine) is z
+    # Besides x and the first Constant(0), each level adds an Add, a Multiply and a Constant.
+    assert len(visited) == 2 + 3 * depth
+    assert len(set(map(id, visited))) == len(visited)
+
+
+def test_structurally_equal():
+    x = Variable("x")
+    y = Variable("y")
+    assert structurally_equal(Add(x, Sine(y)), Add(x, Sine(y)))
+    assert not structurally_equal(Add(x, Sine(y)), Add(x, Sine(x)))
+    assert not structurally_equal(Add(x, y), Add(x, y, Constant(0)))
+    assert not structurally_equal(NthPower(x, n = 2), NthPower(x, n = 3))
+    assert not structurally_equal(Logarithm(x, base = 2), Logarithm(x, base = 3))
+    assert not structurally_equal(x, "x")
+
+
+def test_to_string():
+    x = Variable("x")
+    assert to_string(Add()) == "Add()"
+    assert to_string(Add(x, Constant(2), Sine(x))) == "Add(Variable(\"x\"), Constant(2), Sine(Variable(\"x\")))"
+    assert to_string(NthPower(x - Constant(1), n = 3)) == "NthPower(Minus(Variable(\"x\"), Constant(1)), n=3)"
+
+
+def test_deep_expression():
+    depth = 3000
+    z = _deep_sum(depth)
+    point = Point(x = 2)
+    total = sum(range(depth))
+    assert z.at(point) == approx(2 * total)
+    assert Partial(z, "x").at(point) == approx(total)
+    assert Differential(z, compute_early = True).component_at("x", point) == approx(total)
+    assert z == _deep_sum(depth)
+    assert z != _deep_sum(depth - 1)
+    assert str(z).startswith("Add(Add(Add(")
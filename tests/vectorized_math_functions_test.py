@@ -0,0 +1,95 @@
+from pytest import raises, approx, importorskip
+import math
+from smoothmath import DomainError
+import smoothmath._private.math_functions as mf
+from smoothmath._private.vectorized_math_functions import (
+    as_column, full, broadcast,
+    add, minus, negation,
+    multiply, divide, reciprocal,
+    power, nth_power, nth_root, exponential, logarithm,
+    cosine, sine
+)
+np = importorskip("numpy")
+
+
+def test_as_column():
+    column = as_column([1, 2, 3])
+    assert column.dtype == np.float64
+    assert list(column) == [1, 2, 3]
+    with raises(Exception):
+        as_column([[1, 2], [3, 4]])
+
+
+def test_full_and_broadcast():
+    assert list(full(3, 7)) == [7, 7, 7]
+    assert list(broadcast(np.float64(2), 3)) == [2, 2, 2]
+
+
+def test_add():
+    assert list(add(as_column([1, 2]), as_column([3, 4]), as_column([5, 6]))) == [9, 12]
+    assert add() == 0
+
+
+def test_minus_and_negation():
+    assert list(minus(as_column([5, 2]), as_column([2, 5]))) == [3, -3]
+    assert list(negation(as_column([5, -5, 0]))) == [-5, 5, 0]
+
+
+def test_multiply():
+    x = as_column([4, 0, math.inf])
+    y = as_column([5, math.inf, 0])
+    assert list(multiply(x, y)) == [20, 0, 0]
+    assert multiply() == 1
+
+
+def test_divide():
+    assert list(divide(as_column([6, 0]), as_column([3, 2]))) == [2, 0]
+
+
+def test_reciprocal():
+    assert list(reciprocal(as_column([2, -5]))) == [0.5, -0.2]
+
+
+def test_power():
+    assert list(power(as_column([2, 4]), as_column([3, 0.5]))) == [8, 2]
+
+
+def test_nth_power():
+    assert list(nth_power(as_column([2, -3]), 3)) == [8, -27]
+    with raises(DomainError):
+        nth_power(as_column([2]), 0)
+
+
+def test_nth_root():
+    xs = [-32, -8, 0.5, 27, 64]
+    for n in [1, 3, 5]:
+        expected = [mf.nth_root(x, n) for x in xs]
+        assert list(nth_root(as_column(xs), n)) == approx(expected)
+    positives = [0.5, 27, 64]
+    for n in [2, 4]:
+        expected = [mf.nth_root(x, n) for x in positives]
+        assert list(nth_root(as_column(positives), n)) == approx(expected)
+    with raises(DomainError):
+        nth_root(as_column(xs), 0)
+
+
+def test_exponential():
+    xs = [-1, 0, 2.5]
+    assert list(exponential(as_column(xs))) == approx([math.exp(x) for x in xs])
+    assert list(exponential(as_column(xs), base = 2)) == approx([2 ** x for x in xs])
+    with raises(DomainError):
+        exponential(as_column(xs), base = 0)
+
+
+def test_logarithm():
+    xs = [0.5, 1, 64]
+    assert list(logarithm(as_column(xs))) == approx([math.log(x) for x in xs])
+    assert list(logarithm(as_column(xs), base = 2)) == approx([math.log2(x) for x in xs])
+    with raises(DomainError):
+        logarithm(as_column(xs), base = 1)
+
+
+def test_cosine_and_sine():
+    xs = [0, math.pi / 2, 1]
+    assert list(cosine(as_column(xs))) == approx([math.cos(x) for x in xs])
+    assert list(sine(as_column(xs))) == approx([math.sin(x) for x in xs])